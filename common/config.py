@@ -190,7 +190,8 @@ class ConfigLoader:
             'password': self.get('postgresql', 'password'),
             'schema': self.get('postgresql', 'schema', fallback='noggin_schema'),
             'minconn': self.getint('postgresql', 'pool_min_connections', fallback=2),
-            'maxconn': self.getint('postgresql', 'pool_max_connections', fallback=10)
+            'maxconn': self.getint('postgresql', 'pool_max_connections', fallback=10),
+            'pool_wait_seconds': self.getfloat('postgresql', 'pool_wait_seconds', fallback=300)
         }
     
     def get_api_headers(self) -> dict[str, str]:
@@ -28,14 +28,18 @@ Usage:
 
 from __future__ import annotations
 import csv
+import os
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from configparser import ConfigParser
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Sequence
 
+from .database import NEW_TIP_CHANNEL
 from .object_types import (
     ObjectTypeConfig,
     detect_object_type_from_headers,
@@ -45,6 +49,9 @@ from .object_types import (
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement; PostgreSQL bulk insert throughput levels off around here
+MAX_INSERT_PAGE_SIZE: int = 10_000
+
 
 class CSVImportError(Exception):
     """Raised when CSV import operations fail"""
@@ -110,6 +117,8 @@ class HashResolver:
     Resolves hash values to human-readable text using the hash_lookup table.
 
     Caches lookups to minimise database queries during batch imports.
+    Shared by the import worker threads, so the cache and its counters are
+    guarded by a lock (the database lookup itself runs outside it).
     """
 
     HASH_PATTERN = re.compile(r'^[a-fA-F0-9]{64}$')
@@ -119,6 +128,7 @@ class HashResolver:
         self._cache: Dict[str, Optional[str]] = {}
         self._cache_hits: int = 0
         self._cache_misses: int = 0
+        self._lock: threading.Lock = threading.Lock()
 
     def is_hash(self, value: str) -> bool:
         """Check if a value appears to be a 64-character hash"""
@@ -133,11 +143,11 @@ class HashResolver:
 
         hash_value = hash_value.strip()
 
-        if hash_value in self._cache:
-            self._cache_hits += 1
-            return self._cache[hash_value]
-
-        self._cache_misses += 1
+        with self._lock:
+            if hash_value in self._cache:
+                self._cache_hits += 1
+                return self._cache[hash_value]
+            self._cache_misses += 1
 
         try:
             rows = self.db_manager.execute_query_dict(
@@ -145,13 +155,10 @@ class HashResolver:
                 (hash_value,)
             )
 
-            if rows:
-                resolved = rows[0]['resolved_value']
+            resolved: Optional[str] = rows[0]['resolved_value'] if rows else None
+            with self._lock:
                 self._cache[hash_value] = resolved
-                return resolved
-            else:
-                self._cache[hash_value] = None
-                return None
+            return resolved
 
         except Exception as e:
             logger.error(f"Hash lookup DB error for {hash_value[:16]}...: {e}")
@@ -179,17 +186,19 @@ class HashResolver:
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Return cache statistics"""
-        return {
-            'cache_size': len(self._cache),
-            'cache_hits': self._cache_hits,
-            'cache_misses': self._cache_misses
-        }
+        with self._lock:
+            return {
+                'cache_size': len(self._cache),
+                'cache_hits': self._cache_hits,
+                'cache_misses': self._cache_misses
+            }
 
     def clear_cache(self) -> None:
         """Clear the resolution cache"""
-        self._cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
 
 
 class PreviewFieldConfigLoader:
@@ -375,7 +384,9 @@ class BatchInserter:
     """
     Handles batch insertion of records into the database.
 
-    Uses INSERT ... ON CONFLICT DO NOTHING to efficiently skip duplicates.
+    Uses multi-row INSERT ... ON CONFLICT DO NOTHING (execute_values) to
+    efficiently skip duplicates; rows the conflict skipped are the duplicates,
+    so no existence check is needed first.
     """
 
     def __init__(self, db_manager: 'DatabaseConnectionManager', batch_size: int = 100) -> None:
@@ -384,6 +395,7 @@ class BatchInserter:
         self._pending: List[Dict[str, Any]] = []
         self._inserted_count: int = 0
         self._duplicate_count: int = 0
+        self._failed_count: int = 0
 
     def add(self, record: Dict[str, Any]) -> None:
         """Add a record to the batch"""
@@ -398,43 +410,23 @@ class BatchInserter:
         if not self._pending:
             return (0, 0)
 
-        batch_inserted = 0
-        batch_duplicates = 0
-
-        tips = [r['tip'] for r in self._pending]
-        existing_tips = self._get_existing_tips(tips)
-
-        new_records = [r for r in self._pending if r['tip'] not in existing_tips]
-        batch_duplicates = len(self._pending) - len(new_records)
+        batch_inserted, batch_failed = self._insert_batch(self._pending)
 
-        if new_records:
-            batch_inserted = self._insert_batch(new_records)
+        # ON CONFLICT (tip) DO NOTHING only counts the rows it inserted; the
+        # rest are duplicates, apart from rows that failed and were skipped
+        batch_duplicates = len(self._pending) - batch_inserted - batch_failed
 
+        self._failed_count += batch_failed
         self._inserted_count += batch_inserted
         self._duplicate_count += batch_duplicates
         self._pending.clear()
 
         return (batch_inserted, batch_duplicates)
 
-    def _get_existing_tips(self, tips: List[str]) -> set:
-        """Check which TIPs already exist in database"""
-        if not tips:
-            return set()
-
-        placeholders = ','.join(['%s'] * len(tips))
-        query = f"SELECT tip FROM noggin_data WHERE tip IN ({placeholders})"
-
-        try:
-            rows = self.db_manager.execute_query_dict(query, tuple(tips))
-            return {row['tip'] for row in rows}
-        except Exception as e:
-            logger.error(f"Error checking existing TIPs: {e}")
-            return set()
-
-    def _insert_batch(self, records: List[Dict[str, Any]]) -> int:
-        """Insert a batch of records"""
+    def _insert_batch(self, records: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Insert a batch of records; returns (inserted, failed) row counts"""
         if not records:
-            return 0
+            return 0, 0
 
         current_time = datetime.now()
 
@@ -450,17 +442,14 @@ class BatchInserter:
             'expected_inspection_date'
         ]
 
-        placeholders = ', '.join(['%s'] * len(columns))
-
         insert_sql = f"""
             INSERT INTO noggin_data ({', '.join(columns)})
-            VALUES ({placeholders})
+            VALUES %s
             ON CONFLICT (tip) DO NOTHING
         """
 
-        inserted = 0
-        for record in records:
-            values = (
+        values = [
+            (
                 record.get('tip'),
                 record.get('object_type'),
                 'csv_imported',
@@ -471,21 +460,28 @@ class BatchInserter:
                 record.get('expected_inspection_id'),
                 record.get('expected_inspection_date')
             )
+            for record in records
+        ]
 
-            try:
-                result = self.db_manager.execute_update(insert_sql, values)
-                if result > 0:
-                    inserted += 1
-            except Exception as e:
-                logger.error(f"Insert failed for TIP {record.get('tip', 'unknown')[:16]}...: {e}")
-
-        return inserted
+        # One statement per page in a single transaction; a failing page is
+        # retried row by row so only the bad rows are skipped (and counted as failed)
+        skipped: List[Sequence[Any]] = []
+        try:
+            inserted = self.db_manager.execute_values_batch(
+                insert_sql, values, page_size=min(len(values), MAX_INSERT_PAGE_SIZE),
+                skipped=skipped
+            )
+        except Exception as e:
+            logger.error(f"Batch insert of {len(values)} TIPs failed: {e}")
+            return 0, len(values)
+        return inserted, len(skipped)
 
     def get_stats(self) -> Dict[str, int]:
         """Get insertion statistics"""
         return {
             'inserted': self._inserted_count,
             'duplicates': self._duplicate_count,
+            'failed': self._failed_count,
             'pending': len(self._pending)
         }
 
@@ -503,10 +499,13 @@ class BatchUpdater:
         self.db_manager = db_manager
         self.batch_size = batch_size
         self._pending: List[Dict[str, Any]] = []
+        # New TIPs go through the same multi-row insert as a normal import
+        self._inserter = BatchInserter(db_manager, batch_size)
         self._updated_count: int = 0
         self._inserted_count: int = 0
         self._skipped_complete: int = 0
         self._skipped_no_change: int = 0
+        self._failed_count: int = 0
 
     def add(self, record: Dict[str, Any]) -> None:
         """Add a record to the batch"""
@@ -525,38 +524,44 @@ class BatchUpdater:
         existing_records = self._get_existing_records(tips)
         # {tip: {processing_status, expected_inspection_id, expected_inspection_date}}
         existing_map = {r['tip']: r for r in existing_records}
-        existing_tips = set(existing_map.keys())
+
+        new_records: List[Dict[str, Any]] = []
+        updates: List[Tuple[str, Optional[str], Optional[Any]]] = []
 
         for record in self._pending:
             tip = record['tip']
+            db_record = existing_map.get(tip)
 
-            if tip not in existing_tips:
+            if db_record is None:
                 # TIP not in database - insert as new
-                self._insert_new_record(record)
+                new_records.append(record)
                 continue
 
-            db_record = existing_map[tip]
-
             if db_record['processing_status'] == 'complete':
                 self._skipped_complete += 1
                 continue
 
-            # Determine which fields need updating (only if DB value is NULL)
-            updates = {}
+            # Only fill fields where the DB value is NULL
             csv_id = record.get('expected_inspection_id')
             csv_date = record.get('expected_inspection_date')
+            new_id = csv_id if csv_id and db_record['expected_inspection_id'] is None else None
+            new_date = csv_date if csv_date and db_record['expected_inspection_date'] is None else None
 
-            if csv_id and db_record['expected_inspection_id'] is None:
-                updates['expected_inspection_id'] = csv_id
-
-            if csv_date and db_record['expected_inspection_date'] is None:
-                updates['expected_inspection_date'] = csv_date
-
-            if not updates:
+            if new_id is None and new_date is None:
                 self._skipped_no_change += 1
                 continue
 
-            self._update_record(tip, updates)
+            updates.append((tip, new_id, new_date))
+
+        if new_records:
+            inserted, failed = self._inserter._insert_batch(new_records)
+            self._inserted_count += inserted
+            self._failed_count += failed
+            if inserted:
+                logger.info(f"Inserted {inserted} new TIPs during update")
+
+        if updates:
+            self._update_records(updates)
 
         self._pending.clear()
 
@@ -565,90 +570,50 @@ class BatchUpdater:
         if not tips:
             return []
 
-        placeholders = ','.join(['%s'] * len(tips))
-        query = f"""
+        query = """
             SELECT tip, processing_status, expected_inspection_id, expected_inspection_date
             FROM noggin_data
-            WHERE tip IN ({placeholders})
+            WHERE tip = ANY(%s)
         """
 
         try:
-            return self.db_manager.execute_query_dict(query, tuple(tips))
+            return self.db_manager.execute_query_dict(query, (tips,))
         except Exception as e:
             logger.error(f"Error fetching existing records: {e}")
             return []
 
-    def _insert_new_record(self, record: Dict[str, Any]) -> None:
-        """Insert a new record that doesn't exist in the database"""
-        current_time = datetime.now()
-
-        columns = [
-            'tip',
-            'object_type',
-            'processing_status',
-            'csv_imported_at',
-            'created_at',
-            'updated_at',
-            'source_filename',
-            'expected_inspection_id',
-            'expected_inspection_date'
-        ]
-
-        placeholders = ', '.join(['%s'] * len(columns))
-
-        insert_sql = f"""
-            INSERT INTO noggin_data ({', '.join(columns)})
-            VALUES ({placeholders})
-            ON CONFLICT (tip) DO NOTHING
+    def _update_records(self, updates: List[Tuple[str, Optional[str], Optional[Any]]]) -> None:
         """
+        Fill missing expected_inspection_id/date for a batch of TIPs in one statement
 
-        values = (
-            record.get('tip'),
-            record.get('object_type'),
-            'csv_imported',
-            current_time,
-            current_time,
-            current_time,
-            record.get('source_filename'),
-            record.get('expected_inspection_id'),
-            record.get('expected_inspection_date')
-        )
-
-        try:
-            result = self.db_manager.execute_update(insert_sql, values)
-            if result > 0:
-                self._inserted_count += 1
-                logger.info(f"Inserted new TIP during update: {record['tip'][:16]}...")
-        except Exception as e:
-            logger.error(f"Insert failed for new TIP {record.get('tip', 'unknown')[:16]}...: {e}")
-
-    def _update_record(self, tip: str, updates: Dict[str, Any]) -> None:
-        """Update a single record with the specified fields"""
-        set_clauses = []
-        values = []
-
-        for col, val in updates.items():
-            set_clauses.append(f"{col} = %s")
-            values.append(val)
-
-        set_clauses.append("updated_at = %s")
-        values.append(datetime.now())
-        values.append(tip)
-
-        update_sql = f"""
-            UPDATE noggin_data
-            SET {', '.join(set_clauses)}
-            WHERE tip = %s
+        Args:
+            updates: (tip, expected_inspection_id, expected_inspection_date) tuples;
+                None leaves the column as it is
+        """
+        # COALESCE keeps any value written since the batch was read, matching
+        # the "only where NULL" rule; the casts type all-NULL columns
+        update_sql = """
+            UPDATE noggin_data AS d
+            SET expected_inspection_id = COALESCE(d.expected_inspection_id, v.expected_inspection_id),
+                expected_inspection_date = COALESCE(d.expected_inspection_date, v.expected_inspection_date),
+                updated_at = CURRENT_TIMESTAMP
+            FROM (VALUES %s) AS v (tip, expected_inspection_id, expected_inspection_date)
+            WHERE d.tip = v.tip
         """
 
+        skipped: List[Sequence[Any]] = []
         try:
-            result = self.db_manager.execute_update(update_sql, tuple(values))
-            if result > 0:
-                self._updated_count += 1
-                fields_updated = ', '.join(updates.keys())
-                logger.debug(f"Updated {tip[:16]}...: {fields_updated}")
+            self._updated_count += self.db_manager.execute_values_batch(
+                update_sql, updates,
+                page_size=min(len(updates), MAX_INSERT_PAGE_SIZE),
+                template='(%s, %s::varchar, %s::date)',
+                skipped=skipped
+            )
+            self._failed_count += len(skipped)
+            logger.debug(f"Filled missing fields for {len(updates)} TIPs")
         except Exception as e:
-            logger.error(f"Update failed for TIP {tip[:16]}...: {e}")
+            logger.error(f"Batch update of {len(updates)} TIPs failed: {e}")
+            self._failed_count += len(updates)
 
     def get_stats(self) -> Dict[str, int]:
         """Get update statistics"""
@@ -657,6 +622,7 @@ class BatchUpdater:
             'inserted': self._inserted_count,
             'skipped_complete': self._skipped_complete,
             'skipped_no_change': self._skipped_no_change,
+            'failed': self._failed_count,
             'pending': len(self._pending)
         }
 
@@ -716,6 +682,7 @@ class CSVFileProcessor:
                 stats = inserter.get_stats()
                 result.imported_count = stats['inserted']
                 result.duplicate_count = stats['duplicates']
+                result.error_count += stats['failed']
                 result.success = result.error_count == 0
 
                 logger.info(
@@ -776,6 +743,7 @@ class CSVFileProcessor:
                 result.inserted_count = stats['inserted']
                 result.skipped_complete = stats['skipped_complete']
                 result.skipped_no_change = stats['skipped_no_change']
+                result.error_count += stats['failed']
                 result.success = result.error_count == 0
 
                 logger.info(
@@ -818,19 +786,8 @@ class CSVImporter:
 
         self.preview_config_loader = PreviewFieldConfigLoader(config_dir)
         self.hash_resolver = HashResolver(db_manager)
-        self.batch_size = config.getint('csv_import', 'batch_size', fallback=100)
-
-    def _sanitise_csv(self, file_path: Path) -> None:
-        """Sanitise CSV file using pandas if available"""
-        try:
-            import pandas as pd
-            df = pd.read_csv(file_path, dtype=str, engine='python')
-            df.to_csv(file_path, index=False, encoding='utf-8')
-            logger.info(f"Sanitised CSV with pandas (BOM removed): {file_path.name}")
-        except ImportError:
-            logger.warning("Pandas not installed. Skipping Excel BOM workaround.")
-        except Exception as e:
-            logger.warning(f"Failed to sanitise CSV with pandas: {e}")
+        self.batch_size = config.getint('csv_import', 'batch_size', fallback=MAX_INSERT_PAGE_SIZE)
+        self.max_workers = config.getint('csv_import', 'max_workers', fallback=4)
 
     def import_file(self, file_path: Path) -> ImportResult:
         """Import a single CSV file."""
@@ -841,7 +798,6 @@ class CSVImporter:
                 error_message=f"File not found: {file_path}"
             )
 
-        self._sanitise_csv(file_path)
         logger.info(f"Importing CSV file: {file_path.name}")
 
         processor = CSVFileProcessor(
@@ -863,7 +819,6 @@ class CSVImporter:
                 error_message=f"File not found: {file_path}"
             )
 
-        self._sanitise_csv(file_path)
         logger.info(f"Updating from CSV file: {file_path.name}")
 
         processor = CSVFileProcessor(
@@ -876,9 +831,51 @@ class CSVImporter:
 
         return processor.process_update()
 
-    def scan_and_import(self) -> Dict[str, Any]:
-        """Scan input folder and import all CSV files."""
-        csv_files = list(self.input_folder.glob('*.csv'))
+    def _list_csv_files(self) -> List[Path]:
+        """
+        List the CSV files waiting in the input folder, oldest first
+
+        One directory read (os.scandir); imported files are moved out of the
+        folder, so everything listed still needs importing.
+        """
+        try:
+            with os.scandir(self.input_folder) as entries:
+                files = [
+                    (entry.stat().st_mtime, Path(entry.path))
+                    for entry in entries
+                    if entry.name.endswith('.csv') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+        files.sort()
+        return [path for _, path in files]
+
+    def _import_and_move(self, csv_file: Path) -> ImportResult:
+        """Import one CSV file and move it to the processed or error folder."""
+        result = self.import_file(csv_file)
+
+        if result.success:
+            self._move_file(csv_file, self.processed_folder)
+        else:
+            self._move_file(csv_file, self.error_folder)
+            logger.error(f"Import failed for {csv_file.name}: {result.error_message}")
+
+        return result
+
+    def scan_and_import(self, csv_files: Optional[List[Path]] = None) -> Dict[str, Any]:
+        """
+        Import CSV files, by default every CSV file in the input folder.
+
+        Files are independent, so up to max_workers ([csv_import] max_workers)
+        are imported at once, each on its own pooled connection. ON CONFLICT
+        keeps concurrent inserts of the same TIP safe.
+
+        Args:
+            csv_files: Files to import (optional, default: scan the input folder)
+        """
+        if csv_files is None:
+            csv_files = self._list_csv_files()
 
         if not csv_files:
             logger.debug(f"No CSV files found in {self.input_folder}")
@@ -893,17 +890,9 @@ class CSVImporter:
 
         logger.info(f"Found {len(csv_files)} CSV file(s) to process")
 
-        results: List[ImportResult] = []
-
-        for csv_file in csv_files:
-            result = self.import_file(csv_file)
-            results.append(result)
-
-            if result.success:
-                self._move_file(csv_file, self.processed_folder)
-            else:
-                self._move_file(csv_file, self.error_folder)
-                logger.error(f"Import failed for {csv_file.name}: {result.error_message}")
+        workers = max(1, min(self.max_workers, len(csv_files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results: List[ImportResult] = list(executor.map(self._import_and_move, csv_files))
 
         cache_stats = self.hash_resolver.get_cache_stats()
         logger.info(
@@ -928,11 +917,12 @@ class CSVImporter:
             f"{summary['total_errors']} errors"
         )
 
+        self._notify_new_tips(summary['total_imported'])
         return summary
 
     def scan_and_update(self) -> Dict[str, Any]:
         """Scan input folder and update existing records from CSV files."""
-        csv_files = list(self.input_folder.glob('*.csv'))
+        csv_files = self._list_csv_files()
 
         if not csv_files:
             logger.debug(f"No CSV files found in {self.input_folder}")
@@ -988,8 +978,19 @@ class CSVImporter:
             f"{summary['total_errors']} errors"
         )
 
+        self._notify_new_tips(summary['total_inserted'])
         return summary
 
+    def _notify_new_tips(self, count: int) -> None:
+        """Wake a listening nobbie_daemon when TIPs were queued (best effort)"""
+        if count <= 0:
+            return
+
+        try:
+            self.db_manager.notify(NEW_TIP_CHANNEL, str(count))
+        except Exception as e:
+            logger.warning(f"Could not send {NEW_TIP_CHANNEL} notification: {e}")
+
     def _move_file(self, source: Path, destination_folder: Path) -> Optional[Path]:
         """Move file to destination folder with timestamp"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -1,10 +1,15 @@
 from __future__ import annotations
+import io
 import psycopg2
 from psycopg2 import pool, extras
-from typing import Optional, Any, List, Dict, Tuple, Generator, Sequence
+from typing import Optional, Any, List, Dict, Tuple, Generator, Sequence, Iterable, Set
 import logging
 import atexit
+import select
+import threading
+import weakref
 from contextlib import contextmanager
+from itertools import islice
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -13,25 +18,109 @@ class DatabaseConnectionError(Exception):
     pass
 
 
+def _csv_field(value: Any) -> str:
+    """Render one value for COPY CSV: None unquoted (NULL), anything else quoted"""
+    if value is None:
+        return ''
+    text: str = value if isinstance(value, str) else str(value)
+    return '"' + text.replace('"', '""') + '"'
+
+
+class CSVRecordStream:
+    """
+    Read-only file-like object that serialises records to CSV on demand
+    
+    Lets COPY ... FROM STDIN pull rows as it sends them instead of rendering
+    the whole data set into one in-memory buffer first. A read may return
+    slightly more than the requested size (whole rows only), which COPY accepts.
+    
+    COPY CSV reads an unquoted empty field as NULL and a quoted one as an empty
+    string, so every non-None value is quoted to keep '' distinct from None.
+    """
+    
+    def __init__(self, records: Iterable[Sequence[Any]]) -> None:
+        self._rows = iter(records)
+        self._buffer: io.StringIO = io.StringIO()
+    
+    def read(self, size: int = -1) -> str:
+        for row in self._rows:
+            self._buffer.write(','.join(map(_csv_field, row)) + '\n')
+            if 0 <= size <= self._buffer.tell():
+                break
+        
+        data: str = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+    
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def copy_records(cur: psycopg2.extensions.cursor, table: str,
+                 columns: Sequence[str], records: Iterable[Sequence[Any]]) -> None:
+    """
+    Bulk load records into a table with COPY ... FROM STDIN (CSV format)
+    
+    Runs on the caller's cursor so the load can share a transaction with
+    other statements (e.g. a preceding TRUNCATE). None values load as NULL;
+    empty strings load as empty strings.
+    
+    Args:
+        cur: Open database cursor
+        table: Target table name
+        columns: Column names, in record order
+        records: Iterable of row sequences
+    """
+    cur.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        CSVRecordStream(records)
+    )
+
+
+# NOTIFY channel raised when new TIPs are queued (CSV import, SFTP download);
+# nobbie_daemon LISTENs on it to start a cycle without waiting out its sleep
+NEW_TIP_CHANNEL: str = 'new_tip'
+
+
 class DatabaseConnectionManager:
     """Manages PostgreSQL connection pool with health checks and graceful cleanup"""
     
-    def __init__(self, config: 'ConfigLoader') -> None:
+    def __init__(self, config: 'ConfigLoader', minconn: Optional[int] = None,
+                 maxconn: Optional[int] = None) -> None:
         """
         Initialise connection pool
         
         Args:
             config: ConfigLoader instance with PostgreSQL configuration
+            minconn: Override pool_min_connections (e.g. 1 for a worker process)
+            maxconn: Override pool_max_connections
         """
         self.config: 'ConfigLoader' = config
         self.pool: Optional[pool.ThreadedConnectionPool] = None
         
+        # Prepared statements: name -> SQL ($1, $2... placeholders), and the names
+        # already PREPAREd on each pooled connection (entries vanish with the connection)
+        self._prepared_queries: Dict[str, str] = {}
+        self._prepared_on: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        
         pg_config: Dict[str, Any] = config.get_postgresql_config()
+        if minconn is not None:
+            pg_config['minconn'] = minconn
+        if maxconn is not None:
+            pg_config['maxconn'] = maxconn
+        
+        # ThreadedConnectionPool raises PoolError when every connection is in use;
+        # this semaphore makes get_connection wait for a free one instead
+        self.max_connections: int = pg_config.get('maxconn', 10)
+        self.pool_wait_seconds: float = pg_config.get('pool_wait_seconds', 300)
+        self._pool_slots: threading.BoundedSemaphore = threading.BoundedSemaphore(self.max_connections)
+        self._checked_out: Set[psycopg2.extensions.connection] = set()
         
         try:
             self.pool = psycopg2.pool.ThreadedConnectionPool(
                 minconn=pg_config.get('minconn', 2),
-                maxconn=pg_config.get('maxconn', 10),
+                maxconn=self.max_connections,
                 host=pg_config['host'],
                 port=pg_config['port'],
                 database=pg_config['database'],
@@ -75,6 +164,9 @@ class DatabaseConnectionManager:
         """
         Get a healthy connection from the pool
         
+        If all pool_max_connections are in use, waits up to pool_wait_seconds
+        for one to be returned.
+        
         Returns:
             psycopg2 connection object
             
@@ -84,6 +176,12 @@ class DatabaseConnectionManager:
         if not self.pool:
             raise DatabaseConnectionError("Connection pool not initialised")
         
+        if not self._pool_slots.acquire(timeout=self.pool_wait_seconds):
+            raise DatabaseConnectionError(
+                f"No free database connection after {self.pool_wait_seconds}s "
+                f"(pool_max_connections={self.max_connections})"
+            )
+        
         try:
             conn: psycopg2.extensions.connection = self.pool.getconn()
             
@@ -96,10 +194,15 @@ class DatabaseConnectionManager:
                     self.pool.putconn(conn, close=True)
                     raise DatabaseConnectionError("Unable to obtain healthy connection")
             
+            self._checked_out.add(conn)
             return conn
             
         except psycopg2.pool.PoolError as e:
+            self._pool_slots.release()
             raise DatabaseConnectionError(f"Pool error: {e}")
+        except BaseException:
+            self._pool_slots.release()
+            raise
     
     def return_connection(self, conn: psycopg2.extensions.connection, close_conn: bool = False) -> None:
         """
@@ -116,6 +219,10 @@ class DatabaseConnectionManager:
             self.pool.putconn(conn, close=close_conn)
         except psycopg2.pool.PoolError as e:
             logger.error(f"Error returning connection to pool: {e}")
+        finally:
+            if conn in self._checked_out:
+                self._checked_out.discard(conn)
+                self._pool_slots.release()
     
     @contextmanager
     def get_cursor(self, cursor_factory: Optional[Any] = None) -> Generator[psycopg2.extensions.cursor, None, None]:
@@ -162,6 +269,71 @@ class DatabaseConnectionManager:
             results: List[Tuple[Any, ...]] = cur.fetchall()
             return results
     
+    def execute_query_tuples(self, query: str, params: Optional[Tuple[Any, ...]] = None,
+                             fetch: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        """
+        Execute SELECT query and return up to fetch rows as tuples
+        
+        Unlike execute_query_dict no per-row dictionaries are built, and with
+        fetch set only that many rows are pulled from the result.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (optional)
+            fetch: Maximum number of rows to return (optional, default all)
+            
+        Returns:
+            List of tuples (query results)
+        """
+        with self.get_cursor() as cur:
+            cur.execute(query, params)
+            if fetch is None:
+                return cur.fetchall()
+            return cur.fetchmany(fetch)
+    
+    def register_prepared(self, name: str, query: str) -> None:
+        """
+        Register a statement for execute_prepared
+        
+        Args:
+            name: Statement name (SQL identifier)
+            query: SQL using $1, $2... parameter placeholders
+        """
+        self._prepared_queries[name] = query
+    
+    def execute_prepared(self, name: str, params: Sequence[Any] = (),
+                         fetch: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        """
+        Execute a registered statement, preparing it on the connection on first use
+        
+        The server parses and plans the statement once per pooled connection.
+        PREPARE is session-level and survives a rollback, so it runs as its own
+        statement and is recorded as soon as it succeeds; a failed EXECUTE then
+        leaves the connection with a prepared statement it knows about.
+        
+        Args:
+            name: Name given to register_prepared
+            params: Statement parameters, in $n order
+            fetch: Maximum number of rows to return (optional, default all)
+            
+        Returns:
+            List of tuples (query results)
+        """
+        execute_sql = f"EXECUTE {name} ({', '.join(['%s'] * len(params))})" if params else f"EXECUTE {name}"
+        
+        with self.get_cursor() as cur:
+            prepared = self._prepared_on.setdefault(cur.connection, set())
+            if name not in prepared:
+                # No parameters passed, so psycopg2 sends the statement text as-is
+                cur.execute(f"PREPARE {name} AS {self._prepared_queries[name]}")
+                prepared.add(name)
+            
+            cur.execute(execute_sql, tuple(params))
+            
+            if fetch is None:
+                return cur.fetchall()
+            return cur.fetchmany(fetch)
+    
     def execute_query_dict(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> List[Dict[str, Any]]:
         """
         Execute SELECT query and return results as dictionaries
@@ -194,6 +366,66 @@ class DatabaseConnectionManager:
             rowcount: int = cur.rowcount
             return rowcount
     
+    def execute_values_batch(self, query: str, records: Iterable[Sequence[Any]],
+                             page_size: int = 5000, template: Optional[str] = None,
+                             synchronous_commit: bool = True,
+                             skipped: Optional[List[Sequence[Any]]] = None) -> int:
+        """
+        Execute a multi-row INSERT/UPDATE using psycopg2.extras.execute_values
+        
+        Records are sent in pages of page_size within a single transaction. If a
+        page fails it is rolled back to a savepoint and retried row by row, so one
+        bad record is logged and skipped rather than aborting the whole load.
+        
+        Args:
+            query: SQL query containing a single VALUES %s placeholder
+            records: Iterable of parameter sequences
+            page_size: Number of records per statement
+            template: Optional execute_values row template
+            synchronous_commit: If False, the commit does not wait for the WAL
+                flush (only for re-runnable loads, e.g. from authoritative files)
+            skipped: Optional list the records skipped by the row-by-row fallback
+                are appended to, so callers can count them as failures
+            
+        Returns:
+            Number of affected rows
+        """
+        affected: int = 0
+        rows = iter(records)
+        
+        with self.get_cursor() as cur:
+            if not synchronous_commit:
+                cur.execute("SET LOCAL synchronous_commit TO OFF")
+            
+            while True:
+                page: List[Sequence[Any]] = list(islice(rows, page_size))
+                if not page:
+                    break
+                
+                cur.execute("SAVEPOINT values_page")
+                try:
+                    psycopg2.extras.execute_values(cur, query, page, template=template, page_size=page_size)
+                    affected += cur.rowcount
+                    cur.execute("RELEASE SAVEPOINT values_page")
+                    continue
+                except psycopg2.Error as e:
+                    cur.execute("ROLLBACK TO SAVEPOINT values_page")
+                    logger.warning(f"Batch of {len(page)} rows failed ({e}), retrying row by row")
+                
+                for record in page:
+                    cur.execute("SAVEPOINT values_row")
+                    try:
+                        psycopg2.extras.execute_values(cur, query, [record], template=template)
+                        affected += cur.rowcount
+                        cur.execute("RELEASE SAVEPOINT values_row")
+                    except psycopg2.Error as e:
+                        cur.execute("ROLLBACK TO SAVEPOINT values_row")
+                        logger.error(f"Skipping row {str(record)[:80]}: {e}")
+                        if skipped is not None:
+                            skipped.append(record)
+        
+        return affected
+    
     # def execute_transaction(self, queries: List[Tuple[str, Optional[Tuple[Any, ...]]]]) -> bool:
     def execute_transaction(self, queries: Sequence[Tuple[str, Optional[Tuple[Any, ...]]]]) -> bool:
         """
@@ -220,6 +452,64 @@ class DatabaseConnectionManager:
         finally:
             self.return_connection(conn)
     
+    def notify(self, channel: str, payload: str = '') -> None:
+        """
+        Send a NOTIFY on a channel (delivered to listeners on commit)
+        
+        Args:
+            channel: Channel name
+            payload: Optional payload text
+        """
+        with self.get_cursor() as cur:
+            cur.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+    
+    def listen(self, channel: str) -> psycopg2.extensions.connection:
+        """
+        Take a connection out of the pool and LISTEN on a channel
+        
+        The connection is switched to autocommit so notifications arrive
+        without an open transaction. Release it with
+        return_connection(conn, close_conn=True).
+        
+        Args:
+            channel: Channel name
+            
+        Returns:
+            Listening connection, for wait_for_notify
+        """
+        conn: psycopg2.extensions.connection = self.get_connection()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {channel}")
+        except psycopg2.Error:
+            self.return_connection(conn, close_conn=True)
+            raise
+        return conn
+    
+    @staticmethod
+    def wait_for_notify(conn: psycopg2.extensions.connection, timeout: float,
+                        extra_fds: Sequence[int] = ()) -> bool:
+        """
+        Block until a notification arrives on a listening connection
+        
+        Args:
+            conn: Connection returned by listen()
+            timeout: Maximum seconds to wait
+            extra_fds: Other file descriptors that should also end the wait
+            
+        Returns:
+            True if one or more notifications were received (they are consumed)
+        """
+        ready, _, _ = select.select([conn, *extra_fds], [], [], timeout)
+        if conn not in ready:
+            return False
+        
+        conn.poll()
+        received = bool(conn.notifies)
+        conn.notifies.clear()
+        return received
+    
     def close_all(self) -> None:
         """Close all connections and clean up pool"""
         if self.pool:
@@ -17,11 +17,50 @@ import csv
 import re
 import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Set
+from typing import Optional, List, Dict, Any, Tuple, Set, Iterable
 from datetime import datetime
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# A complete TIP hash (SHA-256 hex); search_hash answers these with an exact lookup
+FULL_HASH_PATTERN: re.Pattern = re.compile(r'^[a-fA-F0-9]{64}$')
+
+# Normalises API context keys to lookup types (see update_lookup_types_if_unknown)
+LOOKUP_TYPE_BY_CONTEXT_KEY: Dict[str, str] = {
+    'whichDepartmentDoesTheLoadBelongTo': 'department',
+    'vehicle': 'vehicle',
+    'trailer': 'trailer',
+    'trailer2': 'trailer',
+    'trailer3': 'trailer',
+    'team': 'team'
+}
+
+# Statements prepared per connection (see DatabaseConnectionManager.execute_prepared)
+PREPARED_QUERIES: Dict[str, str] = {
+    'hash_lookup_by_hash': """
+        SELECT resolved_value, lookup_type, source_type
+        FROM hash_lookup
+        WHERE tip_hash = $1
+    """,
+    'hash_lookup_by_type': """
+        SELECT resolved_value, source_type, tip_hash
+        FROM hash_lookup
+        WHERE lookup_type = $1
+        ORDER BY resolved_value ASC
+        LIMIT $2 OFFSET $3
+    """,
+    'hash_lookup_count_by_type': """
+        SELECT COUNT(*) FROM hash_lookup WHERE lookup_type = $1
+    """,
+    'hash_lookup_search': """
+        SELECT lookup_type, source_type, resolved_value, tip_hash
+        FROM hash_lookup
+        WHERE resolved_value ILIKE $1 OR tip_hash LIKE $2
+        ORDER BY resolved_value ASC
+        LIMIT $3
+    """,
+}
+
 
 class HashLookupError(Exception):
     """Raised when hash lookup operations fail"""
@@ -248,40 +287,91 @@ class HashManager:
         # Cache: tip_hash -> resolved_value (hashes are globally unique)
         self._cache: Dict[str, str] = {}
         self._cache_loaded: bool = False
-        # Track unknown hashes by (tip_hash, lookup_type) to avoid duplicate logging
+        # (row count, latest updated_at) of hash_lookup when the cache was loaded
+        self._cache_version: Optional[Tuple[Any, ...]] = None
+        # Serialises cache loads when one HashManager is shared by processor threads
+        self._cache_lock: threading.Lock = threading.Lock()
+        # Track unknown hashes by (tip_hash, lookup_type) to avoid duplicate logging;
+        # cleared with the cache so a hash still missing after a reload is recorded again
         self._unknown_hashes_logged: Set[Tuple[str, str]] = set()
         
+        for name, query in PREPARED_QUERIES.items():
+            db_manager.register_prepared(name, query)
+        
         hash_config_path = config.get('hash_detection', 'config_file', fallback=None)
         if hash_config_path:
             _detector.load(hash_config_path)
     
-    def _load_cache(self) -> None:
-        """Load hash lookups into memory cache"""
+    def _get_cache_version(self) -> Tuple[Any, ...]:
+        """Return (row count, latest updated_at) of hash_lookup, which changes on any reload"""
+        return tuple(self.db_manager.execute_query(
+            "SELECT COUNT(*), MAX(updated_at) FROM hash_lookup"
+        )[0])
+    
+    def _load_cache(self) -> Dict[str, str]:
+        """Load hash lookups into memory cache and return it"""
         if self._cache_loaded:
-            return
+            return self._cache
         
-        try:
-            results: List[Dict[str, Any]] = self.db_manager.execute_query_dict(
-                "SELECT tip_hash, resolved_value FROM hash_lookup"
-            )
-            
-            self._cache.clear()
-            for row in results:
-                self._cache[row['tip_hash']] = row['resolved_value']
+        with self._cache_lock:
+            # Another thread may have loaded it while this one waited
+            if self._cache_loaded:
+                return self._cache
             
-            self._cache_loaded = True
-            logger.info(f"Loaded {len(self._cache)} hash lookups into cache")
-            
-        except Exception as e:
-            logger.error(f"Failed to load hash lookup cache: {e}")
-            raise HashLookupError(f"Cache load failed: {e}")
+            try:
+                version = self._get_cache_version()
+                # (tip_hash, resolved_value) tuples go straight into the dict, no per-row dicts
+                results = self.db_manager.execute_query_tuples(
+                    "SELECT tip_hash, resolved_value FROM hash_lookup"
+                )
+                
+                # A new dict rather than clear/update, so lookups holding the old one never see it half-filled
+                self._cache = dict(results)
+                self._cache_version = version
+                
+                self._cache_loaded = True
+                logger.info(f"Loaded {len(self._cache)} hash lookups into cache")
+                return self._cache
+                
+            except Exception as e:
+                logger.error(f"Failed to load hash lookup cache: {e}")
+                raise HashLookupError(f"Cache load failed: {e}")
     
     def invalidate_cache(self) -> None:
         """Force cache reload on next lookup"""
-        self._cache_loaded = False
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache_loaded = False
+            self._cache = {}
+            self._cache_version = None
+            self._unknown_hashes_logged = set()
         logger.debug("Hash cache invalidated")
     
+    def refresh_cache_if_changed(self) -> bool:
+        """
+        Invalidate the cache if hash_lookup has changed since it was loaded
+        
+        hash_lookup is reloaded by nobbie_sync.py in another process, so a
+        long-lived HashManager (e.g. the daemon's) calls this once per cycle.
+        
+        Returns:
+            True if the cache was invalidated, False otherwise
+        """
+        if not self._cache_loaded:
+            return False
+        
+        try:
+            version = self._get_cache_version()
+        except Exception as e:
+            logger.warning(f"Could not check hash_lookup for changes: {e}")
+            return False
+        
+        if version == self._cache_version:
+            return False
+        
+        logger.info("hash_lookup has changed since the cache was loaded, reloading on next lookup")
+        self.invalidate_cache()
+        return True
+    
     def lookup_hash(self, lookup_type: str, tip_hash: str, tip_value: Optional[str] = None, 
                    inspection_id: Optional[str] = None) -> str:
         """
@@ -302,16 +392,54 @@ class HashManager:
         if not tip_hash:
             return ""
         
-        if not self._cache_loaded:
-            self._load_cache()
+        cache = self._cache if self._cache_loaded else self._load_cache()
         
-        if tip_hash in self._cache:
-            return self._cache[tip_hash]
+        if tip_hash in cache:
+            return cache[tip_hash]
         
         self._record_unknown_hash(lookup_type, tip_hash, tip_value, inspection_id)
         
         return f"Unknown ({tip_hash[:16]}...)"
     
+    def lookup_hash_with_metadata(self, tip_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Lookup hash and return its resolved value with lookup_type and source_type.
+        
+        The in-memory cache only holds resolved values, so this is a primary key
+        lookup against hash_lookup. When the cache is already loaded it holds every
+        hash, so a miss there is answered without a database round trip.
+        
+        Args:
+            tip_hash: Hash value to resolve
+            
+        Returns:
+            Dictionary with resolved_value, lookup_type and source_type, or None if not found
+        """
+        if not tip_hash:
+            return None
+        
+        if self._cache_loaded and tip_hash not in self._cache:
+            return None
+        
+        results = self.db_manager.execute_prepared('hash_lookup_by_hash', (tip_hash,))
+        
+        if not results:
+            return None
+        
+        resolved_value, lookup_type, source_type = results[0]
+        return {
+            'resolved_value': resolved_value,
+            'lookup_type': lookup_type,
+            'source_type': source_type,
+        }
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return whether the lookup cache is loaded and how many entries it holds"""
+        return {
+            'cache_loaded': self._cache_loaded,
+            'cache_size': len(self._cache),
+        }
+    
     def _record_unknown_hash(self, lookup_type: str, tip_hash: str, 
                             tip_value: Optional[str], inspection_id: Optional[str]) -> None:
         """Record unknown hash to database and log file"""
@@ -361,10 +489,13 @@ class HashManager:
         return _detector.detect_type(resolved_value)
     
     def migrate_lookup_table_from_csv(self, csv_file_path: str, 
-                                      batch_size: int = 100) -> Tuple[int, int]:
+                                      batch_size: int = 10000) -> Tuple[int, int]:
         """
         Migrate hash lookup table from CSV to PostgreSQL using batch operations
         
+        The file is streamed, so memory use is bounded by batch_size rather
+        than the file size.
+        
         Args:
             csv_file_path: Path to lookup_table.csv
             batch_size: Number of rows per batch insert
@@ -381,32 +512,48 @@ class HashManager:
         
         imported_count: int = 0
         skipped_count: int = 0
-        batch: List[Tuple[str, str, str]] = []
+        rows_read: int = 0
+        # Keyed by hash so a repeated TIP within one batch keeps its last value,
+        # as the row-by-row upsert did (one statement cannot update a row twice)
+        batch: Dict[str, Tuple[str, str, str]] = {}
         
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                reader = csv.reader(f)
+                fieldnames = next(reader, [])
                 
-                if 'TIP' not in reader.fieldnames or 'VALUE' not in reader.fieldnames:
-                    raise HashLookupError(f"CSV must contain 'TIP' and 'VALUE' columns. Found: {reader.fieldnames}")
+                if 'TIP' not in fieldnames or 'VALUE' not in fieldnames:
+                    raise HashLookupError(f"CSV must contain 'TIP' and 'VALUE' columns. Found: {fieldnames}")
+                
+                tip_index = fieldnames.index('TIP')
+                value_index = fieldnames.index('VALUE')
+                min_length = max(tip_index, value_index) + 1
                 
                 for row in reader:
-                    tip_hash: str = row['TIP'].strip()
-                    resolved_value: str = row['VALUE'].strip()
+                    rows_read += 1
+                    if len(row) < min_length:
+                        skipped_count += 1
+                        continue
+                    
+                    tip_hash: str = row[tip_index].strip()
+                    resolved_value: str = row[value_index].strip()
                     
                     if not tip_hash or not resolved_value:
                         skipped_count += 1
                         continue
                     
                     lookup_type: str = self.detect_lookup_type(resolved_value)
-                    batch.append((tip_hash, lookup_type, resolved_value))
+                    batch[tip_hash] = (tip_hash, lookup_type, resolved_value)
                     
                     if len(batch) >= batch_size:
-                        imported_count += self._insert_batch(batch)
-                        batch = []
+                        imported_count += self._insert_batch(list(batch.values()))
+                        batch = {}
+                    
+                    if rows_read % 100_000 == 0:
+                        logger.info(f"Migration progress: {rows_read} rows read, {imported_count} imported")
                 
                 if batch:
-                    imported_count += self._insert_batch(batch)
+                    imported_count += self._insert_batch(list(batch.values()))
             
             self.invalidate_cache()
             
@@ -418,27 +565,24 @@ class HashManager:
             raise HashLookupError(f"Migration failed: {e}")
     
     def _insert_batch(self, batch: List[Tuple[str, str, str]]) -> int:
-        """Insert batch of hash lookups using upsert"""
+        """Insert batch of hash lookups using one multi-row upsert"""
         if not batch:
             return 0
         
         try:
-            for tip_hash, lookup_type, resolved_value in batch:
-                self.db_manager.execute_update(
-                    """
-                    INSERT INTO hash_lookup (tip_hash, lookup_type, resolved_value)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (tip_hash) 
-                    DO UPDATE SET 
-                        lookup_type = EXCLUDED.lookup_type,
-                        resolved_value = EXCLUDED.resolved_value, 
-                        updated_at = CURRENT_TIMESTAMP
-                    """,
-                    (tip_hash, lookup_type, resolved_value)
-                )
-                self._cache[tip_hash] = resolved_value
-            
-            return len(batch)
+            return self.db_manager.execute_values_batch(
+                """
+                INSERT INTO hash_lookup (tip_hash, lookup_type, resolved_value)
+                VALUES %s
+                ON CONFLICT (tip_hash) 
+                DO UPDATE SET 
+                    lookup_type = EXCLUDED.lookup_type,
+                    resolved_value = EXCLUDED.resolved_value, 
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                batch,
+                page_size=len(batch)
+            )
                 
         except Exception as e:
             logger.error(f"Batch insert failed: {e}")
@@ -567,57 +711,99 @@ class HashManager:
             tip_hash: Hash value
             context_key: Key from API response (team, vehicle, trailer, etc.)
         """
-        if not tip_hash:
-            return
+        self.update_lookup_types_if_unknown([(tip_hash, context_key)])
+    
+    def update_lookup_types_if_unknown(self, hashes: Iterable[Tuple[str, str]]) -> None:
+        """
+        Update lookup_type from 'unknown' for several hashes in one statement.
         
-        type_mapping = {
-            'whichDepartmentDoesTheLoadBelongTo': 'department',
-            'vehicle': 'vehicle',
-            'trailer': 'trailer',
-            'trailer2': 'trailer',
-            'trailer3': 'trailer',
-            'team': 'team'
-        }
+        Used once per TIP for all of its hash fields, rather than one UPDATE
+        round trip per field.
         
-        normalised_type = type_mapping.get(context_key, context_key)
+        Args:
+            hashes: (tip_hash, context_key) pairs; empty hashes are skipped
+        """
+        # One row per hash (a hash seen under two keys keeps the last type)
+        updates: Dict[str, str] = {
+            tip_hash: LOOKUP_TYPE_BY_CONTEXT_KEY.get(context_key, context_key)
+            for tip_hash, context_key in hashes
+            if tip_hash
+        }
+        if not updates:
+            return
         
         try:
-            rows_updated = self.db_manager.execute_update(
+            rows_updated = self.db_manager.execute_values_batch(
                 """
                 UPDATE hash_lookup
-                SET lookup_type = %s, updated_at = CURRENT_TIMESTAMP
-                WHERE tip_hash = %s AND lookup_type = 'unknown'
+                SET lookup_type = v.lookup_type, updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS v (tip_hash, lookup_type)
+                WHERE hash_lookup.tip_hash = v.tip_hash AND hash_lookup.lookup_type = 'unknown'
                 """,
-                (normalised_type, tip_hash)
+                updates.items(),
+                page_size=len(updates)
             )
             
             if rows_updated > 0:
-                logger.debug(f"Updated lookup_type: {tip_hash[:16]}... from unknown to {normalised_type}")
+                logger.debug(f"Updated lookup_type from unknown for {rows_updated} hash(es)")
                 
         except Exception as e:
-            logger.debug(f"Could not update lookup_type for {tip_hash[:16]}...: {e}")
+            logger.debug(f"Could not update lookup_type for {len(updates)} hash(es): {e}")
 
-    def get_by_type(self, lookup_type: str) -> List[Dict[str, Any]]:
+    def get_by_type(self, lookup_type: str, limit: Optional[int] = None,
+                    offset: int = 0) -> List[Tuple[Any, ...]]:
         """
-        Get all hash entries for a specific lookup type.
+        Get one page of hash entries for a specific lookup type, ordered by name.
 
         Args:
             lookup_type: The type of entity to list (e.g., 'vehicle', 'trailer')
+            limit: Maximum number of rows to return (optional, default all)
+            offset: Number of rows to skip
 
         Returns:
-            List of dictionaries containing hash details
+            List of (resolved_value, source_type, tip_hash) tuples
         """
-        query = """
-            SELECT resolved_value, source_type, tip_hash
-            FROM hash_lookup
-            WHERE lookup_type = %s
-            ORDER BY resolved_value ASC
+        try:
+            return self.db_manager.execute_prepared(
+                'hash_lookup_by_type', (lookup_type, limit, offset), fetch=limit
+            )
+        except Exception as e:
+            logger.error(f"Failed to get hashes by type {lookup_type}: {e}")
+            return []
+    
+    def count_by_type(self, lookup_type: str) -> int:
+        """Count hash entries of a specific lookup type"""
+        return self.db_manager.execute_prepared('hash_lookup_count_by_type', (lookup_type,))[0][0]
+    
+    def search_hash(self, search_term: str, limit: int = 50) -> List[Tuple[Any, ...]]:
+        """
+        Search hash_lookup by resolved name (case-insensitive substring) or hash prefix.
+
+        Args:
+            search_term: Name fragment or leading part of a hash
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of (lookup_type, source_type, resolved_value, tip_hash) tuples
         """
+        term = search_term.strip()
+        
+        # A complete hash can only match itself: one primary key probe, no scan
+        if FULL_HASH_PATTERN.match(term):
+            try:
+                rows = self.db_manager.execute_prepared('hash_lookup_by_hash', (term.lower(),))
+            except Exception as e:
+                logger.error(f"Hash search failed for '{search_term}': {e}")
+                return []
+            return [(lookup_type, source_type, resolved_value, term.lower())
+                    for resolved_value, lookup_type, source_type in rows]
+        
+        params = (f"%{search_term}%", f"{search_term.lower()}%", limit)
         
         try:
-            return self.db_manager.execute_query_dict(query, (lookup_type,))
+            return self.db_manager.execute_prepared('hash_lookup_search', params, fetch=limit)
         except Exception as e:
-            logger.error(f"Failed to get hashes by type {lookup_type}: {e}")
+            logger.error(f"Hash search failed for '{search_term}': {e}")
             return []
     
     def get_statistics(self) -> Dict[str, Dict[str, int]]:
@@ -629,7 +815,7 @@ class HashManager:
             FROM hash_lookup 
             GROUP BY lookup_type
         """
-        known_results = self.db_manager.execute_query_dict(known_query)
+        known_by_type = dict(self.db_manager.execute_query_tuples(known_query))
         
         unknown_query = """
             SELECT lookup_type, COUNT(*) as count 
@@ -637,11 +823,9 @@ class HashManager:
             WHERE resolved_at IS NULL
             GROUP BY lookup_type
         """
-        unknown_results = self.db_manager.execute_query_dict(unknown_query)
+        unknown_by_type = dict(self.db_manager.execute_query_tuples(unknown_query))
         
         all_types = set()
-        known_by_type = {r['lookup_type']: r['count'] for r in known_results}
-        unknown_by_type = {r['lookup_type']: r['count'] for r in unknown_results}
         
         all_types.update(known_by_type.keys())
         all_types.update(unknown_by_type.keys())
@@ -654,6 +838,44 @@ class HashManager:
         
         return stats
     
+    def get_hash_statistics(self) -> Dict[str, Any]:
+        """
+        Get hash_lookup counts by lookup_type and by source_type, plus the total.
+        
+        All three come from one GROUPING SETS query; GROUPING() tells the kinds
+        of row apart (source_type itself may be NULL).
+        
+        Returns:
+            Dictionary of {lookup_type: {'count': n}}, plus 'by_source_type'
+            ({source_type: n}, NULL source types excluded) and 'total'
+        """
+        rows = self.db_manager.execute_query("""
+            SELECT lookup_type, source_type,
+                   GROUPING(lookup_type) AS lookup_rollup,
+                   GROUPING(source_type) AS source_rollup,
+                   COUNT(*) AS count
+            FROM hash_lookup
+            GROUP BY GROUPING SETS ((lookup_type), (source_type), ())
+        """)
+        
+        stats: Dict[str, Any] = {}
+        by_source_type: Dict[str, int] = {}
+        total = 0
+        
+        for lookup_type, source_type, lookup_rollup, source_rollup, count in rows:
+            if not lookup_rollup:
+                stats[lookup_type] = {'count': count}
+            elif not source_rollup:
+                if source_type is not None:
+                    by_source_type[source_type] = count
+            else:
+                total = count
+        
+        stats['by_source_type'] = by_source_type
+        stats['total'] = total
+        
+        return stats
+    
     def export_unknown_hashes(self, output_path: Path, lookup_type: Optional[str] = None) -> int:
         """
         Export unknown hashes to CSV for manual resolution
@@ -780,16 +1002,15 @@ class HashManager:
                     return 0, 0, error_count
                 
                 tip_hashes = [h[0] for h in hashes_to_import]
-                placeholders = ', '.join(['%s'] * len(tip_hashes))
                 
-                existing_results = self.db_manager.execute_query_dict(
-                    f"""
+                existing_results = self.db_manager.execute_query_tuples(
+                    """
                     SELECT tip_hash FROM hash_lookup 
-                    WHERE tip_hash IN ({placeholders})
+                    WHERE tip_hash = ANY(%s)
                     """,
-                    tuple(tip_hashes)
+                    (tip_hashes,)
                 )
-                existing_hashes = {r['tip_hash'] for r in existing_results}
+                existing_hashes = {tip_hash for tip_hash, in existing_results}
                 
                 for tip_hash, resolved_value in hashes_to_import:
                     try:
@@ -6,6 +6,9 @@ from typing import Optional, Dict, Any
 import sys
 import os
 
+# Copy buffer when gzipping old logs (shutil's default is 64 KiB)
+LOG_COMPRESS_CHUNK_SIZE: int = 1024 * 1024
+
 class AlignedFormatter(logging.Formatter):
     """
     Formatter that ensures strict column alignment by:
@@ -254,7 +257,7 @@ class LoggerManager:
 
                     with open(log_file, 'rb') as f_in:
                         with gzip.open(gz_file, 'wb') as f_out:
-                            shutil.copyfileobj(f_in, f_out)
+                            shutil.copyfileobj(f_in, f_out, LOG_COMPRESS_CHUNK_SIZE)
 
                     log_file.unlink()
                     compressed_count += 1
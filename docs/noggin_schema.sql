@@ -65,6 +65,13 @@ CREATE TABLE noggin_schema.hash_lookup (
 CREATE INDEX idx_hash_lookup_lookup_type ON noggin_schema.hash_lookup USING btree (lookup_type);
 CREATE INDEX idx_hash_lookup_resolved_value ON noggin_schema.hash_lookup USING btree (resolved_value);
 CREATE INDEX idx_hash_lookup_source_type ON noggin_schema.hash_lookup USING btree (source_type);
+-- Ordered, paged listing by type (nobbie_hashes.py list): LIMIT stops after one page
+CREATE INDEX idx_hash_lookup_type_resolved_value ON noggin_schema.hash_lookup USING btree (lookup_type, resolved_value);
+-- Name search (resolved_value ILIKE '%term%') and hash prefix search (tip_hash LIKE 'term%')
+-- used by nobbie_hashes.py search; requires the pg_trgm extension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_hash_lookup_resolved_value_trgm ON noggin_schema.hash_lookup USING gin (resolved_value gin_trgm_ops);
+CREATE INDEX idx_hash_lookup_tip_hash_pattern ON noggin_schema.hash_lookup USING btree (tip_hash varchar_pattern_ops);
 
 -- Table Triggers
 
@@ -165,6 +172,71 @@ update
     on
     noggin_schema.noggin_data for each row execute function noggin_schema.update_modified_timestamp();
 
+-- noggin_schema.noggin_status_counts definition
+-- Row counts per processing_status, maintained by triggers on noggin_data so
+-- nobbie_daemon.py can read its per-cycle statistics without scanning noggin_data.
+-- The triggers only INSERT +1/-1 delta rows (no shared counter row to lock, so
+-- concurrent processors neither serialise nor deadlock on it); the daemon sums
+-- the deltas and folds them back into one row per status when it reads them.
+-- Upgrading from the keyed version: drop noggin_status_counts_pkey first.
+
+-- Drop table
+
+-- DROP TABLE noggin_schema.noggin_status_counts;
+
+CREATE TABLE noggin_schema.noggin_status_counts (
+	processing_status noggin_schema."processing_status_enum" NOT NULL,
+	count int8 NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION noggin_schema.update_status_counts()
+ RETURNS trigger
+ LANGUAGE plpgsql
+AS $function$
+BEGIN
+	IF TG_OP = 'TRUNCATE' THEN
+		DELETE FROM noggin_schema.noggin_status_counts;
+		RETURN NULL;
+	END IF;
+
+	-- UPDATE OF processing_status also fires when the status is set to its current value
+	IF TG_OP = 'UPDATE' AND OLD.processing_status IS NOT DISTINCT FROM NEW.processing_status THEN
+		RETURN NULL;
+	END IF;
+
+	IF TG_OP IN ('UPDATE', 'DELETE') THEN
+		INSERT INTO noggin_schema.noggin_status_counts (processing_status, count)
+		VALUES (OLD.processing_status, -1);
+	END IF;
+
+	IF TG_OP IN ('INSERT', 'UPDATE') THEN
+		INSERT INTO noggin_schema.noggin_status_counts (processing_status, count)
+		VALUES (NEW.processing_status, 1);
+	END IF;
+
+	RETURN NULL;
+END;
+$function$;
+
+-- Seed from the existing rows (run once, in the same transaction as the triggers)
+INSERT INTO noggin_schema.noggin_status_counts (processing_status, count)
+SELECT processing_status, COUNT(*) FROM noggin_schema.noggin_data GROUP BY processing_status;
+
+create trigger trg_noggin_data_status_counts after
+insert
+    or
+delete
+    or
+update
+    of processing_status on
+    noggin_schema.noggin_data for each row
+    execute function noggin_schema.update_status_counts();
+
+create trigger trg_noggin_data_status_counts_truncate after
+truncate
+    on
+    noggin_schema.noggin_data for each statement execute function noggin_schema.update_status_counts();
+
 	-- noggin_schema.processing_errors definition
 
 -- Drop table
@@ -238,6 +310,8 @@ CREATE INDEX idx_unknown_hashes_first_seen_inspection_id ON noggin_schema.unknow
 CREATE INDEX idx_unknown_hashes_lookup_type ON noggin_schema.unknown_hashes USING btree (lookup_type);
 CREATE INDEX idx_unknown_hashes_occurrence_count ON noggin_schema.unknown_hashes USING btree (occurrence_count DESC);
 CREATE INDEX idx_unknown_hashes_resolved_at ON noggin_schema.unknown_hashes USING btree (resolved_at) WHERE (resolved_at IS NULL);
+-- HashManager.auto_resolve_unknown_hashes joins only the unresolved rows to hash_lookup on tip_hash
+CREATE INDEX idx_unknown_hashes_unresolved_tip_hash ON noggin_schema.unknown_hashes USING btree (tip_hash) WHERE (resolved_at IS NULL);
 
 -- Table Triggers
 
@@ -2,21 +2,29 @@
 """
 NOBBIE  Continuous Processor
 
-Runs nobbie_process.py in a continuous loop with configurable sleep intervals.
+Runs the nobbie_process.py processing (in-process) in a continuous loop with
+configurable sleep intervals.
 Includes CSV import and hash resolution cycles.
 """
 
 from __future__ import annotations
+import os
 import sys
 import time
 import signal
-import subprocess
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+import psycopg2
 
 from common import ConfigLoader, LoggerManager, DatabaseConnectionManager, CSVImporter, HashManager
+from common.database import NEW_TIP_CHANNEL
+import nobbie_process
 
 # The project's sys/ subdirectory shadows Python's built-in sys module, so import
 # util_import_tips_sftp by temporarily adding that directory to sys.path.
@@ -29,6 +37,8 @@ finally:
 # Logger stub: safe to use before main() configures the full application logger
 logger: logging.Logger = logging.getLogger(__name__)
 shutdown_requested: bool = False
+# Set by signal_handler so the inter-cycle wait returns immediately
+_shutdown_event: threading.Event = threading.Event()
 
 
 def signal_handler(signum: int, frame: Any) -> None:
@@ -36,68 +46,97 @@ def signal_handler(signum: int, frame: Any) -> None:
     global shutdown_requested
     logger.info(f"Received signal {signum}. Initiating graceful shutdown...")
     shutdown_requested = True
+    _shutdown_event.set()
+    # Let an in-progress processing cycle finish its current TIP and return
+    nobbie_process.stop_processing()
+
+
+@dataclass(frozen=True)
+class LoopConfig:
+    """[continuous] settings, read once when the daemon starts"""
+    cycle_sleep: int
+    csv_import_frequency: int
+    sftp_download_frequency: int
+    hash_resolution_frequency: int
+    processing_batch_size: int
+    processing_workers: int
+    cycle_timeout: int
+    
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> LoopConfig:
+        return cls(
+            cycle_sleep=config.getint('continuous', 'cycle_sleep_seconds'),
+            csv_import_frequency=config.getint('continuous', 'import_csv_every_n_cycles'),
+            sftp_download_frequency=config.getint('continuous', 'sftp_download_every_n_cycles', fallback=6),
+            hash_resolution_frequency=config.getint('continuous', 'resolve_hashes_every_n_cycles', fallback=10),
+            processing_batch_size=config.getint('continuous', 'processing_batch_size', fallback=10),
+            processing_workers=config.getint('continuous', 'processing_workers', fallback=3),
+            cycle_timeout=config.getint('continuous', 'cycle_timeout_seconds', fallback=3600)
+        )
 
 
-def run_single_processing_cycle(config: ConfigLoader, db_manager: DatabaseConnectionManager) -> Dict[str, int]:
+def run_single_processing_cycle(loop_config: LoopConfig, db_manager: DatabaseConnectionManager,
+                                hash_manager: Optional[HashManager] = None) -> Dict[str, int]:
     """
-    Execute one processing cycle by running nobbie_process.py
+    Execute one processing cycle in-process via nobbie_process.run
+    
+    The object processors, their configs, the database pool and the hash
+    lookup cache persist across cycles instead of being rebuilt by a new
+    interpreter each time. The hash lookup cache is reloaded when hash_lookup
+    has changed since it was loaded.
     
     Args:
-        config: ConfigLoader instance
+        loop_config: LoopConfig instance
         db_manager: DatabaseConnectionManager instance
+        hash_manager: HashManager shared by all object processors (optional)
         
     Returns:
-        Dictionary with cycle status and duration
+        Dictionary with cycle status, duration and TIPs processed
     """
     cycle_start = datetime.now()
+    timeout = loop_config.cycle_timeout
+    batch_size = loop_config.processing_batch_size
     
     logger.info("=" * 80)
     logger.info(f"Starting processing cycle at {cycle_start.strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info("=" * 80)
     
+    # hash_lookup is reloaded by nobbie_sync.py outside this process
+    if hash_manager is not None:
+        hash_manager.refresh_cache_if_changed()
+    
     try:
-        script_dir = Path(__file__).parent
-        processor_script = script_dir / 'nobbie_process.py'
-        
-        if not processor_script.exists():
-            logger.error(f"Processor script not found: {processor_script}")
-            return {'status': 'error', 'duration_seconds': 0}
-        
-        result = subprocess.run(
-            [sys.executable, str(processor_script)],
-            cwd=str(script_dir),
-            capture_output=True,
-            text=True,
-            timeout=3600
+        processed = nobbie_process.run(
+            db_manager, batch_size=batch_size, timeout=timeout,
+            max_workers=loop_config.processing_workers,
+            hash_manager=hash_manager
         )
         
-        cycle_end = datetime.now()
-        duration = (cycle_end - cycle_start).total_seconds()
+        duration = (datetime.now() - cycle_start).total_seconds()
+        total_processed = sum(processed.values())
         
-        if result.returncode == 0:
-            logger.info(f"Processing cycle completed successfully in {duration:.1f} seconds")
-            return {'status': 'success', 'duration_seconds': duration}
-        else:
-            logger.error(f"Processing cycle failed with return code {result.returncode}")
-            if result.stderr:
-                logger.error(f"Error output: {result.stderr[:500]}")
-            return {'status': 'failed', 'duration_seconds': duration}
+        if duration >= timeout:
+            logger.error(f"Processing cycle stopped after reaching the {timeout} second timeout")
+            return {'status': 'timeout', 'duration_seconds': duration, 'processed': total_processed}
+        
+        logger.info(
+            f"Processing cycle completed successfully in {duration:.1f} seconds: "
+            f"{total_processed} TIPs processed"
+        )
+        return {'status': 'success', 'duration_seconds': duration, 'processed': total_processed}
             
-    except subprocess.TimeoutExpired:
-        logger.error("Processing cycle timed out after 3600 seconds")
-        return {'status': 'timeout', 'duration_seconds': 3600}
     except Exception as e:
         logger.error(f"Processing cycle error: {e}", exc_info=True)
-        return {'status': 'error', 'duration_seconds': 0}
+        duration = (datetime.now() - cycle_start).total_seconds()
+        return {'status': 'error', 'duration_seconds': duration, 'processed': 0}
 
 
-def run_csv_import_cycle(config: ConfigLoader, db_manager: DatabaseConnectionManager) -> Dict[str, int]:
+def run_csv_import_cycle(csv_importer: CSVImporter) -> Dict[str, int]:
     """
     Execute CSV import cycle
     
     Args:
-        config: ConfigLoader instance
-        db_manager: DatabaseConnectionManager instance
+        csv_importer: CSVImporter instance, created once by main() and reused
         
     Returns:
         Dictionary with import statistics
@@ -105,8 +144,9 @@ def run_csv_import_cycle(config: ConfigLoader, db_manager: DatabaseConnectionMan
     logger.info("Starting CSV import cycle...")
     
     try:
-        csv_importer = CSVImporter(config, db_manager)
-        result = csv_importer.scan_and_import_csv_files()
+        # Preview field configs stay loaded; cached hash misses may since have been added
+        csv_importer.hash_resolver.clear_cache()
+        result = csv_importer.scan_and_import()
         
         logger.info(f"CSV import cycle complete: {result['total_imported']} TIPs imported")
         return result
@@ -121,15 +161,14 @@ def run_csv_import_cycle(config: ConfigLoader, db_manager: DatabaseConnectionMan
         }
 
 
-def run_hash_resolution_cycle(config: ConfigLoader, db_manager: DatabaseConnectionManager) -> int:
+def run_hash_resolution_cycle(hash_manager: HashManager) -> int:
     """
     Run automatic hash resolution cycle
     
     Resolves any unknown hashes that now have entries in hash_lookup table.
     
     Args:
-        config: ConfigLoader instance
-        db_manager: DatabaseConnectionManager instance
+        hash_manager: HashManager instance, created once by main() and reused
         
     Returns:
         Number of hashes resolved
@@ -137,7 +176,6 @@ def run_hash_resolution_cycle(config: ConfigLoader, db_manager: DatabaseConnecti
     logger.info("Starting hash resolution cycle...")
     
     try:
-        hash_manager = HashManager(config, db_manager)
         resolved = hash_manager.auto_resolve_unknown_hashes()
         
         if resolved > 0:
@@ -152,32 +190,75 @@ def run_hash_resolution_cycle(config: ConfigLoader, db_manager: DatabaseConnecti
         return 0
 
 
-def get_processing_statistics(db_manager: DatabaseConnectionManager) -> Dict[str, int]:
+# Per-cycle statistics queries, prepared once per pooled connection.
+# daemon_status_counts folds the trigger's +1/-1 delta rows back into one row per
+# status and returns the totals, so the summary table stays small between reads.
+STATS_QUERIES: Dict[str, str] = {
+    'daemon_status_counts': """
+        WITH moved AS (
+            DELETE FROM noggin_status_counts
+            RETURNING processing_status, count
+        ), summed AS (
+            INSERT INTO noggin_status_counts (processing_status, count)
+            SELECT processing_status, SUM(count)
+            FROM moved
+            GROUP BY processing_status
+            HAVING SUM(count) <> 0
+            RETURNING processing_status, count
+        )
+        SELECT processing_status, count FROM summed
+    """,
+    'daemon_status_counts_scan': """
+        SELECT processing_status, COUNT(*)
+        FROM noggin_data
+        GROUP BY processing_status
+    """,
+}
+
+
+def status_counts_available(db_manager: DatabaseConnectionManager) -> bool:
+    """
+    Check whether the trigger-maintained noggin_status_counts table exists
+    
+    Args:
+        db_manager: DatabaseConnectionManager instance
+        
+    Returns:
+        True if the summary table exists, False otherwise
+    """
+    try:
+        result = db_manager.execute_query("SELECT to_regclass('noggin_status_counts') IS NOT NULL")
+        return bool(result and result[0][0])
+    except Exception as e:
+        logger.warning(f"Could not check for noggin_status_counts: {e}")
+        return False
+
+
+def get_processing_statistics(db_manager: DatabaseConnectionManager,
+                              use_summary: bool = True) -> Dict[str, int]:
     """
     Get current processing statistics from database
     
+    Reads the trigger-maintained noggin_status_counts summary when it exists
+    (checked once at startup, see status_counts_available) and otherwise counts
+    noggin_data directly. Both are prepared statements (see STATS_QUERIES).
+    
     Args:
         db_manager: DatabaseConnectionManager instance
+        use_summary: Read noggin_status_counts instead of scanning noggin_data
         
     Returns:
         Dictionary with counts by processing_status
     """
+    query_name = 'daemon_status_counts' if use_summary else 'daemon_status_counts_scan'
     try:
-        stats_query = """
-            SELECT 
-                processing_status,
-                COUNT(*) as count
-            FROM noggin_data
-            GROUP BY processing_status
-        """
-        results = db_manager.execute_query_dict(stats_query)
-        
-        stats = {row['processing_status']: row['count'] for row in results}
-        return stats
-        
+        results = db_manager.execute_prepared(query_name)
     except Exception as e:
         logger.error(f"Failed to get processing statistics: {e}")
         return {}
+    
+    return {status: count for status, count in results if count}
+
 
 def run_sftp_download_cycle(config, db_manager) -> dict:
     """
@@ -216,11 +297,73 @@ def run_sftp_download_cycle(config, db_manager) -> dict:
         logger.error(f"SFTP download cycle failed: {e}", exc_info=True)
         return {'status': 'error', 'total_inserted': 0, 'total_duplicates': 0, 'total_errors': 1}
 
+def open_listener(db_manager: DatabaseConnectionManager, quiet: bool = False) -> Optional[Any]:
+    """
+    LISTEN on NEW_TIP_CHANNEL, or return None if the database is unavailable
+    
+    Args:
+        db_manager: DatabaseConnectionManager instance
+        quiet: Log a failure at debug level (retries after the first attempt)
+        
+    Returns:
+        Listening connection, or None (the daemon falls back to timed polling)
+    """
+    try:
+        listen_conn = db_manager.listen(NEW_TIP_CHANNEL)
+        logger.info(f"Listening for {NEW_TIP_CHANNEL} notifications")
+        return listen_conn
+    except Exception as e:
+        message = f"LISTEN {NEW_TIP_CHANNEL} failed, using timed polling only: {e}"
+        if quiet:
+            logger.debug(message)
+        else:
+            logger.warning(message)
+        return None
+
+
+def wait_for_next_cycle(db_manager: DatabaseConnectionManager, listen_conn: Optional[Any],
+                        wakeup_fd: int, timeout: float) -> Tuple[bool, Optional[Any]]:
+    """
+    Wait until new TIPs are announced, shutdown is requested or the timeout expires
+    
+    With a LISTEN connection the wait ends on a new_tip NOTIFY; without one
+    (LISTEN unavailable) it is a plain timed wait. If the listening connection
+    breaks (e.g. the database restarts) it is discarded and the rest of the
+    wait is timed; main() listens again on a later cycle.
+    
+    Args:
+        db_manager: DatabaseConnectionManager instance
+        listen_conn: Connection listening on NEW_TIP_CHANNEL, or None
+        wakeup_fd: Read end of the signal wakeup pipe
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        Tuple of (True if woken by a notification, listening connection or None)
+    """
+    if listen_conn is None:
+        _shutdown_event.wait(timeout=timeout)
+        return False, None
+    
+    wait_start = time.monotonic()
+    try:
+        # A signal writes to wakeup_fd, so the select also returns on SIGTERM/SIGINT
+        return db_manager.wait_for_notify(listen_conn, timeout, extra_fds=(wakeup_fd,)), listen_conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError, OSError) as e:
+        logger.warning(f"LISTEN connection lost, falling back to timed polling: {e}")
+        try:
+            db_manager.return_connection(listen_conn, close_conn=True)
+        except Exception as close_error:
+            logger.debug(f"Could not return broken LISTEN connection: {close_error}")
+        _shutdown_event.wait(timeout=max(0.0, timeout - (time.monotonic() - wait_start)))
+        return False, None
+
+
 def main() -> int:
     """Main entry point for continuous processor"""
 
     global shutdown_requested, logger
     shutdown_requested = False
+    _shutdown_event.clear()
     
     # Initialize logger after configuration
     logger = logging.getLogger(__name__)
@@ -228,6 +371,13 @@ def main() -> int:
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
+    # Signals also write a byte to this pipe so a select() wait returns at once
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_w, False)
+    signal.set_wakeup_fd(wakeup_w)
+    listen_conn = None
+    background: Optional[ThreadPoolExecutor] = None
+    
     try:
         config = ConfigLoader(
             'config/base.ini',
@@ -237,12 +387,11 @@ def main() -> int:
         logger_manager = LoggerManager(config, script_name='nobbie_daemon')
         logger_manager.configure_application_logger()
         
-        cycle_sleep = config.getint('continuous', 'cycle_sleep_seconds')
-        csv_import_frequency = config.getint('continuous', 'import_csv_every_n_cycles')
-        sftp_download_frequency = config.getint('continuous', 'sftp_download_every_n_cycles', fallback=6)
-        
-        # New configuration for hash resolution
-        hash_resolution_frequency = config.getint('continuous', 'resolve_hashes_every_n_cycles', fallback=10)
+        loop_config = LoopConfig.from_config(config)
+        cycle_sleep = loop_config.cycle_sleep
+        csv_import_frequency = loop_config.csv_import_frequency
+        sftp_download_frequency = loop_config.sftp_download_frequency
+        hash_resolution_frequency = loop_config.hash_resolution_frequency
         
         logger.info("Noggin Continuous Processor started")
         logger.info(f"Configuration:")
@@ -252,6 +401,35 @@ def main() -> int:
         logger.info(f"  - SFTP download frequency: every {sftp_download_frequency} cycles")
         
         db_manager = DatabaseConnectionManager(config)
+        hash_manager = HashManager(config, db_manager)
+        csv_importer = CSVImporter(config, db_manager)
+        for name, query in STATS_QUERIES.items():
+            db_manager.register_prepared(name, query)
+        use_status_counts = status_counts_available(db_manager)
+        if not use_status_counts:
+            logger.info("noggin_status_counts not found; statistics will count noggin_data each cycle")
+        
+        # Connections that can be in use at once: LISTEN, the main thread (statistics,
+        # hash resolution), each processing worker, each CSV import worker and SFTP import
+        connections_needed = 3 + loop_config.processing_workers + csv_importer.max_workers
+        if db_manager.max_connections < connections_needed:
+            logger.warning(
+                f"pool_max_connections = {db_manager.max_connections} is below the {connections_needed} "
+                f"connections this daemon can use at once; cycles will wait for free connections"
+            )
+        
+        # New TIPs wake the loop early, so the side cycles are scheduled by
+        # elapsed time (N cycles x cycle sleep) rather than by cycle count
+        listen_conn = open_listener(db_manager)
+        
+        started = time.monotonic()
+        last_sftp_download = last_csv_import = last_hash_resolution = started
+        
+        # SFTP download and CSV import are network/file bound, so they run on
+        # worker threads (the connection pool is thread-safe) while TIPs are processed
+        background = ThreadPoolExecutor(max_workers=2, thread_name_prefix='nobbie-cycle')
+        sftp_future: Optional[Future] = None
+        csv_future: Optional[Future] = None
         
         cycle_count = 0
         total_processed = 0
@@ -263,30 +441,45 @@ def main() -> int:
             logger.info(f"CYCLE {cycle_count}")
             logger.info(f"{'='*80}")
 
-            # Run SFTP download cycle (every N cycles)
-            if cycle_count % sftp_download_frequency == 0:
-                sftp_result = run_sftp_download_cycle(config, db_manager)
+            # Collect background SFTP/CSV cycles that finished since the last cycle
+            if sftp_future is not None and sftp_future.done():
+                sftp_result = sftp_future.result()
+                sftp_future = None
                 # Optionally track statistics
                 if sftp_result.get('total_inserted', 0) > 0:
                     logger.info(f"SFTP: Added {sftp_result['total_inserted']} new TIPs to queue")
             
-            # Run CSV import cycle (every N cycles)
-            if cycle_count % csv_import_frequency == 0:
-                import_result = run_csv_import_cycle(config, db_manager)
+            if csv_future is not None and csv_future.done():
+                import_result = csv_future.result()
+                csv_future = None
                 total_processed += import_result['total_imported']
             
+            now = time.monotonic()
+            
+            # Start SFTP download cycle in the background (every N cycles, one at a time)
+            if sftp_future is None and now - last_sftp_download >= sftp_download_frequency * cycle_sleep:
+                last_sftp_download = now
+                sftp_future = background.submit(run_sftp_download_cycle, config, db_manager)
+            
+            # Start CSV import cycle in the background (every N cycles, one at a time)
+            if csv_future is None and now - last_csv_import >= csv_import_frequency * cycle_sleep:
+                last_csv_import = now
+                csv_future = background.submit(run_csv_import_cycle, csv_importer)
+            
+            # Hash resolution stays on this thread, between processing cycles
             # Run hash resolution cycle (every N cycles)
-            if cycle_count % hash_resolution_frequency == 0:
-                resolved = run_hash_resolution_cycle(config, db_manager)
+            if now - last_hash_resolution >= hash_resolution_frequency * cycle_sleep:
+                last_hash_resolution = now
+                resolved = run_hash_resolution_cycle(hash_manager)
                 if resolved > 0:
                     logger.info(f"Resolved {resolved} previously unknown hashes")
 
             
             # Run main processing cycle
-            cycle_result = run_single_processing_cycle(config, db_manager)
+            cycle_result = run_single_processing_cycle(loop_config, db_manager, hash_manager)
             
-            # Get current statistics
-            stats = get_processing_statistics(db_manager)
+            # Re-read every cycle: imports and external tools also change noggin_data
+            stats = get_processing_statistics(db_manager, use_status_counts)
             logger.info(f"\nCurrent Statistics:")
             for status, count in sorted(stats.items()):
                 logger.info(f"  {status}: {count}")
@@ -296,13 +489,18 @@ def main() -> int:
                 logger.info("Shutdown requested, exiting...")
                 break
             
-            logger.info(f"\nSleeping for {cycle_sleep} seconds...")
+            logger.info(f"\nSleeping for up to {cycle_sleep} seconds...")
+            
+            if listen_conn is None:
+                # Listening failed at startup or the connection was lost; try again
+                listen_conn = open_listener(db_manager, quiet=True)
+            
+            woken, listen_conn = wait_for_next_cycle(db_manager, listen_conn, wakeup_r, cycle_sleep)
+            if woken:
+                logger.info("New TIPs queued, starting next cycle")
             
-            # Sleep in 1-second intervals to allow responsive shutdown
-            for _ in range(cycle_sleep):
-                if shutdown_requested:
-                    break
-                time.sleep(1)
+            if shutdown_requested:
+                break
         
         logger.info("="*80)
         logger.info("Continuous processor shutdown complete")
@@ -319,7 +517,16 @@ def main() -> int:
         logger.error(f"Fatal error in continuous processor: {e}", exc_info=True)
         return 1
     finally:
+        if background is not None:
+            # Let a running download/import finish before the pool is closed
+            background.shutdown(wait=True)
+        signal.set_wakeup_fd(-1)
+        os.close(wakeup_r)
+        os.close(wakeup_w)
+        nobbie_process.close_processors()
         if 'db_manager' in locals():
+            if listen_conn is not None:
+                db_manager.return_connection(listen_conn, close_conn=True)
             db_manager.close_all()
 
 
@@ -15,12 +15,37 @@ import sys
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
-
-from tabulate import tabulate
+from typing import Optional, Sequence, Any
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+SEARCH_LIMIT: int = 50
+
+# Listable lookup types, in display order ('unknown' is only shown in stats)
+LOOKUP_TYPES: tuple[str, ...] = ('vehicle', 'trailer', 'team', 'department', 'uhf')
+
+
+def _simple_table(rows: Sequence[Sequence[Any]], headers: Sequence[str]) -> str:
+    """
+    Render rows as a plain text table (same layout as tabulate's 'simple' format)
+    
+    Column widths come from one pass over the cells; numeric columns are
+    right-aligned, everything else left-aligned.
+    """
+    cells = [[str(c) for c in row] for row in rows]
+    widths = [max([len(h)] + [len(row[i]) for row in cells]) for i, h in enumerate(headers)]
+    numeric = [bool(rows) and all(isinstance(row[i], (int, float)) for row in rows)
+               for i in range(len(headers))]
+    
+    def render(row: Sequence[str]) -> str:
+        return '  '.join(
+            c.rjust(w) if num else c.ljust(w) for c, w, num in zip(row, widths, numeric)
+        ).rstrip()
+    
+    lines = [render(headers), '  '.join('-' * w for w in widths)]
+    lines.extend(render(row) for row in cells)
+    return '\n'.join(lines)
+
 
 def cmd_stats(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
     """Display hash statistics"""
@@ -38,7 +63,7 @@ def cmd_stats(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
         print("-" * 40)
         
         table_data = []
-        for lookup_type in ['vehicle', 'trailer', 'team', 'department', 'uhf', 'unknown']:
+        for lookup_type in (*LOOKUP_TYPES, 'unknown'):
             type_stats = stats.get(lookup_type, {})
             count = type_stats.get('count', 0) if isinstance(type_stats, dict) else 0
             
@@ -46,7 +71,7 @@ def cmd_stats(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
                 table_data.append([lookup_type.capitalize(), count])
         
         if table_data:
-            print(tabulate(table_data, headers=['Type', 'Count'], tablefmt='simple'))
+            print(_simple_table(table_data, headers=['Type', 'Count']))
         
         print(f"\nTotal: {stats.get('total', 0)}")
         
@@ -57,7 +82,7 @@ def cmd_stats(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
             print("-" * 40)
             
             source_data = [[source, count] for source, count in sorted(by_source.items())]
-            print(tabulate(source_data, headers=['Source Type', 'Count'], tablefmt='simple'))
+            print(_simple_table(source_data, headers=['Source Type', 'Count']))
         
         # Cache stats
         cache_stats = hash_manager.get_cache_stats()
@@ -80,33 +105,28 @@ def cmd_search(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
     logger.info(f"Searching for: {search_term}")
     
     try:
-        results = hash_manager.search_hash(search_term)
+        results = hash_manager.search_hash(search_term, limit=SEARCH_LIMIT)
         
         if not results:
             print(f"\nNo results found for: {search_term}")
             return 0
         
-        print(f"\nSEARCH RESULTS ({len(results)} found):")
-        print("=" * 80)
-        
-        table_data = []
-        for r in results:
-            table_data.append([
-                r['lookup_type'].capitalize(),
-                r['source_type'] or '-',
-                r['resolved_value'],
-                r['tip_hash'][:20] + '...'
-            ])
+        table_data = [
+            [lookup_type.capitalize(), source_type or '-', resolved_value, f"{tip_hash:.20}..."]
+            for lookup_type, source_type, resolved_value, tip_hash in results
+        ]
         
-        print(tabulate(
-            table_data,
-            headers=['Type', 'Source', 'Name', 'Hash (truncated)'],
-            tablefmt='simple'
-        ))
+        # Build the whole report and write it once
+        lines = [
+            f"\nSEARCH RESULTS ({len(results)} found):",
+            "=" * 80,
+            _simple_table(table_data, headers=['Type', 'Source', 'Name', 'Hash (truncated)'])
+        ]
         
-        if len(results) >= 50:
-            print("\n(Results limited to 50. Refine your search for more specific results.)")
+        if len(results) >= SEARCH_LIMIT:
+            lines.append(f"\n(Results limited to {SEARCH_LIMIT}. Refine your search for more specific results.)")
         
+        print('\n'.join(lines))
         return 0
         
     except Exception as e:
@@ -151,35 +171,38 @@ def cmd_list_type(args: argparse.Namespace, hash_manager: 'HashManager') -> int:
     logger.info(f"Listing all {lookup_type} entries")
     
     try:
-        results = hash_manager.get_by_type(lookup_type)
+        # Fetch one row past the page to know whether more exist without counting
+        results = hash_manager.get_by_type(lookup_type, limit=args.limit + 1, offset=args.offset)
+        has_more = len(results) > args.limit
+        results = results[:args.limit]
         
         if not results:
             print(f"\nNo {lookup_type} entries found")
             return 0
         
-        print(f"\n{lookup_type.upper()} ENTRIES ({len(results)} total):")
-        print("=" * 80)
-        
-        # Apply limit
-        display_results = results[:args.limit]
+        if args.count:
+            title = f"\n{lookup_type.upper()} ENTRIES ({hash_manager.count_by_type(lookup_type)} total):"
+        else:
+            title = f"\n{lookup_type.upper()} ENTRIES:"
         
-        table_data = []
-        for r in display_results:
-            table_data.append([
-                r['resolved_value'],
-                r['source_type'] or '-',
-                r['tip_hash'][:24] + '...'
-            ])
+        table_data = [
+            [resolved_value, source_type or '-', f"{tip_hash:.24}..."]
+            for resolved_value, source_type, tip_hash in results
+        ]
         
-        print(tabulate(
-            table_data,
-            headers=['Name', 'Source Type', 'Hash (truncated)'],
-            tablefmt='simple'
-        ))
+        # Build the whole listing and write it once
+        lines = [
+            title,
+            "=" * 80,
+            _simple_table(table_data, headers=['Name', 'Source Type', 'Hash (truncated)'])
+        ]
         
-        if len(results) > args.limit:
-            print(f"\n(Showing {args.limit} of {len(results)}. Use --limit to see more.)")
+        if has_more:
+            first = args.offset + 1
+            lines.append(f"\n(Showing {first}-{args.offset + len(results)}. "
+                         f"Use --offset {args.offset + len(results)} for the next page.)")
         
+        print('\n'.join(lines))
         return 0
         
     except Exception as e:
@@ -211,6 +234,9 @@ Examples:
     
     # List all trailers (first 100)
     python manage_hashes.py list trailer --limit 100
+    
+    # Next 100 trailers, with the total count
+    python manage_hashes.py list trailer --limit 100 --offset 100 --count
 
 Note: For importing/syncing hash data, use nobbie_sync.py instead.
         """
@@ -232,10 +258,14 @@ Note: For importing/syncing hash data, use nobbie_sync.py instead.
     # List command
     list_parser = subparsers.add_parser('list', help='List all entries of a type')
     list_parser.add_argument('lookup_type', 
-                            choices=['vehicle', 'trailer', 'team', 'department', 'uhf'],
+                            choices=LOOKUP_TYPES,
                             help='Lookup type to list')
     list_parser.add_argument('--limit', type=int, default=50, 
                             help='Maximum results to show (default: 50)')
+    list_parser.add_argument('--offset', type=int, default=0,
+                            help='Number of entries to skip (default: 0)')
+    list_parser.add_argument('--count', action='store_true',
+                            help='Also show the total number of entries of the type')
     
     args = parser.parse_args()
     
@@ -26,9 +26,13 @@ Master location:
 import sys
 import argparse
 import logging
+import threading
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, Tuple
 
-from processors import ObjectProcessor
+from processors import ObjectProcessor, DatabaseRecordManager
 from common.object_types import OBJECT_TYPES
 
 logger = logging.getLogger(__name__)
@@ -172,5 +176,189 @@ def process_object_type(object_type: str, csv_path: str = None,
     )
 
 
+# Processors kept alive between in-process runs (see run), keyed by object type;
+# the lock serialises creation when object types run on worker threads
+_processors: Dict[str, ObjectProcessor] = {}
+_processors_lock: threading.Lock = threading.Lock()
+_stop_requested: bool = False
+
+
+def get_processor(object_type: str, db_manager: 'DatabaseConnectionManager',
+                  base_config_path: str = 'config/base.ini',
+                  hash_manager: Optional['HashManager'] = None) -> ObjectProcessor:
+    """
+    Return the embedded processor for an object type, creating it on first use
+
+    The processor shares the caller's db_manager (and hash_manager, if given)
+    and keeps its parsed config and API client for later runs.
+    """
+    with _processors_lock:
+        processor = _processors.get(object_type)
+        if processor is None:
+            processor = ObjectProcessor(
+                base_config_path=base_config_path,
+                specific_config_path=CONFIG_FILES[object_type],
+                db_manager=db_manager,
+                hash_manager=hash_manager
+            )
+            _processors[object_type] = processor
+    return processor
+
+
+def close_processors() -> None:
+    """
+    Drop the embedded processors (daemon shutdown)
+
+    They hold no connections of their own (the pool belongs to the caller's
+    db_manager), so releasing them only frees their configs and clients.
+    """
+    with _processors_lock:
+        _processors.clear()
+
+
+def stop_processing() -> None:
+    """Ask an in-progress run to stop after the current TIP (safe from signal handlers and timers)"""
+    global _stop_requested
+    _stop_requested = True
+    # No lock here (this runs in signal handlers); list() copies the values
+    # in one step, so a processor being added by a worker cannot break the loop
+    for processor in list(_processors.values()):
+        processor.shutdown_handler.request_shutdown()
+
+
+def _run_object_type(object_type: str, db_manager: 'DatabaseConnectionManager',
+                     batch_size: int, base_config_path: str,
+                     hash_manager: Optional['HashManager']) -> int:
+    """Process the queue for one object type; returns the number of TIPs processed"""
+    if _stop_requested:
+        return 0
+
+    processor = get_processor(object_type, db_manager, base_config_path, hash_manager)
+    if _stop_requested:
+        return 0
+    return processor.run(batch_size=batch_size, from_database=True)
+
+
+@lru_cache(maxsize=None)
+def configured_object_types() -> Tuple[str, ...]:
+    """
+    Object types whose config file exists, checked once per process
+
+    The config layout does not change while the daemon runs, so run() does
+    not stat every config file again each cycle.
+    """
+    object_types = []
+    for object_type, config_file in CONFIG_FILES.items():
+        if Path(config_file).exists():
+            object_types.append(object_type)
+        else:
+            logger.debug(f"Config file not found, skipping {object_type}: {config_file}")
+    return tuple(object_types)
+
+
+def plan_batches(backlog: Dict[str, int], batch_size: int) -> Dict[str, int]:
+    """
+    Size each object type's queue fetch by its share of the total backlog
+
+    Every type with work gets at least batch_size TIPs per fetch; types
+    holding most of the backlog get proportionally larger fetches (capped at
+    batch_size times the number of busy types) and so poll the queue less often.
+
+    Args:
+        backlog: Object type -> eligible TIPs (types with none are skipped)
+        batch_size: Minimum fetch size
+
+    Returns:
+        Dictionary of object type -> fetch size, busiest type first
+    """
+    busy = {object_type: count for object_type, count in backlog.items() if count > 0}
+    total = sum(busy.values())
+    budget = batch_size * len(busy)
+
+    return {
+        object_type: max(batch_size, min(count, budget * count // total))
+        for object_type, count in sorted(busy.items(), key=lambda item: item[1], reverse=True)
+    }
+
+
+def run(db_manager: 'DatabaseConnectionManager', batch_size: int = 10,
+        timeout: Optional[float] = None,
+        base_config_path: str = 'config/base.ini',
+        max_workers: int = 1,
+        hash_manager: Optional['HashManager'] = None) -> Dict[str, int]:
+    """
+    Process the database queue for every configured object type in this process
+
+    Used by nobbie_daemon instead of starting a new interpreter per cycle.
+    Object types without a config file or without queued TIPs are skipped.
+    Object types are independent and mostly wait on the API, so up to
+    max_workers of them are processed at once, sharing the connection pool;
+    the busiest types start first with larger fetches (see plan_batches).
+
+    Args:
+        db_manager: Shared DatabaseConnectionManager
+        batch_size: Minimum batch size when fetching TIPs from the queue
+        timeout: Seconds after which processing stops after the current TIP (optional)
+        base_config_path: Path to base config file
+        max_workers: Number of object types processed concurrently
+        hash_manager: Shared HashManager (optional); otherwise each processor creates its own
+
+    Returns:
+        Dictionary of object type -> number of TIPs processed
+    """
+    global _stop_requested
+    _stop_requested = False
+    for processor in list(_processors.values()):
+        processor.shutdown_handler.reset()
+
+    timer: Optional[threading.Timer] = None
+    if timeout:
+        timer = threading.Timer(timeout, stop_processing)
+        timer.daemon = True
+        timer.start()
+
+    backlog: Dict[str, int] = {}
+    queued = DatabaseRecordManager.count_tips_to_process(db_manager)
+    for object_type in configured_object_types():
+        if not queued.get(object_type):
+            logger.debug(f"No TIPs queued, skipping {object_type}")
+        else:
+            backlog[object_type] = queued[object_type]
+
+    batches = plan_batches(backlog, batch_size)
+    if batches:
+        logger.info("Queued TIPs: " + ', '.join(
+            f"{object_type}={backlog[object_type]} (batch {size})" for object_type, size in batches.items()
+        ))
+
+    processed: Dict[str, int] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches) or 1)),
+                                thread_name_prefix='nobbie-process') as executor:
+            futures = {
+                executor.submit(_run_object_type, object_type, db_manager, size,
+                                base_config_path, hash_manager): object_type
+                for object_type, size in batches.items()
+            }
+
+            for future in as_completed(futures):
+                object_type = futures[future]
+                try:
+                    processed[object_type] = future.result()
+                except Exception as e:
+                    logger.error(f"Processing {object_type} failed: {e}", exc_info=True)
+                    processed[object_type] = 0
+
+                if _stop_requested:
+                    # Types not yet started are dropped; running ones stop after their current TIP
+                    for pending in futures:
+                        pending.cancel()
+    finally:
+        if timer:
+            timer.cancel()
+
+    return processed
+
+
 if __name__ == "__main__":
     sys.exit(main())
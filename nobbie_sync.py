@@ -17,17 +17,23 @@ Usage:
 
 from __future__ import annotations
 import argparse
+import csv
+import hashlib
 import json
 import logging
+import os
 import re
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple, Any
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, Any, Iterator
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -55,6 +61,54 @@ ASSET_TYPE_MAPPING: dict[str, str] = {
     'UHF': 'uhf',
 }
 
+# Columns written by sync_to_database (created_at/updated_at use table defaults)
+HASH_LOOKUP_COLUMNS: tuple[str, ...] = ('tip_hash', 'lookup_type', 'resolved_value', 'source_type')
+INSERT_PAGE_SIZE: int = 5000
+
+UPSERT_CONFLICT_CLAUSE: str = """
+    ON CONFLICT (tip_hash) DO UPDATE SET
+        lookup_type = EXCLUDED.lookup_type,
+        resolved_value = EXCLUDED.resolved_value,
+        source_type = EXCLUDED.source_type,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+UPSERT_QUERY: str = f"""
+    INSERT INTO hash_lookup ({', '.join(HASH_LOOKUP_COLUMNS)})
+    VALUES %s
+    {UPSERT_CONFLICT_CLAUSE}
+"""
+
+STAGED_UPSERT_QUERY: str = f"""
+    INSERT INTO hash_lookup ({', '.join(HASH_LOOKUP_COLUMNS)})
+    SELECT {', '.join(HASH_LOOKUP_COLUMNS)} FROM hash_lookup_staging
+    {UPSERT_CONFLICT_CLAUSE}
+"""
+
+# SSH window / packet sizes for SFTP export downloads
+SFTP_WINDOW_SIZE: int = 4 * 1024 * 1024
+SFTP_MAX_PACKET_SIZE: int = 32 * 1024
+
+# Columns read from the Noggin exports and rows parsed per chunk
+ASSET_EXPORT_COLUMNS: list[str] = ['nogginId', 'assetName', 'assetType']
+SITE_EXPORT_COLUMNS: list[str] = ['nogginId', 'siteName', 'goldstarId', 'siteType']
+EXPORT_CHUNK_SIZE: int = 50_000
+EXPORT_BLOCK_SIZE: int = 16 * 1024 * 1024
+# Read size for export signatures where hashlib.file_digest is unavailable (Python < 3.11)
+SIGNATURE_CHUNK_SIZE: int = 1024 * 1024
+
+# Header columns that identify each export type in detect_file_type
+ASSET_MARKER_COLUMNS: frozenset[str] = frozenset({'assetType', 'assetName'})
+SITE_MARKER_COLUMNS: frozenset[str] = frozenset({'siteType', 'siteName'})
+# Whole words in a filename used by detect_file_type when the header is ambiguous
+ASSET_FILENAME_WORDS: frozenset[str] = frozenset({'asset', 'assets'})
+SITE_FILENAME_WORDS: frozenset[str] = frozenset({'site', 'sites'})
+
+# Minimum number of reports before regeneration is spread over a process pool
+REGENERATION_POOL_THRESHOLD: int = 32
+# Worker processes used for report regeneration (each holds one database connection)
+REGENERATION_MAX_WORKERS: int = 4
+
 # Mapping from Noggin siteType to lookup_type (trusts Noggin's classification)
 SITE_TYPE_MAPPING: dict[str, str] = {
     'team': 'team',
@@ -64,6 +118,32 @@ SITE_TYPE_MAPPING: dict[str, str] = {
     'virtualforreporting': 'department',
 }
 
+# Characters dropped to build the compact siteType key (e.g. 'virtual (for reporting)'
+# -> 'virtualforreporting'); compiled once for the scalar and vectorised paths
+SITE_TYPE_COMPACT_RE: re.Pattern[str] = re.compile(r'[ ()]')
+
+# source_type for the raw type values Noggin exports, so format_source_type can
+# skip the string manipulation for them
+KNOWN_SOURCE_TYPES: dict[str, str] = {
+    'PRIME MOVER': 'PrimeMover',
+    'RIGID': 'Rigid',
+    'VEHICLE': 'Vehicle',
+    'LIGHT VEHICLE': 'LightVehicle',
+    'FORKLIFT': 'Forklift',
+    'TRAILER': 'Trailer',
+    'DROPDECK': 'Dropdeck',
+    'DOLLY': 'Dolly',
+    'UHF': 'Uhf',
+    'uhf': 'Uhf',
+    'team': 'Team',
+    'Team': 'Team',
+    'businessUnit': 'BusinessUnit',
+    'Business Unit': 'BusinessUnit',
+    'virtualForReporting': 'VirtualForReporting',
+}
+
+UNDERSCORE_TO_SPACE: dict[int, str] = str.maketrans('_', ' ')
+
 
 def get_default_paths() -> dict[str, Path]:
     """
@@ -91,11 +171,18 @@ def determine_asset_lookup_type(asset_type: Optional[str]) -> str:
     like 'PRIME MOVER', 'TRAILER', 'uhf', etc. This function normalises these to
     broader categories used for filtering: vehicle, trailer, uhf, or unknown.
     """
+    import pandas as pd
+
     if not asset_type or pd.isna(asset_type):
         return 'unknown'
     
-    asset_type_upper = str(asset_type).strip().upper()
-    return ASSET_TYPE_MAPPING.get(asset_type_upper, 'unknown')
+    return _asset_lookup_type(str(asset_type))
+
+
+@lru_cache(maxsize=1024)
+def _asset_lookup_type(asset_type: str) -> str:
+    """Cached assetType -> lookup_type mapping (few distinct values, called per row)."""
+    return ASSET_TYPE_MAPPING.get(asset_type.strip().upper(), 'unknown')
 
 
 def format_source_type(raw_type: Optional[str]) -> str:
@@ -105,18 +192,29 @@ def format_source_type(raw_type: Optional[str]) -> str:
     Converts Noggin's raw type values (e.g., 'PRIME MOVER', 'businessUnit') into
     consistent CamelCase format (e.g., 'PrimeMover', 'BusinessUnit') for storage.
     """
+    import pandas as pd
+
     if not raw_type or pd.isna(raw_type):
         return 'Unknown'
     
-    raw_str = str(raw_type).strip()
+    return _camel_case_type(str(raw_type))
+
+
+@lru_cache(maxsize=1024)
+def _camel_case_type(raw_type: str) -> str:
+    """Cached CamelCase conversion behind format_source_type (few distinct values)."""
+    raw_str = raw_type.strip()
+    
+    known = KNOWN_SOURCE_TYPES.get(raw_str)
+    if known is not None:
+        return known
     
     # if camelCase already
-    if ' ' not in raw_str and raw_str[0].islower():
+    if ' ' not in raw_str and raw_str[:1].islower():
         return raw_str[0].upper() + raw_str[1:]
     
     # convert UPPER to Title or CamelCase
-    words = raw_str.replace('_', ' ').split()
-    return ''.join(word.capitalize() for word in words)
+    return ''.join(map(str.capitalize, raw_str.translate(UNDERSCORE_TO_SPACE).split()))
 
 
 def determine_site_lookup_type(site_name: str, site_type: Optional[str]) -> str:
@@ -129,6 +227,8 @@ def determine_site_lookup_type(site_name: str, site_type: Optional[str]) -> str:
     - 'Virtual (for reporting)' -> 'department'
     - Unknown/other -> 'unknown'
     """
+    import pandas as pd
+
     if not site_type or pd.isna(site_type):
         return 'unknown'
     
@@ -136,7 +236,7 @@ def determine_site_lookup_type(site_name: str, site_type: Optional[str]) -> str:
     site_type_normalised = str(site_type).strip().lower()
     
     # Remove spaces and parentheses for more flexible matching
-    site_type_compact = site_type_normalised.replace(' ', '').replace('(', '').replace(')', '')
+    site_type_compact = SITE_TYPE_COMPACT_RE.sub('', site_type_normalised)
     
     # Check mapping
     if site_type_normalised in SITE_TYPE_MAPPING:
@@ -162,6 +262,8 @@ def format_site_resolved_value(
     
     If goldstar_id is missing/empty, returns just the site name regardless of flag.
     """
+    import pandas as pd
+
     name = str(site_name).strip() if site_name and not pd.isna(site_name) else 'Unknown'
     
     prefix_with_id = config.getboolean('csv_import', 'prefix_site_with_goldstar_id', fallback=True)
@@ -173,142 +275,237 @@ def format_site_resolved_value(
     return name
 
 
+def read_csv_header(csv_path: Path) -> list[str]:
+    """Read just the header row of a CSV file (BOM-tolerant)."""
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def _file_type_from_name(csv_path: Path) -> Optional[str]:
+    """Return 'asset' or 'site' if the filename names exactly one as a whole word."""
+    words = set(re.split(r'[^a-z]+', csv_path.stem.lower()))
+    named_asset = not words.isdisjoint(ASSET_FILENAME_WORDS)
+    named_site = not words.isdisjoint(SITE_FILENAME_WORDS)
+    
+    if named_asset != named_site:
+        return 'asset' if named_asset else 'site'
+    return None
+
+
 def detect_file_type(csv_path: Path) -> Optional[str]:
     """
     Detect whether a CSV file is an asset export or site export.
     
-    Reads the header row and looks for distinctive columns:
+    The header row is authoritative and checked for distinctive columns:
     - 'assetType' or 'assetName' indicates asset export
     - 'siteType' or 'siteName' indicates site export
     
+    Only when the header matches neither or both does the filename decide,
+    and then only if it names exactly one of 'asset(s)' or 'site(s)' as a
+    whole word (so e.g. 'website_assets.csv' is still an asset export).
+    
     Returns 'asset', 'site', or None if indeterminate.
     """
     try:
-        df = pd.read_csv(csv_path, nrows=0, encoding='utf-8-sig')
-        columns = set(df.columns)
-        
-        if 'assetType' in columns or 'assetName' in columns:
-            return 'asset'
-        
-        if 'siteType' in columns or 'siteName' in columns:
-            return 'site'
-        
-        logger.warning(f"Could not determine file type for {csv_path.name}. Columns: {columns}")
-        return None
-        
+        columns = set(read_csv_header(csv_path))
     except Exception as e:
         logger.error(f"Error reading {csv_path}: {e}")
         return None
+    
+    header_asset = not columns.isdisjoint(ASSET_MARKER_COLUMNS)
+    header_site = not columns.isdisjoint(SITE_MARKER_COLUMNS)
+    
+    if header_asset != header_site:
+        return 'asset' if header_asset else 'site'
+    
+    file_type = _file_type_from_name(csv_path)
+    if file_type is None:
+        logger.warning(f"Could not determine file type for {csv_path.name}. Columns: {columns}")
+    return file_type
 
 
-def load_asset_export(csv_path: Path) -> pd.DataFrame:
+def read_export_csv(csv_path: Path, columns: list[str], label: str) -> Iterator[pd.DataFrame]:
     """
-    Load and validate asset export CSV.
+    Stream a Noggin export CSV as DataFrame chunks of the required columns.
     
-    Expects columns: nogginId, assetName, assetType (at minimum).
-    """
-    logger.info(f"Loading asset export from {csv_path}")
+    The header is checked for the required columns up front. Only those
+    columns are parsed, as strings, so no type inference runs and peak memory
+    is bounded by the chunk size rather than the file size.
     
-    df = pd.read_csv(csv_path, encoding='utf-8-sig')
+    When pyarrow is installed its multithreaded streaming reader is used
+    (one chunk per EXPORT_BLOCK_SIZE bytes); otherwise the pandas C parser
+    reads EXPORT_CHUNK_SIZE rows at a time.
+    """
+    import pandas as pd
     
-    required_columns = ['nogginId', 'assetName', 'assetType']
-    missing = [col for col in required_columns if col not in df.columns]
+    header = read_csv_header(csv_path)
+    missing = [col for col in columns if col not in header]
     
     if missing:
-        raise ValueError(f"Asset CSV missing required columns: {missing}")
+        raise ValueError(f"{label} CSV missing required columns: {missing}")
     
-    logger.info(f"Loaded {len(df)} asset records")
-    return df
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(
+            csv_path,
+            encoding='utf-8-sig',
+            usecols=columns,
+            dtype=str,
+            chunksize=EXPORT_CHUNK_SIZE
+        )
+    
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=EXPORT_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={col: pa.string() for col in columns}
+        )
+    )
+    return (batch.to_pandas() for batch in reader)
 
 
-def load_site_export(csv_path: Path) -> pd.DataFrame:
+def load_asset_export(csv_path: Path) -> Iterator[pd.DataFrame]:
     """
-    Load and validate site export CSV.
+    Load and validate asset export CSV as an iterator of DataFrame chunks.
+    
+    Expects columns: nogginId, assetName, assetType (at minimum).
+    """
+    logger.info(f"Loading asset export from {csv_path}")
+    return read_export_csv(csv_path, ASSET_EXPORT_COLUMNS, 'Asset')
+
+
+def load_site_export(csv_path: Path) -> Iterator[pd.DataFrame]:
+    """
+    Load and validate site export CSV as an iterator of DataFrame chunks.
     
     Expects columns: nogginId, siteName, goldstarId, siteType (at minimum).
     """
     logger.info(f"Loading site export from {csv_path}")
+    return read_export_csv(csv_path, SITE_EXPORT_COLUMNS, 'Site')
+
+
+def _clean_column(column: pd.Series) -> pd.Series:
+    """Normalise a column once: NA becomes '', values are stripped strings."""
+    return column.fillna('').astype(str).str.strip()
+
+
+def _format_source_types(raw_types: pd.Series) -> pd.Series:
+    """Apply format_source_type once per distinct raw type and map the results back."""
+    formatted = {raw: format_source_type(raw) for raw in raw_types.unique()}
+    return raw_types.map(formatted)
+
+
+def _asset_lookup_types(asset_types: pd.Series) -> pd.Series:
+    """Resolve ASSET_TYPE_MAPPING once per distinct assetType and map the results back."""
+    resolved = {raw: _asset_lookup_type(raw) for raw in asset_types.unique()}
+    return asset_types.map(resolved)
+
+
+def _records_frame(*columns: pd.Series) -> pd.DataFrame:
+    """Assemble hash_lookup record columns (in HASH_LOOKUP_COLUMNS order) into a DataFrame."""
+    import pandas as pd
     
-    df = pd.read_csv(csv_path, encoding='utf-8-sig')
-    
-    required_columns = ['nogginId', 'siteName', 'goldstarId', 'siteType']
-    missing = [col for col in required_columns if col not in df.columns]
-    
-    if missing:
-        raise ValueError(f"Site CSV missing required columns: {missing}")
-    
-    logger.info(f"Loaded {len(df)} site records")
-    return df
+    return pd.DataFrame(
+        {name: column.to_numpy() for name, column in zip(HASH_LOOKUP_COLUMNS, columns)}
+    )
+
 
+def concat_records(*frames: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate record frames (e.g. per-chunk or asset + site results)."""
+    import pandas as pd
+    
+    present = [frame for frame in frames if frame is not None]
+    if not present:
+        return pd.DataFrame(columns=list(HASH_LOOKUP_COLUMNS))
+    return pd.concat(present, ignore_index=True)
 
-def process_assets(df: pd.DataFrame) -> list[tuple[str, str, str, str]]:
+
+def process_assets(df: pd.DataFrame) -> pd.DataFrame:
     """
     Process asset DataFrame into hash_lookup records.
     
-    Returns list of (tip_hash, lookup_type, resolved_value, source_type) tuples.
+    Works column-wise: each column is cleaned once (NA -> '', stripped), rows
+    without a nogginId are dropped with a single mask, and names and types are
+    mapped with pandas string operations. No per-row NA checks remain.
+    
+    Returns a DataFrame with columns tip_hash, lookup_type, resolved_value, source_type.
     """
-    records = []
-    skipped = 0
+    tip_hashes = _clean_column(df['nogginId'])
+    has_hash = tip_hashes.ne('')
+    skipped = int((~has_hash).sum())
     
-    for _, row in df.iterrows():
-        tip_hash = row.get('nogginId')
-        asset_name = row.get('assetName')
-        asset_type = row.get('assetType')
-        
-        if not tip_hash or pd.isna(tip_hash):
-            skipped += 1
-            continue
-        
-        tip_hash = str(tip_hash).strip()
-        
-        if not asset_name or pd.isna(asset_name):
-            asset_name = 'Unknown'
-            logger.debug(f"Asset {tip_hash[:16]}... has no name, using 'Unknown'")
-        
-        resolved_value = str(asset_name).strip()
-        lookup_type = determine_asset_lookup_type(asset_type)
-        source_type = format_source_type(asset_type)
-        
-        if lookup_type == 'unknown':
-            logger.warning(f"Unknown asset type '{asset_type}' for {resolved_value} ({tip_hash[:16]}...)")
-        
-        records.append((tip_hash, lookup_type, resolved_value, source_type))
+    tip_hashes = tip_hashes[has_hash]
+    names = _clean_column(df['assetName'])[has_hash]
+    asset_types = _clean_column(df['assetType'])[has_hash]
+    
+    missing_name = names.eq('')
+    if missing_name.any():
+        logger.debug("%d assets have no name, using 'Unknown'", missing_name.sum())
+    resolved_values = names.mask(missing_name, 'Unknown')
+    
+    lookup_types = _asset_lookup_types(asset_types)
+    source_types = _format_source_types(asset_types)
+    
+    unknown_types = asset_types[lookup_types.eq('unknown')].value_counts()
+    for asset_type, count in unknown_types.items():
+        logger.warning(f"Unknown asset type '{asset_type}' for {count} asset(s)")
+    
+    records = _records_frame(tip_hashes, lookup_types, resolved_values, source_types)
     
     logger.info(f"Processed {len(records)} assets, skipped {skipped}")
     return records
 
 
-def process_sites(df: pd.DataFrame, config: 'ConfigLoader') -> list[tuple[str, str, str, str]]:
+def process_sites(df: pd.DataFrame, config: 'ConfigLoader') -> pd.DataFrame:
     """
     Process site DataFrame into hash_lookup records.
     
-    Returns list of (tip_hash, lookup_type, resolved_value, source_type) tuples.
+    Works column-wise: each column is cleaned once (NA -> '', stripped), rows
+    without a nogginId or siteName are dropped with a single mask, then the
+    resolved value and lookup type are built with masks and pandas string
+    operations (same rules as format_site_resolved_value and
+    determine_site_lookup_type).
+    
+    Returns a DataFrame with columns tip_hash, lookup_type, resolved_value, source_type.
     """
-    records = []
-    skipped = 0
-    
-    for _, row in df.iterrows():
-        tip_hash = row.get('nogginId')
-        site_name = row.get('siteName')
-        goldstar_id = row.get('goldstarId')
-        site_type = row.get('siteType')
-        
-        if not tip_hash or pd.isna(tip_hash):
-            skipped += 1
-            continue
-        
-        tip_hash = str(tip_hash).strip()
-        
-        if not site_name or pd.isna(site_name):
-            skipped += 1
-            logger.debug(f"Site {tip_hash[:16]}... has no name, skipping")
-            continue
-        
-        resolved_value = format_site_resolved_value(goldstar_id, site_name, config)
-        lookup_type = determine_site_lookup_type(site_name, site_type)
-        source_type = format_source_type(site_type)
-        
-        records.append((tip_hash, lookup_type, resolved_value, source_type))
+    tip_hashes = _clean_column(df['nogginId'])
+    names = _clean_column(df['siteName'])
+    has_hash = tip_hashes.ne('')
+    has_name = names.ne('')
+    
+    missing_name = int((has_hash & ~has_name).sum())
+    if missing_name:
+        logger.debug("%d sites have no name, skipping", missing_name)
+    
+    keep = has_hash & has_name
+    skipped = int((~keep).sum())
+    
+    tip_hashes = tip_hashes[keep]
+    names = names[keep]
+    site_types = _clean_column(df['siteType'])[keep]
+    
+    resolved_values = names
+    if config.getboolean('csv_import', 'prefix_site_with_goldstar_id', fallback=True):
+        goldstar_ids = _clean_column(df['goldstarId'])[keep]
+        resolved_values = names.mask(goldstar_ids.ne(''), goldstar_ids + ' - ' + names)
+    
+    normalised = site_types.str.lower()
+    compact = normalised.str.replace(SITE_TYPE_COMPACT_RE, '', regex=True)
+    lookup_types = (
+        normalised.map(SITE_TYPE_MAPPING)
+        .fillna(compact.map(SITE_TYPE_MAPPING))
+        .fillna('unknown')
+    )
+    source_types = _format_source_types(site_types)
+    
+    unknown_types = site_types[lookup_types.eq('unknown') & site_types.ne('')]
+    for site_type, count in unknown_types.value_counts().items():
+        logger.warning(f"Unknown site type: '{site_type}' for {count} site(s)")
+    
+    records = _records_frame(tip_hashes, lookup_types, resolved_values, source_types)
     
     logger.info(f"Processed {len(records)} sites, skipped {skipped}")
     return records
@@ -316,42 +513,77 @@ def process_sites(df: pd.DataFrame, config: 'ConfigLoader') -> list[tuple[str, s
 
 def sync_to_database(
     db_manager: 'DatabaseConnectionManager',
-    records: list[tuple[str, str, str, str]],
+    records: pd.DataFrame,
     truncate_first: bool = True
 ) -> int:
     """
     Sync records to hash_lookup table.
     
+    Records arrive as a columnar DataFrame (see process_assets/process_sites)
+    and are only turned into row tuples lazily while being sent.
+    
     When truncate_first is True (default), clears the table before inserting.
     This ensures the table exactly matches the authoritative source files.
+    The truncate and reload run in one transaction: the freshly emptied table
+    is bulk loaded with COPY. Without truncation the records are COPY'd into a
+    temporary staging table and upserted from there. If COPY fails, records are
+    upserted in pages of INSERT_PAGE_SIZE via execute_values_batch, which skips
+    individual bad rows instead of failing the whole load.
     """
-    if truncate_first:
-        logger.info("Truncating hash_lookup table")
-        db_manager.execute_update("TRUNCATE TABLE hash_lookup")
+    from common.database import copy_records
     
-    if not records:
+    # Keep the last record per hash, matching the ON CONFLICT DO UPDATE semantics
+    # (a single COPY or multi-row INSERT cannot touch the same key twice)
+    unique_records = records.drop_duplicates(subset='tip_hash', keep='last')
+    
+    def rows() -> Iterator[tuple[str, str, str, str]]:
+        return unique_records[list(HASH_LOOKUP_COLUMNS)].itertuples(index=False, name=None)
+    
+    if unique_records.empty:
+        if truncate_first:
+            logger.info("Truncating hash_lookup table")
+            db_manager.execute_update("TRUNCATE TABLE hash_lookup")
         logger.warning("No records to insert")
         return 0
     
-    logger.info(f"Inserting {len(records)} records into hash_lookup")
+    total = len(unique_records)
+    logger.info(f"Inserting {total} records into hash_lookup")
     
-    insert_query = """
-        INSERT INTO hash_lookup (tip_hash, lookup_type, resolved_value, source_type, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-        ON CONFLICT (tip_hash) DO UPDATE SET
-            lookup_type = EXCLUDED.lookup_type,
-            resolved_value = EXCLUDED.resolved_value,
-            source_type = EXCLUDED.source_type,
-            updated_at = CURRENT_TIMESTAMP
-    """
+    try:
+        with db_manager.get_cursor() as cur:
+            # The exports are authoritative and re-runnable, so don't wait on the WAL flush
+            cur.execute("SET LOCAL synchronous_commit TO OFF")
+            
+            if truncate_first:
+                logger.info("Truncating hash_lookup table")
+                cur.execute("TRUNCATE TABLE hash_lookup")
+                copy_records(cur, 'hash_lookup', HASH_LOOKUP_COLUMNS, rows())
+                inserted = total
+            else:
+                # COPY cannot resolve conflicts, so stage the rows and upsert from there
+                cur.execute(
+                    "CREATE TEMP TABLE hash_lookup_staging "
+                    "(LIKE hash_lookup INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                copy_records(cur, 'hash_lookup_staging', HASH_LOOKUP_COLUMNS, rows())
+                cur.execute(STAGED_UPSERT_QUERY)
+                inserted = cur.rowcount
+        logger.info(f"Successfully inserted {inserted} records")
+        return inserted
+    except Exception as e:
+        logger.warning(f"COPY into hash_lookup failed ({e}), falling back to batched INSERT")
+    
+    if truncate_first:
+        db_manager.execute_update("TRUNCATE TABLE hash_lookup")
     
-    inserted = 0
-    for tip_hash, lookup_type, resolved_value, source_type in records:
-        try:
-            db_manager.execute_update(insert_query, (tip_hash, lookup_type, resolved_value, source_type))
-            inserted += 1
-        except Exception as e:
-            logger.error(f"Failed to insert {tip_hash[:16]}...: {e}")
+    try:
+        inserted = db_manager.execute_values_batch(
+            UPSERT_QUERY, rows(),
+            page_size=INSERT_PAGE_SIZE, synchronous_commit=False
+        )
+    except Exception as e:
+        logger.error(f"Failed to insert hash_lookup records: {e}")
+        return 0
     
     logger.info(f"Successfully inserted {inserted} records")
     return inserted
@@ -368,7 +600,12 @@ def scan_pending_folder(pending_path: Path) -> tuple[Optional[Path], Optional[Pa
         logger.warning(f"Pending folder does not exist: {pending_path}")
         return None, None
     
-    csv_files = list(pending_path.glob('*.csv'))
+    # scandir's DirEntry caches the file type, so no extra stat per entry
+    with os.scandir(pending_path) as entries:
+        csv_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.csv') and entry.is_file()
+        ]
     
     if not csv_files:
         logger.info(f"No CSV files found in {pending_path}")
@@ -432,46 +669,61 @@ def download_from_sftp(config: 'ConfigLoader', paths: dict[str, Path]) -> tuple[
         logger.error(f"Failed to load private key from {key_path}: {e}")
         return None, None
     
-    transport = paramiko.Transport((host, port))
+    # Larger SSH flow-control window so bulk transfers are not throttled by acks
+    transport = paramiko.Transport(
+        (host, port),
+        default_window_size=SFTP_WINDOW_SIZE,
+        default_max_packet_size=SFTP_MAX_PACKET_SIZE
+    )
     
     try:
         transport.connect(username=username, pkey=key)
         sftp = paramiko.SFTPClient.from_transport(transport)
         
-        files = sftp.listdir(remote_path)
-        csv_files = [f for f in files if f.startswith('exported-file-') and f.endswith('.csv')]
+        # listdir_attr returns names and mtimes in one round-trip (no per-file stat)
+        csv_files_with_time = [
+            (attr.filename, attr.st_mtime)
+            for attr in sftp.listdir_attr(remote_path)
+            if attr.filename.startswith('exported-file-') and attr.filename.endswith('.csv')
+        ]
+        sftp.close()
         
-        if len(csv_files) < 2:
-            logger.error(f"Expected at least 2 CSV files, found {len(csv_files)}")
+        if len(csv_files_with_time) < 2:
+            logger.error(f"Expected at least 2 CSV files, found {len(csv_files_with_time)}")
             return None, None
         
-        csv_files_with_time = []
-        for f in csv_files:
-            stat = sftp.stat(f"{remote_path}/{f}")
-            csv_files_with_time.append((f, stat.st_mtime))
-        
         csv_files_with_time.sort(key=lambda x: x[1], reverse=True)
         
-        downloaded = []
-        for filename, _ in csv_files_with_time[:2]:
+        timeout = config.getint('sftp', 'connection_timeout', fallback=30)
+        
+        def fetch(filename: str) -> tuple[Path, Optional[str]]:
+            # One SFTP channel per file so the transfers overlap on the shared
+            # transport; each file is classified as soon as it lands
             remote_file = f"{remote_path}/{filename}"
             local_file = local_path / filename
             
             logger.info(f"Downloading {filename}")
-            sftp.get(remote_file, str(local_file))
-            downloaded.append(local_file)
+            channel = paramiko.SFTPClient.from_transport(transport)
+            try:
+                channel.get_channel().settimeout(timeout)
+                with open(local_file, 'wb', buffering=SFTP_WINDOW_SIZE) as f:
+                    channel.getfo(remote_file, f)
+            finally:
+                channel.close()
+            return local_file, detect_file_type(local_file)
         
-        sftp.close()
+        latest = [filename for filename, _ in csv_files_with_time[:2]]
         
         asset_file = None
         site_file = None
         
-        for file_path in downloaded:
-            file_type = detect_file_type(file_path)
-            if file_type == 'asset':
-                asset_file = file_path
-            elif file_type == 'site':
-                site_file = file_path
+        with ThreadPoolExecutor(max_workers=len(latest)) as executor:
+            for future in as_completed([executor.submit(fetch, name) for name in latest]):
+                file_path, file_type = future.result()
+                if file_type == 'asset':
+                    asset_file = file_path
+                elif file_type == 'site':
+                    site_file = file_path
         
         if not asset_file or not site_file:
             logger.error("Could not identify asset and site files from downloaded CSVs")
@@ -491,15 +743,67 @@ def download_from_sftp(config: 'ConfigLoader', paths: dict[str, Path]) -> tuple[
             transport.close()
 
 
+def compute_file_signature(file_path: Path) -> str:
+    """Return a BLAKE2b digest of the file contents (streamed, not read into memory)."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: read and hashed in C, without holding the GIL
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in iter(lambda: f.read(SIGNATURE_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def signature_path(file_type: str, processed_folder: Path) -> Path:
+    """Sidecar recording the signature of the last successfully synced export of a type."""
+    return processed_folder / f"last_{file_type}_export.sig"
+
+
+def is_export_unchanged(file_type: str, signature: str, processed_folder: Path) -> bool:
+    """Check a file signature against the one recorded at the last successful sync."""
+    sig_file = signature_path(file_type, processed_folder)
+    try:
+        return sig_file.read_text(encoding='utf-8').strip() == signature
+    except FileNotFoundError:
+        return False
+
+
+def record_export_signature(file_type: str, signature: str, processed_folder: Path) -> None:
+    """Record the signature of a successfully synced export (written atomically)."""
+    processed_folder.mkdir(parents=True, exist_ok=True)
+    sig_file = signature_path(file_type, processed_folder)
+    tmp_file = sig_file.with_suffix('.tmp')
+    tmp_file.write_text(signature, encoding='utf-8')
+    os.replace(tmp_file, sig_file)
+
+
+def clear_export_signature(file_type: str, processed_folder: Path) -> None:
+    """Forget the last synced export of a type, e.g. after a reload that did not include it."""
+    signature_path(file_type, processed_folder).unlink(missing_ok=True)
+
+
+def _move_file(src: Path, dest: Path) -> None:
+    """Rename in place when on the same filesystem, otherwise fall back to copy + delete."""
+    try:
+        os.replace(src, dest)
+    except OSError:
+        shutil.move(str(src), str(dest))
+
+
+def _timestamped_move(file_path: Path, folder: Path, timestamp: str) -> Path:
+    """Move a file into an existing folder with a timestamp suffix."""
+    dest_path = folder / f"{file_path.stem}_{timestamp}{file_path.suffix}"
+    _move_file(file_path, dest_path)
+    return dest_path
+
+
 def archive_file(file_path: Path, archive_folder: Path) -> Path:
     """Move processed file to archive folder with timestamp suffix."""
     archive_folder.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    new_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-    dest_path = archive_folder / new_name
-    
-    shutil.move(str(file_path), str(dest_path))
+    dest_path = _timestamped_move(file_path, archive_folder, datetime.now().strftime('%Y%m%d_%H%M%S'))
     logger.info(f"Archived {file_path.name} to {dest_path}")
     
     return dest_path
@@ -509,42 +813,95 @@ def move_to_error(file_path: Path, error_folder: Path) -> Path:
     """Move failed file to error folder with timestamp suffix."""
     error_folder.mkdir(parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    new_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-    dest_path = error_folder / new_name
-    
-    shutil.move(str(file_path), str(dest_path))
+    dest_path = _timestamped_move(file_path, error_folder, datetime.now().strftime('%Y%m%d_%H%M%S'))
     logger.warning(f"Moved {file_path.name} to error folder: {dest_path}")
     
     return dest_path
 
 
+def archive_processed_files(processed_files: list[tuple[str, Path, bool]],
+                            paths: dict[str, Path]) -> None:
+    """
+    Archive successful files and move failed ones to the error folder.
+    
+    All files in a run share one timestamp, and each destination folder is
+    created once rather than per file.
+    
+    Args:
+        processed_files: List of (file_type, file_path, success) tuples
+        paths: Dictionary of paths from get_default_paths()
+    """
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    archive_folder = paths['hash_sync_processed']
+    error_folder = paths['hash_sync_error']
+    
+    for folder in {archive_folder if success else error_folder for _, _, success in processed_files}:
+        folder.mkdir(parents=True, exist_ok=True)
+    
+    for file_type, file_path, success in processed_files:
+        if success:
+            dest_path = _timestamped_move(file_path, archive_folder, timestamp)
+            logger.info(f"Archived {file_path.name} to {dest_path}")
+        else:
+            dest_path = _timestamped_move(file_path, error_folder, timestamp)
+            logger.warning(f"Moved {file_path.name} to error folder: {dest_path}")
+
+
 def get_statistics(db_manager: 'DatabaseConnectionManager') -> dict:
-    """Get current hash_lookup statistics."""
-    stats = {}
+    """
+    Get current hash_lookup statistics.
     
-    type_counts = db_manager.execute_query_dict("""
-        SELECT lookup_type, COUNT(*) as count
+    Counts by lookup_type, by source_type and the overall total come back from
+    a single GROUPING SETS query; GROUPING() tells the three kinds of row apart.
+    """
+    rows = db_manager.execute_query("""
+        SELECT lookup_type, source_type,
+               GROUPING(lookup_type) AS lookup_rollup,
+               GROUPING(source_type) AS source_rollup,
+               COUNT(*) AS count
         FROM hash_lookup
-        GROUP BY lookup_type
-        ORDER BY lookup_type
+        GROUP BY GROUPING SETS ((lookup_type), (source_type), ())
+        ORDER BY lookup_type, source_type
     """)
     
-    for row in type_counts:
-        stats[row['lookup_type']] = row['count']
+    stats: dict = {}
+    by_source_type: dict = {}
+    total = 0
     
-    source_counts = db_manager.execute_query_dict("""
-        SELECT source_type, COUNT(*) as count
-        FROM hash_lookup
-        WHERE source_type IS NOT NULL
-        GROUP BY source_type
-        ORDER BY source_type
-    """)
+    for lookup_type, source_type, lookup_rollup, source_rollup, count in rows:
+        if not lookup_rollup:
+            stats[lookup_type] = count
+        elif not source_rollup:
+            if source_type is not None:
+                by_source_type[source_type] = count
+        else:
+            total = count
     
-    stats['by_source_type'] = {row['source_type']: row['count'] for row in source_counts}
+    stats['by_source_type'] = by_source_type
+    stats['total'] = total
     
-    total = db_manager.execute_query_dict("SELECT COUNT(*) as count FROM hash_lookup")
-    stats['total'] = total[0]['count'] if total else 0
+    return stats
+
+
+def compute_statistics(records: pd.DataFrame) -> dict:
+    """
+    Build hash_lookup statistics from the records just loaded.
+    
+    After a truncate-and-reload the table holds exactly these records (one per
+    tip_hash), so this gives the same result as get_statistics without
+    re-scanning the table.
+    """
+    unique_records = records.drop_duplicates(subset='tip_hash', keep='last')
+    
+    stats: dict = {
+        lookup_type: int(count)
+        for lookup_type, count in unique_records['lookup_type'].value_counts().sort_index().items()
+    }
+    stats['by_source_type'] = {
+        source_type: int(count)
+        for source_type, count in unique_records['source_type'].dropna().value_counts().sort_index().items()
+    }
+    stats['total'] = len(unique_records)
     
     return stats
 
@@ -573,6 +930,19 @@ def print_statistics(stats: dict) -> None:
     print("=" * 60 + "\n")
 
 
+def print_resolution_summary(resolution_stats: Dict[str, int]) -> None:
+    """Print unknown hash resolution statistics to console."""
+    print("\nHash Resolution Summary:")
+    print(f"  Records checked:      {resolution_stats['records_checked']}")
+    print()
+    print(f"  Fields resolved:      {resolution_stats['fields_resolved']}")
+    print(f"  Fields unresolved:    {resolution_stats['fields_unresolved']}")
+    print()
+    print(f"  Reports regenerated:  {resolution_stats['reports_regenerated']}")
+    print()
+    print(f"  Errors:               {resolution_stats['errors']}")
+
+
 def extract_hash_from_unknown(value: str) -> Optional[str]:
     """
     Extract hash from 'Unknown (hash...)' format.
@@ -619,19 +989,9 @@ def resolve_unknown_hashes(db_manager: 'DatabaseConnectionManager',
     """
     import common
     from datetime import datetime
-    from processors.report_generator import create_report_generator
     
     logger.info("Starting unknown hash resolution")
 
-    CONFIG_PATH = '../config/base.ini'
-    config = ConfigLoader(CONFIG_PATH)    
-
-    LOG_DIR = Path(config.get('paths', 'base_log_path', fallback='/mnt/data/noggin/log'))
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-
-    log_filename = f"web_app_{datetime.now().strftime('%Y%m%d')}.log"
-    log_file_path = LOG_DIR / log_filename
-
     log_path = paths.get('log', Path('/mnt/data/noggin/log'))
     log_path.mkdir(parents=True, exist_ok=True)
     
@@ -675,13 +1035,15 @@ def resolve_unknown_hashes(db_manager: 'DatabaseConnectionManager',
         hash_manager = common.HashManager(config, db_manager)
         hash_manager.invalidate_cache()
         
+        regeneration_tasks: list[tuple[Dict[str, Any], Dict[str, str]]] = []
+        
         for record in records:
             stats['records_checked'] += 1
             tip = record['tip']
             object_type = record['object_type']
             inspection_id = record['noggin_reference']
             
-            logger.info(f"Processing {object_type} {inspection_id} (TIP: {tip[:16]}...)")
+            logger.info("Processing %s %s (TIP: %.16s...)", object_type, inspection_id, tip)
             
             updates = {}
             fields_resolved_this_record = []
@@ -744,15 +1106,7 @@ def resolve_unknown_hashes(db_manager: 'DatabaseConnectionManager',
                     logger.info(f"Updated {len(updates)} fields for {inspection_id}")
                     
                     if record.get('raw_json'):
-                        try:
-                            regenerate_text_file(
-                                record, updates, config, hash_manager, config_file_path
-                            )
-                            stats['reports_regenerated'] += 1
-                            logger.info(f"Regenerated report for {inspection_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to regenerate report for {inspection_id}: {e}")
-                            stats['errors'] += 1
+                        regeneration_tasks.append((record, updates))
                     
                     logger.info(f"Resolved: {', '.join(fields_resolved_this_record)}")
                     
@@ -763,6 +1117,13 @@ def resolve_unknown_hashes(db_manager: 'DatabaseConnectionManager',
             if fields_unresolved_this_record:
                 logger.warning(f"Unresolved: {', '.join(fields_unresolved_this_record)}")
         
+        if regeneration_tasks:
+            regenerated, failed = regenerate_text_files(
+                regeneration_tasks, config, hash_manager, config_file_path
+            )
+            stats['reports_regenerated'] += regenerated
+            stats['errors'] += failed
+        
         logger.info("=" * 60)
         logger.info("HASH RESOLUTION SUMMARY")
         logger.info("=" * 60)
@@ -786,6 +1147,111 @@ def resolve_unknown_hashes(db_manager: 'DatabaseConnectionManager',
         return stats
 
 
+# <object_type>/<year>/<month> output folders already created by this process
+_created_month_folders: set[str] = set()
+
+# State of a report regeneration worker process (set by its pool initializer
+# and only used inside that worker; the in-process path passes its state explicitly)
+_regeneration_worker: dict[str, Any] = {}
+
+
+def _init_regeneration_worker(config_file_path: str) -> None:
+    """Create one config, single-connection pool and hash manager per worker process."""
+    from multiprocessing.util import Finalize
+    from common import ConfigLoader, DatabaseConnectionManager, HashManager
+    
+    config = ConfigLoader(config_file_path)
+    db_manager = DatabaseConnectionManager(config, minconn=1, maxconn=1)
+    # Pool workers leave through multiprocessing's exit handling, which runs
+    # Finalize callbacks but not atexit handlers, so close the pool here
+    Finalize(db_manager, db_manager.close_all, exitpriority=10)
+    
+    _regeneration_worker['config'] = config
+    _regeneration_worker['hash_manager'] = HashManager(config, db_manager)
+    _regeneration_worker['config_file_path'] = Path(config_file_path)
+
+
+def _regenerate_with(state: dict[str, Any],
+                     task: tuple[Dict[str, Any], Dict[str, str]]) -> tuple[str, Optional[str]]:
+    """Regenerate a single report using the given state. Returns (inspection_id, error)."""
+    record, updates = task
+    try:
+        regenerate_text_file(
+            record,
+            updates,
+            state['config'],
+            state['hash_manager'],
+            state['config_file_path']
+        )
+        return record['noggin_reference'], None
+    except Exception as e:
+        return record['noggin_reference'], str(e)
+
+
+def _regenerate_one(task: tuple[Dict[str, Any], Dict[str, str]]) -> tuple[str, Optional[str]]:
+    """Regenerate a single report inside a worker process."""
+    return _regenerate_with(_regeneration_worker, task)
+
+
+def regenerate_text_files(tasks: list[tuple[Dict[str, Any], Dict[str, str]]],
+                          config: 'ConfigLoader',
+                          hash_manager: 'HashManager',
+                          config_file_path: Path) -> tuple[int, int]:
+    """
+    Regenerate text files for a batch of records
+    
+    Reports are independent per inspection, so larger batches are spread over
+    a process pool of up to REGENERATION_MAX_WORKERS processes. Each worker
+    builds its own single-connection database pool and hash manager once via
+    the pool initializer. Small batches run in-process.
+    
+    Args:
+        tasks: List of (record, updates) tuples
+        config: Configuration loader (used for in-process regeneration)
+        hash_manager: Hash manager instance (used for in-process regeneration)
+        config_file_path: Path to base config file
+        
+    Returns:
+        Tuple of (reports regenerated, failures)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+    
+    workers = min(os.cpu_count() or 1, REGENERATION_MAX_WORKERS, len(tasks))
+    
+    if workers <= 1 or len(tasks) < REGENERATION_POOL_THRESHOLD:
+        state = {'config': config, 'hash_manager': hash_manager, 'config_file_path': config_file_path}
+        results = map(partial(_regenerate_with, state), tasks)
+        return _tally_regeneration_results(results)
+    
+    logger.info(f"Regenerating {len(tasks)} reports across {workers} worker processes")
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_regeneration_worker,
+        initargs=(str(config_file_path),)
+    ) as executor:
+        return _tally_regeneration_results(
+            executor.map(_regenerate_one, tasks, chunksize=16)
+        )
+
+
+def _tally_regeneration_results(results: Any) -> tuple[int, int]:
+    """Log per-report outcomes and count successes and failures."""
+    regenerated = 0
+    failed = 0
+    
+    for inspection_id, error in results:
+        if error is None:
+            regenerated += 1
+            logger.info(f"Regenerated report for {inspection_id}")
+        else:
+            failed += 1
+            logger.error(f"Failed to regenerate report for {inspection_id}: {error}")
+    
+    return regenerated, failed
+
+
 def regenerate_text_file(record: Dict[str, Any], 
                          updates: Dict[str, str],
                          config: 'ConfigLoader',
@@ -837,28 +1303,36 @@ def regenerate_text_file(record: Dict[str, Any],
     
     report = report_gen.generate_report(response_data, inspection_id)
     
-    base_output_path = Path(config.get('paths', 'base_output_path', 
-                                       fallback='/mnt/data/noggin/out'))
+    base_output_path = config.get('paths', 'base_output_path', fallback='/mnt/data/noggin/out')
     
+    # Decompose the date once from its attributes rather than three strftime calls
     if inspection_date:
-        year = inspection_date.strftime('%Y')
-        month = inspection_date.strftime('%m')
+        y, m, d = inspection_date.year, inspection_date.month, inspection_date.day
+        year = f"{y:04d}"
+        month = f"{m:02d}"
+        date_str = f"{y:04d}-{m:02d}-{d:02d}"
+        date_iso = inspection_date.isoformat()
     else:
         year = 'unknown'
         month = 'unknown'
+        date_str = 'unknown_date'
+        date_iso = None
     
-    date_str = inspection_date.strftime('%Y-%m-%d') if inspection_date else 'unknown_date'
     folder_name = f"{date_str} {inspection_id}"
     
-    inspection_folder = base_output_path / object_type / year / month / folder_name
-    inspection_folder.mkdir(parents=True, exist_ok=True)
+    month_folder = os.path.join(base_output_path, object_type, year, month)
+    if month_folder not in _created_month_folders:
+        os.makedirs(month_folder, exist_ok=True)
+        _created_month_folders.add(month_folder)
+    
+    inspection_folder = os.path.join(month_folder, folder_name)
+    os.makedirs(inspection_folder, exist_ok=True)
     
-    date_iso = inspection_date.isoformat() if inspection_date else None
-    report_gen.save_report(report, inspection_folder, inspection_id, date_iso)
+    report_gen.save_report(report, Path(inspection_folder), inspection_id, date_iso)
 
 
-def main() -> int:
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (constructed once at import as _PARSER)."""
     parser = argparse.ArgumentParser(
         description='Synchronise hash_lookup table from Noggin exports',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -892,12 +1366,22 @@ Examples:
     parser.add_argument('--stats', action='store_true', help='Show statistics only')
     parser.add_argument('--dry-run', action='store_true', help='Process files without database changes')
     parser.add_argument('--no-archive', action='store_true', help='Do not archive processed files')
+    parser.add_argument('--force', action='store_true',
+                       help='Sync even if the export files are unchanged since the last sync')
     parser.add_argument('--resolve-unknown-hashes', action='store_true',
                        help='After sync, attempt to resolve unknown hashes in database and regenerate reports')
     parser.add_argument('--config', type=Path, default=Path('config/base.ini'),
                        help='Path to base config file')
     
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER: argparse.ArgumentParser = _build_parser()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point."""
+    args = _PARSER.parse_args(argv)
     
     sys.path.insert(0, str(Path(__file__).parent))
     from common import ConfigLoader, LoggerManager, DatabaseConnectionManager
@@ -921,8 +1405,8 @@ Examples:
         site_file: Optional[Path] = None
         source_mode: str = ''
         
-        asset_records: list = []
-        site_records: list = []
+        asset_records: Optional[pd.DataFrame] = None
+        site_records: Optional[pd.DataFrame] = None
         
         if args.process_pending:
             source_mode = 'pending'
@@ -953,7 +1437,7 @@ Examples:
                 logger.error(f"Site file not found: {site_file}")
                 return 1
         else:
-            parser.print_help()
+            _PARSER.print_help()
             print("\nError: Specify --process-pending, --sftp, or both --asset-file and --site-file")
             return 1
         
@@ -961,16 +1445,43 @@ Examples:
             logger.error("No valid files to process")
             return 1
         
+        signatures = {
+            file_type: compute_file_signature(file_path)
+            for file_type, file_path in (('asset', asset_file), ('site', site_file))
+            if file_path
+        }
+        
+        if not args.force and not args.dry_run and all(
+            is_export_unchanged(file_type, signature, paths['hash_sync_processed'])
+            for file_type, signature in signatures.items()
+        ):
+            # hash_lookup already matches these exports, so only the TRUNCATE/COPY
+            # is skipped; resolution still runs when asked for, as hash_lookup may
+            # have been edited since (nobbie_hashes.py, the web app) or the last
+            # sync ran without --resolve-unknown-hashes
+            logger.info("Export files unchanged since last sync, skipping sync")
+            print("\nExport files unchanged since last sync - sync skipped (use --force to resync)")
+            if not args.no_archive:
+                archive_processed_files(
+                    [(file_type, file_path, True)
+                     for file_type, file_path in (('asset', asset_file), ('site', site_file))
+                     if file_path],
+                    paths
+                )
+            if args.resolve_unknown_hashes:
+                logger.info("Starting unknown hash resolution process")
+                print_resolution_summary(resolve_unknown_hashes(db_manager, config, paths, args.config))
+            return 0
+        
         logger.info("Starting hash lookup sync")
         
-        all_records = []
         processed_files = []
         
         if asset_file:
             try:
-                asset_df = load_asset_export(asset_file)
-                asset_records = process_assets(asset_df)
-                all_records.extend(asset_records)
+                asset_records = concat_records(
+                    *(process_assets(chunk) for chunk in load_asset_export(asset_file))
+                )
                 processed_files.append(('asset', asset_file, True))
                 logger.info(f"Asset records: {len(asset_records)}")
             except Exception as e:
@@ -979,58 +1490,65 @@ Examples:
         
         if site_file:
             try:
-                site_df = load_site_export(site_file)
-                site_records = process_sites(site_df, config)
-                all_records.extend(site_records)
+                site_records = concat_records(
+                    *(process_sites(chunk, config) for chunk in load_site_export(site_file))
+                )
                 processed_files.append(('site', site_file, True))
                 logger.info(f"Site records: {len(site_records)}")
             except Exception as e:
                 logger.error(f"Failed to process site file: {e}")
                 processed_files.append(('site', site_file, False))
         
-        logger.info(f"Total records to sync: {len(all_records)}")
+        asset_count = len(asset_records) if asset_records is not None else 0
+        site_count = len(site_records) if site_records is not None else 0
+        records = concat_records(asset_records, site_records)
+        total_records = len(records)
+        logger.info(f"Total records to sync: {total_records}")
         
         if args.dry_run:
             logger.info("Dry run mode - no database changes")
             print(f"\nDry run complete:")
-            print(f"  Assets: {len(asset_records)}")
-            print(f"  Sites:  {len(site_records)}")
-            print(f"  Total:  {len(all_records)}")
+            print(f"  Assets: {asset_count}")
+            print(f"  Sites:  {site_count}")
+            print(f"  Total:  {total_records}")
         else:
-            if all_records:
-                inserted = sync_to_database(db_manager, all_records, truncate_first=True)
+            if total_records:
+                inserted = sync_to_database(db_manager, records, truncate_first=True)
+                # False when rows were skipped (e.g. by the row-by-row fallback)
+                sync_complete = bool(inserted) and inserted == records['tip_hash'].nunique()
+                
+                # The table was truncated, so an export type that was not fully loaded
+                # this run must not count as unchanged next time (a re-drop retries it)
+                loaded_types = {file_type for file_type, _, success in processed_files if success}
+                for file_type in ('asset', 'site'):
+                    if sync_complete and file_type in loaded_types:
+                        record_export_signature(
+                            file_type, signatures[file_type], paths['hash_sync_processed']
+                        )
+                    else:
+                        clear_export_signature(file_type, paths['hash_sync_processed'])
                 
                 print(f"\nSync complete:")
-                print(f"  Assets processed: {len(asset_records)}")
-                print(f"  Sites processed:  {len(site_records)}")
+                print(f"  Assets processed: {asset_count}")
+                print(f"  Sites processed:  {site_count}")
                 print(f"  Total inserted:   {inserted}")
             else:
                 print("\nNo records to sync")
         
         if not args.no_archive and not args.dry_run:
-            for file_type, file_path, success in processed_files:
-                if success:
-                    archive_file(file_path, paths['hash_sync_processed'])
-                else:
-                    move_to_error(file_path, paths['hash_sync_error'])
+            archive_processed_files(processed_files, paths)
         
-        if not args.dry_run and all_records:
-            stats = get_statistics(db_manager)
+        if not args.dry_run and total_records:
+            # The table now holds exactly what was loaded unless rows were skipped
+            if sync_complete:
+                stats = compute_statistics(records)
+            else:
+                stats = get_statistics(db_manager)
             print_statistics(stats)
         
         if args.resolve_unknown_hashes and not args.dry_run:
             logger.info("Starting unknown hash resolution process")
-            resolution_stats = resolve_unknown_hashes(db_manager, config, paths, args.config)
-            
-            print("\nHash Resolution Summary:")
-            print(f"  Records checked:      {resolution_stats['records_checked']}")
-            print()
-            print(f"  Fields resolved:      {resolution_stats['fields_resolved']}")
-            print(f"  Fields unresolved:    {resolution_stats['fields_unresolved']}")
-            print()
-            print(f"  Reports regenerated:  {resolution_stats['reports_regenerated']}")
-            print()
-            print(f"  Errors:               {resolution_stats['errors']}")
+            print_resolution_summary(resolve_unknown_hashes(db_manager, config, paths, args.config))
         
         return 0
         
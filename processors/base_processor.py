@@ -15,6 +15,7 @@ Object-type-specific logic is handled by:
 
 from __future__ import annotations
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
 import uuid
@@ -23,6 +24,8 @@ import time
 import signal
 import atexit
 import re
+import threading
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple, List, Callable
@@ -35,17 +38,29 @@ class GracefulShutdownHandler:
 
     def __init__(self, db_manager: 'DatabaseConnectionManager', 
                  logger_instance: logging.Logger,
-                 on_shutdown: Optional[Callable] = None) -> None:
+                 on_shutdown: Optional[Callable] = None,
+                 install_signal_handlers: bool = True) -> None:
+        """
+        Args:
+            db_manager: Database manager closed on exit
+            logger_instance: Logger for shutdown messages
+            on_shutdown: Optional callback run at exit
+            install_signal_handlers: If False, the host process owns SIGINT/SIGTERM
+                and cleanup, and stops processing via request_shutdown()
+        """
         self.db_manager: 'DatabaseConnectionManager' = db_manager
         self.logger: logging.Logger = logger_instance
         self.shutdown_requested: bool = False
+        # Set with shutdown_requested so pauses (see wait) end immediately
+        self._shutdown_event: threading.Event = threading.Event()
         self.force_exit: bool = False
         self.current_tip: Optional[str] = None
         self.on_shutdown: Optional[Callable] = on_shutdown
 
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        atexit.register(self._cleanup_on_exit)
+        if install_signal_handlers:
+            signal.signal(signal.SIGINT, self._signal_handler)
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            atexit.register(self._cleanup_on_exit)
 
         self.logger.info("Graceful shutdown handler initialised")
 
@@ -54,6 +69,7 @@ class GracefulShutdownHandler:
 
         if not self.shutdown_requested:
             self.shutdown_requested = True
+            self._shutdown_event.set()
             self.logger.warning(f"{signal_name} received. Finishing current TIP then shutting down...")
             self.logger.warning(f"Currently processing: {self.current_tip or 'None'}")
             self.logger.warning("Press Ctrl+C again to force immediate exit")
@@ -90,10 +106,28 @@ class GracefulShutdownHandler:
     def should_continue(self) -> bool:
         return not self.shutdown_requested
 
+    def request_shutdown(self) -> None:
+        """Stop after the current TIP (used by a host process instead of a signal)"""
+        self.shutdown_requested = True
+        self._shutdown_event.set()
+
+    def reset(self) -> None:
+        """Clear a previous shutdown request so a long-lived processor can run again"""
+        self.shutdown_requested = False
+        self._shutdown_event.clear()
+
+    def wait(self, seconds: float) -> bool:
+        """Pause for up to seconds; returns True early if shutdown is requested"""
+        return self._shutdown_event.wait(timeout=seconds)
+
     def set_current_tip(self, tip: Optional[str]) -> None:
         self.current_tip = tip
 
 
+# Characters not allowed in filenames, each mapped to an underscore
+_ILLEGAL_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def sanitise_filename(text: str) -> str:
     """
     Sanitise string for use in filenames.
@@ -102,14 +136,11 @@ def sanitise_filename(text: str) -> str:
     if not text:
         return "unknown"
     
-    # Replace illegal filename characters with underscore
-    sanitised: str = re.sub(r'[<>:"/\\|?*]', '_', str(text))
+    # Replace illegal filename characters with underscore (one pass over a translation table)
+    sanitised: str = str(text).translate(_ILLEGAL_FILENAME_CHARS)
     
-    # Replace whitespace characters (tabs, newlines) with standard space
-    sanitised = re.sub(r'[\t\r\n]+', ' ', sanitised)
-    
-    # Collapse multiple spaces into one
-    sanitised = re.sub(r'\s+', ' ', sanitised)
+    # Turn any run of whitespace (tabs, newlines, repeated spaces) into a single space
+    sanitised = ' '.join(sanitised.split())
     
     # Remove leading/trailing spaces or underscores
     sanitised = sanitised.strip('_ ')
@@ -119,35 +150,72 @@ def sanitise_filename(text: str) -> str:
 
 def flatten_json(nested_json: Any, parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
     """Flatten nested JSON into single-level dict with concatenated keys"""
-    items: List[Tuple[str, Any]] = []
+    flattened: Dict[str, Any] = {}
+    # Explicit stack rather than recursion: no intermediate dicts per level and
+    # no recursion limit on deep payloads. Children are pushed in reverse so
+    # keys come out in the same depth-first order as the input
+    stack: List[Tuple[str, Any]] = [(parent_key, nested_json)]
     
-    if isinstance(nested_json, dict):
-        for k, v in nested_json.items():
-            new_key: str = f"{parent_key}{sep}{k}" if parent_key else k
-            items.extend(flatten_json(v, new_key, sep).items())
-    elif isinstance(nested_json, list):
-        for i, v in enumerate(nested_json):
-            new_key = f"{parent_key}{sep}{i}" if parent_key else str(i)
-            items.extend(flatten_json(v, new_key, sep).items())
-    else:
-        items.append((parent_key, nested_json))
+    while stack:
+        key, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(
+                (f"{key}{sep}{k}" if key else k, v)
+                for k, v in reversed(list(node.items()))
+            )
+        elif isinstance(node, list):
+            stack.extend(
+                (f"{key}{sep}{i}" if key else str(i), node[i])
+                for i in range(len(node) - 1, -1, -1)
+            )
+        else:
+            flattened[key] = node
     
-    return dict(items)
+    return flattened
+
+
+@lru_cache(maxsize=1024)
+def parse_iso_date(date_str: str) -> datetime:
+    """
+    Parse an ISO date string from the API ('Z' suffix allowed)
+    
+    Cached because an inspection's date is parsed for its folder, its report
+    and again for every attachment filename. Raises ValueError (or TypeError/
+    AttributeError for non-strings) like datetime.fromisoformat.
+    """
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+
+
+# Read size for MD5 hashing where hashlib.file_digest is unavailable (Python < 3.11)
+MD5_CHUNK_SIZE: int = 1024 * 1024
 
 
 def calculate_md5_hash(file_path: Path) -> str:
     """Calculate MD5 hash of file"""
     try:
-        hash_md5 = hashlib.md5()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: read and hashed in C, without holding the GIL
+                return hashlib.file_digest(f, 'md5').hexdigest()
+            
+            hash_md5 = hashlib.md5()
+            for chunk in iter(lambda: f.read(MD5_CHUNK_SIZE), b''):
                 hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            return hash_md5.hexdigest()
     except Exception as e:
         logger.error(f"Error calculating MD5 for {file_path}: {e}")
         return ""
 
 
+def check_attachment_size(file_size: int, expected_min_size: int = 1024) -> Optional[str]:
+    """Return why an attachment of file_size bytes is invalid, or None if it is acceptable"""
+    if file_size == 0:
+        return "File appears empty"
+    if file_size < expected_min_size:
+        return f"File too small ({file_size} bytes)"
+    return None
+
+
 def validate_attachment_file(file_path: Path, expected_min_size: int = 1024) -> Tuple[bool, int, Optional[str]]:
     """
     Validate downloaded attachment file
@@ -160,21 +228,21 @@ def validate_attachment_file(file_path: Path, expected_min_size: int = 1024) ->
             return False, 0, "File does not exist"
 
         file_size: int = file_path.stat().st_size
+        error: Optional[str] = check_attachment_size(file_size, expected_min_size)
 
-        if file_size < expected_min_size:
-            return False, file_size, f"File too small ({file_size} bytes)"
-
-        with open(file_path, 'rb') as f:
-            header_bytes: bytes = f.read(10)
-            if len(header_bytes) == 0:
-                return False, file_size, "File appears empty"
-
-        return True, file_size, None
+        return error is None, file_size, error
 
     except Exception as e:
         return False, 0, f"Validation error: {e}"
 
 
+# Keep-alive connections kept per APIClient session (raised to attachment_workers if larger)
+API_SESSION_POOL_SIZE: int = 4
+
+# Bytes written per chunk when streaming an attachment to disk
+ATTACHMENT_CHUNK_SIZE: int = 1024 * 1024
+
+
 class APIClient:
     """Handles API requests with retry logic and circuit breaker integration"""
     
@@ -191,15 +259,39 @@ class APIClient:
         self.max_backoff: int = config.getint('processing', 'api_max_backoff')
         self.timeout: int = config.getint('processing', 'api_timeout')
         self.too_many_requests_sleep: int = config.getint('processing', 'too_many_requests_sleep_time')
+        
+        # One keep-alive session per client: API calls and attachment downloads
+        # reuse pooled TCP/TLS connections instead of a handshake per request.
+        # Retries stay in make_request, so the adapter does not retry itself.
+        pool_size: int = max(API_SESSION_POOL_SIZE, config.getint('processing', 'attachment_workers', fallback=1))
+        self.session: requests.Session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
-    def make_request(self, url: str, tip_value: str) -> requests.Response:
-        """Make API request with exponential backoff retry logic"""
+    def make_request(self, url: str, tip_value: str, stream: bool = False,
+                     consume: Optional[Callable[[requests.Response], None]] = None) -> requests.Response:
+        """
+        Make API request with exponential backoff retry logic
+        
+        With stream=True the body is not read up front (iterate it with
+        iter_content, e.g. for attachments).
+        
+        consume, if given, is called with a 200 response inside the retry loop
+        (e.g. to stream the body to a file), so a connection dropped mid-body
+        retries the whole request. It must start from scratch on each call.
+        The response is closed once consume returns.
+        """
         last_exception: Optional[Exception] = None
 
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"API request attempt {attempt + 1}/{self.max_retries} for TIP {tip_value}")
-                response: requests.Response = requests.get(url, headers=self.headers, timeout=self.timeout)
+                response: requests.Response = self.session.get(url, timeout=self.timeout, stream=stream)
+                if consume is not None and response.status_code == 200:
+                    with response:
+                        consume(response)
                 object.__setattr__(response, '_retry_count', attempt)
                 logger.debug(f"Request attempt {attempt + 1} succeeded for TIP {tip_value}")
                 return response
@@ -281,12 +373,42 @@ class AttachmentDownloader:
         self.attachment_pause: int = config.getint('processing', 'attachment_pause')
         self.min_file_size: int = config.getint('processing', 'min_attachment_size', fallback=1024)
     
+    def get_completed_attachments(self, record_tip: str) -> Dict[str, Tuple[str, int]]:
+        """
+        Return attachments already downloaded for a record, in one query
+        
+        Returns:
+            Dictionary of attachment_tip -> (file_path, file_size_bytes)
+        """
+        try:
+            rows = self.db_manager.execute_query_tuples(
+                """
+                SELECT attachment_tip, file_path, file_size_bytes
+                FROM attachments
+                WHERE record_tip = %s
+                  AND attachment_status = 'complete'
+                  AND file_size_bytes IS NOT NULL
+                """,
+                (record_tip,)
+            )
+        except Exception as e:
+            logger.warning(f"Could not read completed attachments for {record_tip}: {e}")
+            return {}
+        
+        return {attachment_tip: (file_path, file_size) for attachment_tip, file_path, file_size in rows}
+    
     def download(self, attachment_url: str, filename: str, inspection_id: str,
                 attachment_tip: str, inspection_folder: Path,
-                record_tip: str, attachment_sequence: int) -> Tuple[bool, int, float, Optional[str]]:
+                record_tip: str, attachment_sequence: int,
+                completed: Optional[Tuple[str, int]] = None) -> Tuple[bool, int, float, Optional[str]]:
         """
         Download and validate attachment with database tracking
         
+        Args:
+            completed: (file_path, file_size_bytes) recorded by an earlier successful
+                download (see get_completed_attachments). If that file is still on
+                disk at the same path and size, it is kept instead of downloaded again.
+        
         Returns:
             Tuple of (success, retry_count, file_size_mb, error_message)
         """
@@ -297,6 +419,15 @@ class AttachmentDownloader:
         output_path: Path = inspection_folder / filename
         temp_path: Path = output_path.with_suffix('.tmp')
 
+        if completed and completed[0] == str(output_path):
+            # A size match from stat() is enough; the MD5 was recorded when it was downloaded
+            try:
+                if output_path.stat().st_size == completed[1]:
+                    logger.info(f"Attachment {attachment_sequence} already downloaded: {filename}")
+                    return True, 0, completed[1] / (1024 * 1024), None
+            except OSError:
+                pass
+
         download_start: datetime = datetime.now()
 
         # Insert initial attachment record
@@ -319,23 +450,43 @@ class AttachmentDownloader:
         except Exception as e:
             logger.warning(f"Could not insert attachment record: {e}")
 
+        # Filled in by write_body on the attempt that completes
+        body: Dict[str, Any] = {}
+
+        def write_body(response: requests.Response) -> None:
+            # Stream to a temp file then rename, without holding the whole file in memory.
+            # Size and MD5 are taken from the chunks as they are written, so the
+            # file is not read back from disk to validate and hash it. Runs inside
+            # make_request's retry loop: each attempt truncates the file and restarts the hash
+            hash_md5 = hashlib.md5()
+            size: int = 0
+            with open(temp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=ATTACHMENT_CHUNK_SIZE):
+                    f.write(chunk)
+                    hash_md5.update(chunk)
+                    size += len(chunk)
+            body['md5'] = hash_md5
+            body['size'] = size
+
         try:
-            response = self.api_client.make_request(full_url, attachment_tip)
+            response = self.api_client.make_request(
+                full_url, attachment_tip, stream=True, consume=write_body
+            )
             retry_count: int = getattr(response, '_retry_count', 0)
 
-            if response.status_code != 200:
-                error_msg = self.api_client.handle_error(response, attachment_tip, full_url)
-                self._update_attachment_failed(record_tip, attachment_tip, error_msg)
-                return False, retry_count, 0, error_msg
+            with response:
+                if response.status_code != 200:
+                    error_msg = self.api_client.handle_error(response, attachment_tip, full_url)
+                    self._update_attachment_failed(record_tip, attachment_tip, error_msg)
+                    return False, retry_count, 0, error_msg
 
-            # Write to temp file then rename
-            with open(temp_path, 'wb') as f:
-                f.write(response.content)
+            hash_md5 = body['md5']
+            file_size: int = body['size']
 
             # Validate
-            is_valid, file_size, validation_error = validate_attachment_file(temp_path, self.min_file_size)
+            validation_error = check_attachment_size(file_size, self.min_file_size)
 
-            if not is_valid:
+            if validation_error:
                 temp_path.unlink(missing_ok=True)
                 error_msg = f"Validation failed: {validation_error}"
                 self._update_attachment_failed(record_tip, attachment_tip, error_msg)
@@ -344,8 +495,7 @@ class AttachmentDownloader:
             # Rename temp to final
             temp_path.rename(output_path)
 
-            # Calculate hash
-            file_hash: str = calculate_md5_hash(output_path)
+            file_hash: str = hash_md5.hexdigest()
 
             download_end: datetime = datetime.now()
             download_duration: float = (download_end - download_start).total_seconds()
@@ -419,13 +569,13 @@ class FolderManager:
         try:
             if date_str:
                 # Parse date
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date_obj = parse_iso_date(date_str)
                 year: str = date_obj.strftime('%Y')
                 month: str = date_obj.strftime('%m')
                 date_formatted: str = date_obj.strftime('%Y-%m-%d')
             else:
                 raise ValueError("Empty date")
-        except (ValueError, AttributeError):
+        except (ValueError, TypeError, AttributeError):
             year = 'unknown_year'
             month = 'unknown_month'
             date_formatted = 'unknown_date'
@@ -456,28 +606,40 @@ class FolderManager:
             stub: Optional stub override (e.g., 'skid-plate-t1', 'obs1'). 
                   If None, uses config default.
         """
+        return self.attachment_filename_builder(inspection_id, date_str)(sequence, stub)
+    
+    def attachment_filename_builder(self, inspection_id: str,
+                                    date_str: str) -> Callable[[int, Optional[str]], str]:
+        """
+        Return a function building attachment filenames for one inspection.
+        
+        The sanitised ID and formatted date are bound once, so per attachment
+        only the stub and sequence are filled in (see construct_attachment_filename
+        for the arguments).
+        """
         sanitised_id: str = sanitise_filename(inspection_id)
         
         try:
             if date_str:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date_obj = parse_iso_date(date_str)
                 date_formatted: str = date_obj.strftime('%d %b %Y')
             else:
                 raise ValueError("Empty date")
-        except (ValueError, AttributeError):
+        except (ValueError, TypeError, AttributeError):
             date_formatted = 'unknown'
         
-        effective_stub = stub if stub is not None else self.filename_stub
-        
-        filename: str = self.attachment_pattern.format(
+        format_filename = partial(
+            self.attachment_pattern.format,
             abbreviation=self.object_type_abbrev,
             inspection_id=sanitised_id,
-            date=date_formatted,
-            stub=effective_stub,
-            sequence=str(sequence).zfill(3)
+            date=date_formatted
         )
         
-        return filename
+        def build(sequence: int, stub: Optional[str] = None) -> str:
+            effective_stub = stub if stub is not None else self.filename_stub
+            return format_filename(stub=effective_stub, sequence=str(sequence).zfill(3))
+        
+        return build
 
 
 class RetryManager:
@@ -80,7 +80,7 @@ class FieldProcessor:
         return date_str, parsed_date
     
     def process_field(self, api_field: str, value: Any, tip_value: str, 
-                     inspection_id: str) -> Tuple[Any, Optional[str]]:
+                     inspection_id: str, update_lookup_type: bool = True) -> Tuple[Any, Optional[str]]:
         """
         Process a single field value based on its type
         
@@ -89,6 +89,8 @@ class FieldProcessor:
             value: Raw value from API
             tip_value: TIP for hash lookup logging
             inspection_id: Inspection ID for hash lookup logging
+            update_lookup_type: Correct an 'unknown' lookup_type for hash fields
+                (extract_all_fields passes False and updates all hashes at once)
             
         Returns:
             Tuple of (processed_value, resolved_hash_value or None)
@@ -140,7 +142,8 @@ class FieldProcessor:
             resolved: str = self.hash_manager.lookup_hash(
                 hash_type, hash_value, tip_value, inspection_id
             )
-            self.hash_manager.update_lookup_type_if_unknown(hash_value, hash_type)
+            if update_lookup_type:
+                self.hash_manager.update_lookup_type_if_unknown(hash_value, hash_type)
             
             return hash_value, resolved
         
@@ -172,6 +175,8 @@ class FieldProcessor:
         
         # Track unknown hashes
         unknown_hashes: List[str] = []
+        # (hash, hash_type) pairs whose lookup_type is corrected in one statement
+        seen_hashes: List[Tuple[str, str]] = []
         
         # Process date separately (always extract)
         date_str, parsed_date = self.extract_date(response_data)
@@ -183,10 +188,13 @@ class FieldProcessor:
             value = response_data.get(api_field)
             
             processed_value, resolved_value = self.process_field(
-                api_field, value, tip_value, inspection_id
+                api_field, value, tip_value, inspection_id, update_lookup_type=False
             )
             
             if field_type == 'hash':
+                if resolved_value is not None:
+                    seen_hashes.append((processed_value, hash_type))
+                
                 # Store both hash and resolved value
                 result[f"{db_column}"] = processed_value  # The hash
                 resolved_column = db_column.replace('_hash', '')
@@ -198,6 +206,8 @@ class FieldProcessor:
             else:
                 result[db_column] = processed_value
         
+        self.hash_manager.update_lookup_types_if_unknown(seen_hashes)
+        
         result['has_unknown_hashes'] = len(unknown_hashes) > 0
         result['unknown_hash_fields'] = unknown_hashes
         
@@ -378,6 +388,27 @@ class DatabaseRecordManager:
             (total, completed, all_complete, tip_value)
         )
     
+    def complete_record(self, tip_value: str, total: int, completed: int,
+                        all_complete: bool, status: str) -> None:
+        """
+        Update attachment counts and processing status for a TIP in one statement
+        
+        Equivalent to update_attachment_counts followed by update_processing_status,
+        but one round trip and commit, and one new row version instead of two.
+        """
+        self.db_manager.execute_update(
+            """
+            UPDATE noggin_data 
+            SET total_attachments = %s, 
+                completed_attachment_count = %s,
+                all_attachments_complete = %s,
+                processing_status = %s,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE tip = %s
+            """,
+            (total, completed, all_complete, status, tip_value)
+        )
+    
     def record_processing_error(self, tip_value: str, error_type: str,
                                error_message: str, error_details: Optional[Dict] = None) -> None:
         """Record a processing error"""
@@ -416,6 +447,30 @@ class DatabaseRecordManager:
         params = (abbreviation, *self.PROCESSABLE_STATUSES, limit)
         return self.db_manager.execute_query_dict(query, params)
     
+    @classmethod
+    def count_tips_to_process(cls, db_manager: 'DatabaseConnectionManager') -> Dict[str, int]:
+        """
+        Count TIPs eligible for processing per object type, in one query
+        
+        Uses the same conditions as get_tips_to_process, so callers can skip
+        object types with nothing queued without polling each one.
+        
+        Returns:
+            Dictionary of object type abbreviation -> eligible TIPs (types with none are absent)
+        """
+        status_placeholders = ', '.join(['%s'] * len(cls.PROCESSABLE_STATUSES))
+        
+        query = f"""
+            SELECT object_type, COUNT(*)
+            FROM noggin_data
+            WHERE processing_status IN ({status_placeholders})
+              AND (next_retry_at IS NULL OR next_retry_at <= CURRENT_TIMESTAMP)
+              AND permanently_failed = FALSE
+            GROUP BY object_type
+        """
+        
+        return dict(db_manager.execute_query_tuples(query, tuple(cls.PROCESSABLE_STATUSES)))
+    
     def mark_permanently_failed(self, tip_value: str, reason: str) -> None:
         """Mark a TIP as permanently failed"""
         self.db_manager.execute_update(
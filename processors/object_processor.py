@@ -16,8 +16,8 @@ from __future__ import annotations
 import csv
 import json
 import logging
-import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
@@ -50,7 +50,20 @@ class ObjectProcessor:
         processor.run()
     """
     
-    def __init__(self, base_config_path: str, specific_config_path: str) -> None:
+    def __init__(self, base_config_path: str, specific_config_path: str,
+                 db_manager: Optional['DatabaseConnectionManager'] = None,
+                 hash_manager: Optional['HashManager'] = None) -> None:
+        """
+        Args:
+            base_config_path: Path to base config file
+            specific_config_path: Path to object type config file
+            db_manager: Existing database manager to share (optional). When given,
+                the processor runs embedded in a host process (e.g. nobbie_daemon):
+                the host's logging, signal handling and connection pool are reused
+                rather than set up again.
+            hash_manager: Existing hash manager to share (optional), so embedded
+                processors use one hash lookup cache instead of loading their own.
+        """
         # Import here to avoid circular imports. TODO Read python docs regarding scoped imports
         from common import (
             ConfigLoader, LoggerManager, DatabaseConnectionManager,
@@ -74,14 +87,15 @@ class ObjectProcessor:
             self.config, 
             script_name=f"processor_{self.abbreviation.lower()}"
         )
-        self.logger_manager.configure_application_logger()
+        if db_manager is None:
+            self.logger_manager.configure_application_logger()
         self.session_logger = self.logger_manager.create_session_logger(self.session_id)
         
         # Database connection
-        self.db_manager: DatabaseConnectionManager = DatabaseConnectionManager(self.config)
+        self.db_manager: DatabaseConnectionManager = db_manager or DatabaseConnectionManager(self.config)
         
         # Hash manager
-        self.hash_manager: HashManager = HashManager(self.config, self.db_manager)
+        self.hash_manager: HashManager = hash_manager or HashManager(self.config, self.db_manager)
         
         # Circuit breaker
         self.circuit_breaker: CircuitBreaker = CircuitBreaker(self.config)
@@ -116,11 +130,13 @@ class ObjectProcessor:
         
         # Shutdown handler
         self.shutdown_handler: GracefulShutdownHandler = GracefulShutdownHandler(
-            self.db_manager, logger, self._on_shutdown
+            self.db_manager, logger, self._on_shutdown,
+            install_signal_handlers=db_manager is None
         )
         
         # Processing settings
         self.attachment_pause: int = self.config.getint('processing', 'attachment_pause')
+        self.attachment_workers: int = self.config.getint('processing', 'attachment_workers', fallback=1)
         self.base_url: str = self.config.get('api', 'base_url')
         
         # Log startup
@@ -311,7 +327,7 @@ class ObjectProcessor:
                 self.circuit_breaker.record_failure()
                 sleep_time = self.api_client.too_many_requests_sleep
                 logger.warning(f"Rate limited, sleeping {sleep_time}s")
-                time.sleep(sleep_time)
+                self.shutdown_handler.wait(sleep_time)
                 return False
             
             elif response.status_code == 404:
@@ -375,36 +391,50 @@ class ObjectProcessor:
         if not attachments:
             logger.info(f"No attachments for {inspection_id}")
             self._log_session_record(tip_value, inspection_id, 0, [])
-            self.record_manager.update_attachment_counts(tip_value, 0, 0, True)
-            self.record_manager.update_processing_status(tip_value, 'complete')
+            self.record_manager.complete_record(tip_value, 0, 0, True, 'complete')
             return
         
         logger.info(f"Processing {len(attachments)} attachments for {inspection_id}")
         
-        successful_downloads = 0
-        attachment_filenames: List[str] = []
+        build_filename = self.folder_manager.attachment_filename_builder(inspection_id, date_str)
+        # Attachments finished by an earlier attempt (e.g. a 'partial' TIP being retried)
+        completed = self.attachment_downloader.get_completed_attachments(tip_value)
         
-        for i, att_info in enumerate(attachments, 1):
+        def download(i: int, att_info: AttachmentInfo) -> Optional[str]:
+            """Download one attachment; returns its filename on success"""
             if not self.shutdown_handler.should_continue():
                 logger.warning(f"Shutdown during attachment {i}/{len(attachments)}")
-                break
+                return None
             
             # Construct filename with field-specific stub
-            filename = self.folder_manager.construct_attachment_filename(
-                inspection_id, date_str, att_info.sequence_in_field, stub=att_info.stub
-            )
+            filename = build_filename(att_info.sequence_in_field, att_info.stub)
             
             success, retry_count, file_size_mb, error_msg = self.attachment_downloader.download(
                 att_info.url, filename, inspection_id, att_info.attachment_tip,
-                inspection_folder, tip_value, i
+                inspection_folder, tip_value, i,
+                completed=completed.get(att_info.attachment_tip)
             )
-            
-            if success:
-                successful_downloads += 1
-                attachment_filenames.append(filename)
-            
-            if self.attachment_pause > 0 and i < len(attachments):
-                time.sleep(self.attachment_pause)
+            return filename if success else None
+        
+        if self.attachment_workers > 1 and len(attachments) > 1:
+            # Concurrent downloads over the API client's pooled session;
+            # attachment_pause only paces sequential downloads
+            with ThreadPoolExecutor(max_workers=min(self.attachment_workers, len(attachments))) as executor:
+                results = list(executor.map(download, range(1, len(attachments) + 1), attachments))
+        else:
+            results = []
+            for i, att_info in enumerate(attachments, 1):
+                if not self.shutdown_handler.should_continue():
+                    logger.warning(f"Shutdown during attachment {i}/{len(attachments)}")
+                    break
+                
+                results.append(download(i, att_info))
+                
+                if self.attachment_pause > 0 and i < len(attachments):
+                    self.shutdown_handler.wait(self.attachment_pause)
+        
+        attachment_filenames: List[str] = [filename for filename in results if filename]
+        successful_downloads = len(attachment_filenames)
         
         if not self.shutdown_handler.should_continue():
             final_status = 'interrupted'
@@ -416,10 +446,9 @@ class ObjectProcessor:
             final_status = 'failed'
         
         all_complete = successful_downloads == len(attachments)
-        self.record_manager.update_attachment_counts(
-            tip_value, len(attachments), successful_downloads, all_complete
+        self.record_manager.complete_record(
+            tip_value, len(attachments), successful_downloads, all_complete, final_status
         )
-        self.record_manager.update_processing_status(tip_value, final_status)
         
         self._log_session_record(tip_value, inspection_id, successful_downloads, attachment_filenames)
         
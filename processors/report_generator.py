@@ -23,10 +23,17 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 # Import sanitise_filename to ensure consistency with folder naming
-from .base_processor import sanitise_filename
+from .base_processor import sanitise_filename, parse_iso_date
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Template patterns, compiled once rather than on every report
+# Conditional blocks (non-greedy, handles nesting by processing innermost first)
+CONDITIONAL_PATTERN: re.Pattern = re.compile(r'<if:(\w+)>(.*?)</if:\1>', re.DOTALL)
+# <field_name> but not <if: or </if:
+PLACEHOLDER_PATTERN: re.Pattern = re.compile(r'<(?!if:|/if:)(\w+)>')
+EXCESS_BLANK_LINES_PATTERN: re.Pattern = re.compile(r'\n{3,}')
+
 
 class ReportGenerator:
     """Generates inspection reports from templates"""
@@ -89,7 +96,7 @@ class ReportGenerator:
         report = self._process_template(self.template, context)
         
         # Clean up extra blank lines
-        report = re.sub(r'\n{3,}', '\n\n', report)
+        report = EXCESS_BLANK_LINES_PATTERN.sub('\n\n', report)
         
         return report
     
@@ -184,35 +191,21 @@ class ReportGenerator:
         
         Supports nested conditionals.
         """
-        # Regex for conditional blocks (non-greedy, handles nesting by processing innermost first)
-        pattern = r'<if:(\w+)>(.*?)</if:\1>'
+        def resolve_block(match: re.Match) -> str:
+            # Include content if condition is met (nested conditionals are
+            # handled in the next iteration), otherwise remove the entire block
+            if self._evaluate_condition(match.group(1), context):
+                return match.group(2)
+            return ''
         
         max_iterations = 10  # Prevent infinite loops
-        iteration = 0
         
-        while iteration < max_iterations:
-            matches = list(re.finditer(pattern, template, re.DOTALL))
-            if not matches:
+        # One substitution pass per nesting level builds the new template in a
+        # single step instead of re-slicing the whole string for each block
+        for _ in range(max_iterations):
+            template, replaced = CONDITIONAL_PATTERN.subn(resolve_block, template)
+            if not replaced:
                 break
-            
-            # Process from end to start to preserve positions
-            for match in reversed(matches):
-                field_name = match.group(1)
-                content = match.group(2)
-                
-                # Check if condition is met
-                should_include = self._evaluate_condition(field_name, context)
-                
-                if should_include:
-                    # Include content (will be processed for nested conditionals in next iteration)
-                    replacement = content
-                else:
-                    # Remove entire block
-                    replacement = ''
-                
-                template = template[:match.start()] + replacement + template[match.end():]
-            
-            iteration += 1
         
         return template
     
@@ -260,10 +253,7 @@ class ReportGenerator:
             
             return str(value)
         
-        # Match <field_name> but not <if: or </if:
-        pattern = r'<(?!if:|/if:)(\w+)>'
-        
-        return re.sub(pattern, replacer, template)
+        return PLACEHOLDER_PATTERN.sub(replacer, template)
     
     def save_report(self, report: str, inspection_folder: Path, 
                    inspection_id: str, date_str: Optional[str] = None) -> Optional[Path]:
@@ -282,13 +272,13 @@ class ReportGenerator:
         # Parse date for filename components
         try:
             if date_str:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date_obj = parse_iso_date(date_str)
                 date_formatted = date_obj.strftime('%Y-%m-%d')
                 year = date_obj.strftime('%Y')
                 month = date_obj.strftime('%m')
             else:
                 raise ValueError("Empty date")
-        except (ValueError, AttributeError):
+        except (ValueError, TypeError, AttributeError):
             date_formatted = 'unknown_date'
             year = 'unknown'
             month = 'unknown'
@@ -452,13 +442,13 @@ class DefaultReportGenerator:
         
         try:
             if date_str:
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date_obj = parse_iso_date(date_str)
                 date_formatted = date_obj.strftime('%Y-%m-%d')
                 year = date_obj.strftime('%Y')
                 month = date_obj.strftime('%m')
             else:
                 raise ValueError("Empty date")
-        except (ValueError, AttributeError):
+        except (ValueError, TypeError, AttributeError):
             date_formatted = 'unknown_date'
             year = 'unknown'
             month = 'unknown'
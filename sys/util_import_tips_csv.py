@@ -1,8 +1,10 @@
 import argparse
 import logging
+import os
 import sys
-from datetime import datetime
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 
 from common import ConfigLoader, LoggerManager, DatabaseConnectionManager, CSVImporter
 
@@ -13,6 +15,8 @@ logger_manager.configure_application_logger()
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+HEADER_PREVIEW_BYTES: int = 4096
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -25,11 +29,28 @@ def parse_args() -> argparse.Namespace:
              'for existing records. Skips records with processing_status=complete. '
              'Inserts new TIPs not found in database.'
     )
+    parser.add_argument(
+        '--truncate',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Truncate (--truncate) or keep (--no-truncate) existing data before importing '
+             'without prompting. Default: prompt when run interactively, otherwise keep.'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Only log warnings and errors from this script (skips the CSV file preview)'
+    )
     return parser.parse_args()
 
 
-def prompt_truncation(db_manager: DatabaseConnectionManager) -> bool:
-    """Prompt user for table truncation. Returns True if truncation succeeded or was skipped."""
+def prompt_truncation(db_manager: DatabaseConnectionManager, truncate: Optional[bool] = None) -> bool:
+    """
+    Truncate the import tables if requested. Returns True if truncation succeeded or was skipped.
+
+    With truncate None the user is asked, but only on an interactive terminal;
+    unattended runs (cron, pipelines) never block on input and keep existing data.
+    """
     print("\n" + "="*100)
     print(" DATABASE CLEANUP OPTIONS")
     print("="*100)
@@ -41,9 +62,11 @@ def prompt_truncation(db_manager: DatabaseConnectionManager) -> bool:
     print(" - noggin_schema.unknown_hashes")
     print("-" * 100)
 
-    user_response = input(">>> Do you want to TRUNCATE these tables before importing? (y/n): ").strip().lower()
+    if truncate is None and sys.stdin.isatty():
+        user_response = input(">>> Do you want to TRUNCATE these tables before importing? (y/n): ").strip().lower()
+        truncate = user_response == 'y'
 
-    if user_response == 'y':
+    if truncate:
         logger.warning("User requested table truncation...")
         try:
             tables = [
@@ -70,40 +93,62 @@ def prompt_truncation(db_manager: DatabaseConnectionManager) -> bool:
     return True
 
 
+def _peek_header(entry: os.DirEntry) -> Tuple[str, str, str]:
+    """
+    Read the modified time and header line of one CSV file for the preview
+    
+    Returns:
+        Tuple of (file name, modified time, header preview)
+    """
+    mtime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry.stat().st_mtime))
+
+    header_preview = "<Unable to read>"
+
+    try:
+        # Only the first line is shown, so read one small block and decode just that line
+        with open(entry.path, 'rb') as f_obj:
+            buf = f_obj.read(HEADER_PREVIEW_BYTES)
+
+        # utf-8-sig decodes a leading BOM (as Excel writes) to nothing, the same
+        # way CSVImporter reads the files, so a BOM needs no special handling
+        header_preview = buf.split(b'\n', 1)[0].decode('utf-8-sig', errors='replace').strip()
+
+        if not header_preview:
+            header_preview = "<Empty File>"
+
+    except Exception as e:
+        header_preview = f"<Error: {e}>"
+
+    return entry.name, mtime, header_preview
+
+
 def preview_csv_files(csv_importer: CSVImporter) -> None:
     """Preview CSV files in input folder"""
-    csv_files = sorted(list(csv_importer.input_folder.glob('*.csv')))
+    # The preview only feeds an INFO message, so skip reading the files when it would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    if csv_files:
-        file_details = []
-        for f in csv_files:
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-
-            header_preview = "<Unable to read>"
-            bom_warning = ""
-
-            try:
-                with open(f, 'r', encoding='utf-8') as f_obj:
-                    raw_line = f_obj.readline()
-
-                    if raw_line.startswith('\ufeff'):
-                        bom_warning = "    [!] WARNING: BOM (Byte Order Mark) Detected\n"
-                        header_preview = raw_line.lstrip('\ufeff').strip()
-                    else:
-                        header_preview = raw_line.strip()
-
-                    if not header_preview:
-                        header_preview = "<Empty File>"
-
-            except Exception as e:
-                header_preview = f"<Error: {e}>"
-
-            file_details.append(
-                f"  - File:     {f.name}\n"
-                f"    Modified: {mtime}\n"
-                f"{bom_warning}"
-                f"    Header:   {header_preview}"
+    # One directory read; the DirEntry objects carry the file type and stat result
+    try:
+        with os.scandir(csv_importer.input_folder) as entries:
+            csv_files = sorted(
+                (entry for entry in entries if entry.name.endswith('.csv') and entry.is_file()),
+                key=lambda entry: entry.name
             )
+    except FileNotFoundError:
+        csv_files = []
+
+    if csv_files:
+        # Header reads are IO-bound, so overlap them; map keeps the sorted order
+        with ThreadPoolExecutor(max_workers=min(32, len(csv_files))) as executor:
+            previews = list(executor.map(_peek_header, csv_files))
+
+        file_details = [
+            f"  - File:     {name}\n"
+            f"    Modified: {mtime}\n"
+            f"    Header:   {header_preview}"
+            for name, mtime, header_preview in previews
+        ]
 
         files_formatted = "\n\n".join(file_details)
         logger.info(f"Found {len(csv_files)} CSV files to process:\n{files_formatted}")
@@ -158,6 +203,9 @@ def run_update(csv_importer: CSVImporter) -> None:
 def main() -> None:
     args = parse_args()
 
+    if args.quiet:
+        logger.setLevel(logging.WARNING)
+
     try:
         if args.update:
             logger.info("Initialising CSV importer (Update Mode)...")
@@ -176,7 +224,7 @@ def main() -> None:
 
         # Only prompt for truncation in import mode (not update mode)
         if not args.update:
-            if not prompt_truncation(db_manager):
+            if not prompt_truncation(db_manager, args.truncate):
                 sys.exit(1)
 
         csv_importer: CSVImporter = CSVImporter(config, db_manager)
@@ -10,8 +10,10 @@ Can be run standalone or called from nobbie_daemon.py
 from __future__ import annotations
 import csv
 import logging
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +22,7 @@ from typing import Dict, List, Optional, Tuple, Any
 import paramiko
 
 from common import ConfigLoader, LoggerManager, DatabaseConnectionManager
+from common.database import NEW_TIP_CHANNEL
 
 # Try to import shared object types module, fall back to inline if not available
 try:
@@ -249,16 +252,65 @@ def download_file(sftp: paramiko.SFTPClient, remote_filename: str,
                   local_path: Path) -> Path:
     """Download single file from SFTP to local path"""
     local_file = local_path / remote_filename
+    # Written under a temporary name so a partial download is never picked up
+    part_file = local_path / f"{remote_filename}.part"
     
     try:
-        sftp.get(remote_filename, str(local_file))
+        sftp.get(remote_filename, str(part_file))
+        os.replace(part_file, local_file)
         logger.debug(f"Downloaded: {remote_filename}")
         return local_file
         
     except Exception as e:
+        part_file.unlink(missing_ok=True)
         raise SFTPDownloaderError(f"Failed to download {remote_filename}: {e}")
 
 
+def download_files(ssh_client: paramiko.SSHClient, remote_dir: str, filenames: List[str],
+                   local_path: Path, max_workers: int) -> Dict[str, Path]:
+    """
+    Download files concurrently, one SFTP channel per worker on the open SSH transport
+    
+    Files that fail to download are left out of the result; process_single_file
+    downloads those again over the main connection.
+    
+    Returns dict of remote filename -> local path
+    """
+    if not filenames:
+        return {}
+    
+    transport = ssh_client.get_transport()
+    workers = max(1, min(max_workers, len(filenames)))
+    batches = [filenames[i::workers] for i in range(workers)]
+    
+    def download_batch(batch: List[str]) -> Dict[str, Path]:
+        downloaded: Dict[str, Path] = {}
+        try:
+            sftp = paramiko.SFTPClient.from_transport(transport)
+        except Exception as e:
+            logger.warning(f"Could not open SFTP channel for {len(batch)} files: {e}")
+            return downloaded
+        
+        try:
+            sftp.chdir(remote_dir)
+            for filename in batch:
+                try:
+                    downloaded[filename] = download_file(sftp, filename, local_path)
+                except SFTPDownloaderError as e:
+                    logger.warning(f"{e} (will retry when processing)")
+        finally:
+            sftp.close()
+        return downloaded
+    
+    results: Dict[str, Path] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for downloaded in executor.map(download_batch, batches):
+            results.update(downloaded)
+    
+    logger.info(f"Downloaded {len(results)} of {len(filenames)} files using {workers} channels")
+    return results
+
+
 def detect_object_type(csv_path: Path) -> Tuple[str, Dict[str, str]]:
     """
     Detect object type by examining CSV headers
@@ -626,11 +678,15 @@ def process_single_file(
     db_manager: Optional[DatabaseConnectionManager],
     sftp_logger: SFTPLoggerManager,
     config: ConfigParser,
-    files_to_delete: List[str]
+    files_to_delete: List[str],
+    downloaded_file: Optional[Path] = None
 ) -> Dict[str, Any]:
     """
     Process a single CSV file from SFTP
     
+    downloaded_file is the local copy if it was already fetched by
+    download_files; otherwise the file is downloaded here.
+    
     Returns dict with processing results
     """
     result = {
@@ -646,7 +702,7 @@ def process_single_file(
     local_file = None
     
     try:
-        local_file = download_file(sftp, remote_filename, paths['incoming'])
+        local_file = downloaded_file or download_file(sftp, remote_filename, paths['incoming'])
         
         try:
             api_id_field, object_meta = detect_object_type(local_file)
@@ -768,12 +824,20 @@ def run_sftp_download(
         
         files_to_delete: List[str] = []
         
+        # Fetch the files over parallel channels, then process them in FIFO order
+        download_workers = sftp_config.getint('sftp', 'download_workers', fallback=4)
+        downloaded = download_files(
+            ssh_client, remote_dir, [filename for filename, _ in csv_files],
+            paths['incoming'], download_workers
+        )
+        
         for filename, mtime in csv_files:
             logger.info(f"Processing: {filename}")
             
             result = process_single_file(
                 sftp_client, filename, paths, db_manager,
-                sftp_logger, sftp_config, files_to_delete
+                sftp_logger, sftp_config, files_to_delete,
+                downloaded_file=downloaded.get(filename)
             )
             
             summary['files_processed'] += 1
@@ -788,6 +852,13 @@ def run_sftp_download(
         deleted_count = execute_remote_deletions(sftp_client, files_to_delete)
         summary['files_deleted_from_sftp'] = deleted_count
         
+        # Wake a listening nobbie_daemon so the new TIPs are processed straight away
+        if summary['total_inserted'] > 0:
+            try:
+                db_manager.notify(NEW_TIP_CHANNEL, str(summary['total_inserted']))
+            except Exception as e:
+                logger.warning(f"Could not send {NEW_TIP_CHANNEL} notification: {e}")
+        
         summary['status'] = 'success'
         summary['end_time'] = datetime.now().isoformat()
         
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import re
+from typing import Any, Dict, List, Tuple
+
+from processors.base_processor import sanitise_filename, flatten_json, check_attachment_size
+
+
+def reference_sanitise_filename(text: str) -> str:
+    """Regex implementation sanitise_filename replaced"""
+    if not text:
+        return "unknown"
+    sanitised: str = re.sub(r'[<>:"/\\|?*]', '_', str(text))
+    sanitised = re.sub(r'[\t\r\n]+', ' ', sanitised)
+    sanitised = re.sub(r'\s+', ' ', sanitised)
+    sanitised = sanitised.strip('_ ')
+    return sanitised[:100] if sanitised else "unknown"
+
+
+def reference_flatten_json(nested_json: Any, parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
+    """Recursive implementation flatten_json replaced"""
+    items: List[Tuple[str, Any]] = []
+    if isinstance(nested_json, dict):
+        for k, v in nested_json.items():
+            new_key: str = f"{parent_key}{sep}{k}" if parent_key else k
+            items.extend(reference_flatten_json(v, new_key, sep).items())
+    elif isinstance(nested_json, list):
+        for i, v in enumerate(nested_json):
+            new_key = f"{parent_key}{sep}{i}" if parent_key else str(i)
+            items.extend(reference_flatten_json(v, new_key, sep).items())
+    else:
+        items.append((parent_key, nested_json))
+    return dict(items)
+
+
+FILENAME_CASES: List[Any] = [
+    '', None, 'TA - 00014', 'LCD - 001/2024', 'a<b>c:d"e/f\\g|h?i*j',
+    '  leading and trailing  ', '__under__', '_ _ mixed _ _', 'tabs\tand\nnewlines\r\nhere',
+    'many     spaces', 'form\x0cfeed and\x0bvtab', 'non breaking space',
+    '***', '   ', 'x' * 150, 'Site: Depot / Yard ' * 10, 12345,
+]
+
+
+def test_sanitise_filename_matches_regex_version() -> None:
+    for text in FILENAME_CASES:
+        assert sanitise_filename(text) == reference_sanitise_filename(text), repr(text)
+
+
+def test_sanitise_filename_examples() -> None:
+    assert sanitise_filename('TA - 00014') == 'TA - 00014'
+    assert sanitise_filename('a/b\tc') == 'a_b c'
+    assert sanitise_filename('***') == 'unknown'
+    assert len(sanitise_filename('x' * 150)) == 100
+
+
+def test_flatten_json_matches_recursive_version() -> None:
+    payload: Dict[str, Any] = {
+        'tip': 'abc',
+        'meta': {'created': '2024-01-01', 'owner': {'name': 'Ann', 'teams': ['t1', 't2']}},
+        'attachments': [{'url': 'u1', 'size': 1}, {'url': 'u2', 'size': None}],
+        'empty': {},
+        'none': [],
+        'z': 0,
+    }
+
+    flattened = flatten_json(payload)
+    expected = reference_flatten_json(payload)
+
+    assert flattened == expected
+    assert list(flattened) == list(expected)
+    assert list(flattened)[:4] == ['tip', 'meta_created', 'meta_owner_name', 'meta_owner_teams_0']
+    assert flatten_json(payload, sep='.') == reference_flatten_json(payload, sep='.')
+    assert flatten_json(['a', {'b': 1}]) == {'0': 'a', '1_b': 1}
+    assert flatten_json('scalar', 'key') == {'key': 'scalar'}
+
+
+def test_flatten_json_handles_deep_nesting() -> None:
+    deep: Any = 'leaf'
+    for _ in range(5000):
+        deep = {'n': deep}
+
+    flattened = flatten_json(deep)
+
+    assert list(flattened.values()) == ['leaf']
+    assert next(iter(flattened)).count('n') == 5000
+
+
+def test_check_attachment_size() -> None:
+    assert check_attachment_size(0) == "File appears empty"
+    assert check_attachment_size(10) == "File too small (10 bytes)"
+    assert check_attachment_size(1024) is None
+    assert check_attachment_size(0, expected_min_size=0) == "File appears empty"
+    assert check_attachment_size(1, expected_min_size=0) is None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Sequence
+
+import psycopg2
+import psycopg2.extras
+import pytest
+
+from common.database import CSVRecordStream, DatabaseConnectionManager
+
+BAD: str = 'bad'
+
+
+class FakeCursor:
+    """Records the statements run on it"""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+        self.rowcount: int = 0
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.statements.append(sql)
+
+
+def fake_execute_values(cur: FakeCursor, query: str, page: Sequence[Sequence[Any]],
+                        template: Any = None, page_size: int = 100) -> None:
+    """Stands in for psycopg2.extras.execute_values; fails any page containing BAD"""
+    if any(BAD in record for record in page):
+        raise psycopg2.Error(f"bad record in page of {len(page)}")
+    cur.statements.append(f"VALUES x{len(page)}")
+    cur.rowcount = len(page)
+
+
+@pytest.fixture
+def batching(monkeypatch: pytest.MonkeyPatch) -> tuple[DatabaseConnectionManager, FakeCursor]:
+    """A DatabaseConnectionManager (no pool) whose get_cursor yields one FakeCursor"""
+    cursor = FakeCursor()
+    db_manager = object.__new__(DatabaseConnectionManager)
+
+    @contextmanager
+    def get_cursor(cursor_factory: Any = None) -> Iterator[FakeCursor]:
+        yield cursor
+
+    monkeypatch.setattr(db_manager, 'get_cursor', get_cursor, raising=False)
+    monkeypatch.setattr(psycopg2.extras, 'execute_values', fake_execute_values)
+    return db_manager, cursor
+
+
+def read_all(stream: CSVRecordStream, size: int = -1) -> str:
+    chunks = []
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return ''.join(chunks)
+        chunks.append(chunk)
+
+
+def test_csv_record_stream_keeps_empty_string_distinct_from_null() -> None:
+    stream = CSVRecordStream([('a', None, ''), ('x"y', '1,2', 3)])
+
+    assert read_all(stream) == '"a",,""\n"x""y","1,2","3"\n'
+
+
+def test_csv_record_stream_returns_whole_rows_per_read() -> None:
+    records = [(str(i), 'line\nbreak', None) for i in range(50)]
+    stream = CSVRecordStream(records)
+
+    first = stream.read(10)
+    assert first == '"0","line\nbreak",\n'
+    assert first + read_all(stream, 64) == read_all(CSVRecordStream(records))
+
+
+def test_execute_values_batch_sends_pages(batching) -> None:
+    db_manager, cursor = batching
+    records = [(str(i),) for i in range(12)]
+
+    affected = db_manager.execute_values_batch("INSERT INTO t VALUES %s", records, page_size=5)
+
+    assert affected == 12
+    assert [s for s in cursor.statements if s.startswith('VALUES')] == ['VALUES x5', 'VALUES x5', 'VALUES x2']
+    assert cursor.statements.count("SAVEPOINT values_page") == 3
+    assert "ROLLBACK TO SAVEPOINT values_page" not in cursor.statements
+
+
+def test_execute_values_batch_falls_back_row_by_row(batching) -> None:
+    db_manager, cursor = batching
+    records = [('1',), ('2',), (BAD,), ('4',), ('5',), ('6',)]
+    skipped: List[Sequence[Any]] = []
+
+    affected = db_manager.execute_values_batch(
+        "INSERT INTO t VALUES %s", records, page_size=3,
+        synchronous_commit=False, skipped=skipped
+    )
+
+    assert affected == 5
+    assert skipped == [(BAD,)]
+    assert cursor.statements[0] == "SET LOCAL synchronous_commit TO OFF"
+    assert cursor.statements.count("ROLLBACK TO SAVEPOINT values_page") == 1
+    assert cursor.statements.count("ROLLBACK TO SAVEPOINT values_row") == 1
+    assert cursor.statements.count("RELEASE SAVEPOINT values_row") == 2
+    # The second page is unaffected and still goes as one statement
+    assert cursor.statements[-2:] == ['VALUES x3', "RELEASE SAVEPOINT values_page"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from nobbie_hashes import _simple_table
+
+
+def test_simple_table_aligns_columns() -> None:
+    rows = [('vehicle', 12, 'Truck 1'), ('uhf', 3, 'Radio'), ('trailer', 1250, 'Dolly')]
+
+    assert _simple_table(rows, ['Type', 'Count', 'Name']).split('\n') == [
+        'Type     Count  Name',
+        '-------  -----  -------',
+        'vehicle     12  Truck 1',
+        'uhf          3  Radio',
+        'trailer   1250  Dolly',
+    ]
+
+
+def test_simple_table_mixed_column_is_left_aligned() -> None:
+    rows = [('a', 1), ('b', 'n/a')]
+
+    assert _simple_table(rows, ['Key', 'Value']).split('\n') == [
+        'Key  Value',
+        '---  -----',
+        'a    1',
+        'b    n/a',
+    ]
+
+
+def test_simple_table_without_rows() -> None:
+    assert _simple_table([], ['Type', 'Count']) == 'Type  Count\n----  -----'
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from nobbie_process import plan_batches
+
+
+def test_plan_batches_skips_idle_types_and_orders_busiest_first() -> None:
+    plan = plan_batches({'LCD': 400, 'CCC': 0, 'FPI': 30, 'SO': 70}, batch_size=10)
+
+    assert list(plan) == ['LCD', 'SO', 'FPI']
+    assert 'CCC' not in plan
+
+
+def test_plan_batches_sizes_by_share_of_backlog() -> None:
+    plan = plan_batches({'LCD': 400, 'FPI': 30, 'SO': 70}, batch_size=10)
+
+    # Budget is 10 x 3 busy types = 30, split by share of the 500 backlog
+    assert plan == {'LCD': 24, 'SO': 10, 'FPI': 10}
+
+
+def test_plan_batches_floor_and_cap() -> None:
+    plan = plan_batches({'LCD': 5, 'CCC': 1000}, batch_size=10)
+
+    # Every busy type gets at least batch_size; no fetch exceeds the 2 x 10 budget
+    assert plan['LCD'] == 10
+    assert plan['CCC'] == 19
+    assert all(10 <= size <= 20 for size in plan.values())
+
+
+def test_plan_batches_single_type_and_empty() -> None:
+    assert plan_batches({'LCD': 3}, batch_size=10) == {'LCD': 10}
+    assert plan_batches({'LCD': 0}, batch_size=10) == {}
+    assert plan_batches({}, batch_size=10) == {}
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from configparser import ConfigParser
+from pathlib import Path
+
+import pandas as pd
+
+from nobbie_sync import (
+    HASH_LOOKUP_COLUMNS,
+    process_assets,
+    process_sites,
+    determine_asset_lookup_type,
+    determine_site_lookup_type,
+    format_site_resolved_value,
+    format_source_type,
+    detect_file_type,
+    compute_file_signature,
+    is_export_unchanged,
+    record_export_signature,
+    clear_export_signature,
+)
+
+ASSETS: pd.DataFrame = pd.DataFrame({
+    'nogginId': ['a1', None, ' a3 ', 'a4', 'a5'],
+    'assetName': ['Truck 1', 'Ghost', None, ' Trailer 4 ', 'Radio'],
+    'assetType': ['PRIME MOVER', 'TRAILER', 'rigid', 'DROPDECK', 'SPACESHIP'],
+})
+
+SITES: pd.DataFrame = pd.DataFrame({
+    'nogginId': ['s1', 's2', None, 's4', 's5'],
+    'siteName': ['Depot', None, 'Nowhere', 'Head Office', 'Reporting'],
+    'goldstarId': ['GS01', 'GS02', 'GS03', None, 'GS05'],
+    'siteType': ['Team', 'Team', 'Team', 'Business Unit', 'Virtual (for reporting)'],
+})
+
+
+def site_config(prefix_with_id: bool) -> ConfigParser:
+    config = ConfigParser()
+    config['csv_import'] = {'prefix_site_with_goldstar_id': str(prefix_with_id).lower()}
+    return config
+
+
+def reference_assets(df: pd.DataFrame) -> list[tuple[str, str, str, str]]:
+    """Row-by-row asset rules (as before process_assets was vectorised)"""
+    records = []
+    for _, row in df.iterrows():
+        tip_hash, name, asset_type = row['nogginId'], row['assetName'], row['assetType']
+        if not tip_hash or pd.isna(tip_hash):
+            continue
+        name = 'Unknown' if not name or pd.isna(name) else name
+        records.append((str(tip_hash).strip(), determine_asset_lookup_type(asset_type),
+                        str(name).strip(), format_source_type(asset_type)))
+    return records
+
+
+def reference_sites(df: pd.DataFrame, config: ConfigParser) -> list[tuple[str, str, str, str]]:
+    """Row-by-row site rules (as before process_sites was vectorised)"""
+    records = []
+    for _, row in df.iterrows():
+        tip_hash, name = row['nogginId'], row['siteName']
+        if not tip_hash or pd.isna(tip_hash) or not name or pd.isna(name):
+            continue
+        records.append((str(tip_hash).strip(),
+                        determine_site_lookup_type(name, row['siteType']),
+                        format_site_resolved_value(row['goldstarId'], name, config),
+                        format_source_type(row['siteType'])))
+    return records
+
+
+def as_tuples(records: pd.DataFrame) -> list[tuple[str, str, str, str]]:
+    assert list(records.columns) == list(HASH_LOOKUP_COLUMNS)
+    return list(records.itertuples(index=False, name=None))
+
+
+def test_process_assets_matches_row_rules() -> None:
+    records = as_tuples(process_assets(ASSETS))
+
+    assert records == reference_assets(ASSETS)
+    assert records[0] == ('a1', 'vehicle', 'Truck 1', 'PrimeMover')
+    assert records[1][2] == 'Unknown'
+    assert records[-1][1] == 'unknown'
+
+
+def test_process_sites_matches_row_rules() -> None:
+    for prefix_with_id in (True, False):
+        config = site_config(prefix_with_id)
+        records = as_tuples(process_sites(SITES, config))
+
+        assert records == reference_sites(SITES, config)
+
+    records = as_tuples(process_sites(SITES, site_config(True)))
+    assert [r[0] for r in records] == ['s1', 's4', 's5']
+    assert records[0][2] == 'GS01 - Depot'
+    assert records[1][2] == 'Head Office'
+    assert [r[1] for r in records] == ['team', 'department', 'department']
+
+
+def test_detect_file_type_trusts_header_over_filename(tmp_path: Path) -> None:
+    site_export = tmp_path / 'website_assets.csv'
+    site_export.write_text('nogginId,siteName,goldstarId,siteType\n', encoding='utf-8')
+    unnamed_asset_export = tmp_path / 'exported-file-1.csv'
+    unnamed_asset_export.write_text('\ufeffnogginId,assetName,assetType\n', encoding='utf-8')
+    named_export = tmp_path / 'noggin_sites.csv'
+    named_export.write_text('nogginId,name\n', encoding='utf-8')
+
+    assert detect_file_type(site_export) == 'site'
+    assert detect_file_type(unnamed_asset_export) == 'asset'
+    assert detect_file_type(named_export) == 'site'
+    assert detect_file_type(tmp_path / 'missing.csv') is None
+
+
+def test_export_signature_guard(tmp_path: Path) -> None:
+    export = tmp_path / 'assets.csv'
+    export.write_text('nogginId,assetName,assetType\na1,Truck 1,RIGID\n', encoding='utf-8')
+    processed = tmp_path / 'processed'
+    signature = compute_file_signature(export)
+
+    assert signature == compute_file_signature(export)
+    assert not is_export_unchanged('asset', signature, processed)
+
+    record_export_signature('asset', signature, processed)
+    assert is_export_unchanged('asset', signature, processed)
+    assert not is_export_unchanged('site', signature, processed)
+    assert not list(processed.glob('*.tmp'))
+
+    export.write_text('nogginId,assetName,assetType\na1,Truck 2,RIGID\n', encoding='utf-8')
+    assert not is_export_unchanged('asset', compute_file_signature(export), processed)
+
+    clear_export_signature('asset', processed)
+    assert not is_export_unchanged('asset', signature, processed)